@@ -0,0 +1,92 @@
+"""Responsiveness of the event loop while translating: the largest delay of a
+heartbeat task scheduled every millisecond, when the expressions are
+translated by `translate` inside a coroutine or by `atranslate_many`
+
+Usage:
+  python benchmarks/aio.py [--size=N] [--workers=N]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.translator import ASCIIMath2Tex  # noqa: E402
+
+EXP = "sum_(i=1)^{} i^3=((n(n+1))/2)^2"
+
+
+async def heartbeat(lags, stop):
+    while not stop:
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def measure(translate):
+    lags = []
+    stop = []
+    beat = asyncio.ensure_future(heartbeat(lags, stop))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await translate()
+    elapsed = time.perf_counter() - start
+    stop.append(True)
+    await beat
+    return elapsed, max(lags)
+
+
+def main(size=2000, workers=2):
+    logging.disable(logging.WARNING)
+    translator = ASCIIMath2Tex()
+    exps = [EXP.format(i) for i in range(size)]
+
+    async def blocking():
+        for exp in exps:
+            translator.translate(exp)
+
+    async def threads():
+        await translator.atranslate_many(exps)
+
+    loop = asyncio.new_event_loop()
+    print("{:>22}{:>14}{:>20}".format("mode", "exps/s", "max loop lag (ms)"))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+
+            async def processes():
+                await translator.atranslate_many(
+                    exps, executor=executor, max_concurrency=4 * workers
+                )
+
+            # Start the worker processes before measuring
+            loop.run_until_complete(
+                translator.atranslate("x", executor=executor)
+            )
+            for name, translate in [
+                ("translate", blocking),
+                ("atranslate (threads)", threads),
+                ("atranslate (processes)", processes),
+            ]:
+                elapsed, lag = loop.run_until_complete(measure(translate))
+                print(
+                    "{:>22}{:>14.0f}{:>20.1f}".format(
+                        name, size / elapsed, lag * 1e3
+                    )
+                )
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    size = 2000
+    workers = 2
+    for arg in sys.argv[1:]:
+        if arg.startswith("--size="):
+            size = int(arg.split("=", 1)[1])
+        elif arg.startswith("--workers="):
+            workers = int(arg.split("=", 1)[1])
+    main(size, workers)
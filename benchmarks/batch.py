@@ -0,0 +1,80 @@
+"""Batch benchmark: time per expression of a shell loop, running the command
+line interface once per expression, vs a single --batch run
+
+Usage:
+  python benchmarks/batch.py [--loop=N] [--size=N] [--jobs=N]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+EXPS = [
+    "sum_(i=1)^n i^3=((n(n+1))/2)^2",
+    "e^x > 0 forall x in RR",
+    "int_0^1 f(x) dx",
+    "[[a,b],[c,d]]",
+    "lim_(x->oo) (1+1/x)^x = e",
+]
+
+
+def cli(*args, stdin=None):
+    subprocess.run(
+        [sys.executable, "-m", "py_asciimath"] + list(args),
+        input=stdin,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        universal_newlines=True,
+        cwd=ROOT,
+        check=True,
+    )
+
+
+def main(loop=20, size=5000, jobs=None):
+    print(
+        "{:<28}{:>14}{:>12}{:>16}".format(
+            "", "expressions", "time (s)", "ms/expression"
+        )
+    )
+    for olang in ("latex", "mathml"):
+        start = time.perf_counter()
+        for i in range(loop):
+            cli(EXPS[i % len(EXPS)], "from", "asciimath", "to", olang)
+        elapsed = time.perf_counter() - start
+        print(
+            "{:<28}{:>14}{:>12.2f}{:>16.2f}".format(
+                "loop to " + olang, loop, elapsed, elapsed / loop * 1e3
+            )
+        )
+        # Distinct expressions, so that nothing is memoized
+        stdin = "".join(
+            EXPS[i % len(EXPS)] + " + " + str(i) + "\n" for i in range(size)
+        )
+        args = ["--batch", "-", "from", "asciimath", "to", olang]
+        if jobs is not None:
+            args.append("--jobs=" + str(jobs))
+        start = time.perf_counter()
+        cli(*args, stdin=stdin)
+        elapsed = time.perf_counter() - start
+        print(
+            "{:<28}{:>14}{:>12.2f}{:>16.2f}".format(
+                "--batch to " + olang, size, elapsed, elapsed / size * 1e3
+            )
+        )
+
+
+if __name__ == "__main__":
+    loop = 20
+    size = 5000
+    jobs = None
+    for arg in sys.argv[1:]:
+        if arg.startswith("--loop="):
+            loop = int(arg.split("=", 1)[1])
+        elif arg.startswith("--size="):
+            size = int(arg.split("=", 1)[1])
+        elif arg.startswith("--jobs="):
+            jobs = int(arg.split("=", 1)[1])
+    main(loop, size, jobs)
@@ -0,0 +1,77 @@
+"""Document benchmark: translation time and peak memory of Markdown documents
+with embedded ASCIIMath, streamed from a file. The peak memory should not
+grow with the size of the document
+
+Usage:
+  python benchmarks/document.py [--jobs=N] [--size=N]
+"""
+
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.document import (  # noqa: E402
+    DocumentTranslator,
+)
+from py_asciimath.translator.translator import ASCIIMath2Tex  # noqa: E402
+
+PARAGRAPH = (
+    "The sum `sum_(i=1)^n i^3=((n(n+1))/2)^2` holds for every `n in NN`,\n"
+    "while `e^x > 0` for every `x in RR`: see `int_0^1 f(x) dx`.\n\n"
+)
+
+
+def main(jobs=None, size=8000):
+    logging.disable(logging.WARNING)
+    sizes = [size // 8, size // 4, size // 2, size]
+    document = DocumentTranslator(ASCIIMath2Tex())
+    tmp = tempfile.mkdtemp()
+    print(
+        "{:>12}{:>12}{:>12}{:>14}{:>18}".format(
+            "paragraphs", "MB", "time (s)", "spans/s", "peak memory (KB)"
+        )
+    )
+    try:
+        for n in sizes:
+            src = os.path.join(tmp, "doc.md")
+            with open(src, "w") as f:
+                for _ in range(n):
+                    f.write(PARAGRAPH)
+            start = time.perf_counter()
+            with open(src) as f, open(os.devnull, "w") as dst:
+                spans = document.translate_stream(f, dst, workers=jobs)
+            elapsed = time.perf_counter() - start
+            # Memory is traced in a second run, since tracing is slow
+            tracemalloc.start()
+            with open(src) as f, open(os.devnull, "w") as dst:
+                document.translate_stream(f, dst, workers=jobs)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                "{:>12}{:>12.2f}{:>12.2f}{:>14.0f}{:>18.0f}".format(
+                    n,
+                    os.path.getsize(src) / 1e6,
+                    elapsed,
+                    spans / elapsed,
+                    peak / 1e3,
+                )
+            )
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    jobs = None
+    size = 8000
+    for arg in sys.argv[1:]:
+        if arg.startswith("--jobs="):
+            jobs = int(arg.split("=", 1)[1])
+        elif arg.startswith("--size="):
+            size = int(arg.split("=", 1)[1])
+    main(jobs, size)
@@ -0,0 +1,73 @@
+"""Parser engine benchmark: translations per second of typical short
+formulas with the lark LALR parser, with its contextual lexer and with the
+trie lexer, and with the recursive descent parser of `engine="fast"`
+
+Usage:
+  python benchmarks/engine.py [--number=N] [--repeat=N]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.translator import (  # noqa: E402
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+)
+
+FORMULAS = [
+    "x^2",
+    "sum_(i=1)^n i^3=((n(n+1))/2)^2",
+    "sqrt(a^2+b^2)",
+    "int_0^1 f(x) dx",
+    "[[a,b],[c,d]]",
+    "e^(i pi)+1=0",
+    "lim_(x->oo) (1+1/x)^x",
+    'f(x) = {(x, "if" x >= 0), (-x, "otherwise"):}',
+]
+ENGINES = [
+    ("lark", {}),
+    ("lark + trie", {"lexer": "trie"}),
+    ("fast", {"engine": "fast"}),
+]
+TRANSLATORS = [
+    ("ASCIIMath2Tex", ASCIIMath2Tex, {}),
+    ("ASCIIMath2MathML", ASCIIMath2MathML, {"xml_pprint": False}),
+]
+
+
+def main(number=200, repeat=5):
+    print("Translations per second")
+    print(
+        "{:<20}".format("translator")
+        + "".join("{:>14}".format(name) for name, _ in ENGINES)
+    )
+    for name, cls, kwargs in TRANSLATORS:
+        rates = []
+        for _, options in ENGINES:
+            translator = cls(**options)
+
+            def run():
+                for exp in FORMULAS:
+                    translator.translate(exp, **kwargs)
+
+            run()
+            best = min(timeit.repeat(run, number=number, repeat=repeat))
+            rates.append(number * len(FORMULAS) / best)
+        print(
+            "{:<20}".format(name)
+            + "".join("{:>14.0f}".format(rate) for rate in rates)
+        )
+
+
+if __name__ == "__main__":
+    number = 200
+    repeat = 5
+    for arg in sys.argv[1:]:
+        if arg.startswith("--number="):
+            number = int(arg.split("=", 1)[1])
+        elif arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+    main(number, repeat)
@@ -0,0 +1,88 @@
+"""HTML benchmark: translation time and peak memory of HTML documents with
+ASCIIMath math nodes, streamed from a file. The whole document is wrapped in
+a single element, and the peak memory should not grow with its size
+
+Usage:
+  python benchmarks/html.py [--mathml] [--size=N]
+"""
+
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.document import HTMLTranslator  # noqa: E402
+from py_asciimath.translator.translator import (  # noqa: E402
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+)
+
+PARAGRAPH = (
+    '<p>The sum <span class="math">sum_(i=1)^{} i^3=((n(n+1))/2)^2</span> '
+    'holds for every <script type="math/asciimath">n in NN</script>, while '
+    '<span class="math">e^x &gt; 0</span> for every <em>x</em> in '
+    '<span class="math">RR</span>.</p>\n'
+)
+
+
+def main(mathml=False, size=8000):
+    logging.disable(logging.WARNING)
+    sizes = [size // 8, size // 4, size // 2, size]
+    if mathml:
+        html = HTMLTranslator(ASCIIMath2MathML())
+        kwargs = {"xml_pprint": False}
+    else:
+        html = HTMLTranslator(ASCIIMath2Tex())
+        kwargs = {}
+    tmp = tempfile.mkdtemp()
+    print(
+        "{:>12}{:>12}{:>12}{:>14}{:>18}".format(
+            "paragraphs", "MB", "time (s)", "nodes/s", "peak memory (KB)"
+        )
+    )
+    try:
+        for n in sizes:
+            src = os.path.join(tmp, "doc.html")
+            with open(src, "w") as f:
+                f.write("<!DOCTYPE html>\n<html><body><div>\n")
+                for i in range(n):
+                    # 100 distinct formulas, translated once each
+                    f.write(PARAGRAPH.format(i % 100))
+                f.write("</div></body></html>\n")
+            start = time.perf_counter()
+            with open(os.devnull, "w") as dst:
+                nodes = html.translate_stream(src, dst, **kwargs)
+            elapsed = time.perf_counter() - start
+            # Memory is traced in a second run, since tracing is slow
+            tracemalloc.start()
+            with open(os.devnull, "w") as dst:
+                html.translate_stream(src, dst, **kwargs)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                "{:>12}{:>12.2f}{:>12.2f}{:>14.0f}{:>18.0f}".format(
+                    n,
+                    os.path.getsize(src) / 1e6,
+                    elapsed,
+                    nodes / elapsed,
+                    peak / 1e3,
+                )
+            )
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    mathml = False
+    size = 8000
+    for arg in sys.argv[1:]:
+        if arg == "--mathml":
+            mathml = True
+        elif arg.startswith("--size="):
+            size = int(arg.split("=", 1)[1])
+    main(mathml, size)
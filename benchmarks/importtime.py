@@ -0,0 +1,81 @@
+"""Import time benchmark: the time spent importing the library and command
+line entry points, measured by `python -X importtime` in a new interpreter,
+and the heavy dependencies that every entry point loads
+
+Usage:
+  python benchmarks/importtime.py [--repeat=N]
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+ENTRY_POINTS = [
+    ("library", "import py_asciimath.translator.translator"),
+    ("documents", "import py_asciimath.translator.document"),
+    ("command line", "import py_asciimath.py_asciimath"),
+    (
+        "ASCIIMath2Tex()",
+        "from py_asciimath.translator.translator import ASCIIMath2Tex\n"
+        "ASCIIMath2Tex()",
+    ),
+    (
+        "ASCIIMath2MathML()",
+        "from py_asciimath.translator.translator import ASCIIMath2MathML\n"
+        "ASCIIMath2MathML()",
+    ),
+]
+DEPENDENCIES = ["lark", "lxml", "asyncio", "http", "concurrent"]
+
+
+def run(code):
+    # Cumulative import time in ms of the modules imported by `code`, and
+    # the heavy dependencies loaded
+    code = (
+        code + "\nimport sys\n"
+        "print(' '.join(sorted(set(m.split('.')[0] for m in sys.modules))))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    total = 0
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.split("|")
+        # Top-level imports only, to not count a module twice
+        if fields[2].startswith(" ") and not fields[2].startswith("  "):
+            if fields[1].strip().isdigit():
+                total = total + int(fields[1])
+    modules = set(out.stdout.split())
+    return total / 1e3, [d for d in DEPENDENCIES if d in modules]
+
+
+def main(repeat=5):
+    # Modules imported by the interpreter at startup
+    startup = min(run("pass")[0] for _ in range(repeat))
+    print("{:<20}{:>12}  {}".format("entry point", "import (ms)", "loads"))
+    for name, code in ENTRY_POINTS:
+        results = [run(code) for _ in range(repeat)]
+        print(
+            "{:<20}{:>12.1f}  {}".format(
+                name,
+                min(r[0] for r in results) - startup,
+                ", ".join(results[0][1]) or "-",
+            )
+        )
+
+
+if __name__ == "__main__":
+    repeat = 5
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+    main(repeat)
@@ -0,0 +1,135 @@
+"""Lexer benchmark: parsing time of the ASCIIMath and LaTeX grammars with
+the lark contextual lexer and with the trie lexers, as the length of the
+input grows, and lexing time of a grammar made of N symbols, as the number
+of symbols grows
+
+Usage:
+  python benchmarks/lexer.py [--size=N] [--repeat=N]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.grammar.cache import get_parser  # noqa: E402
+from py_asciimath.grammar.lexer import LatexLexer, TrieLexer  # noqa: E402
+from py_asciimath.translation.tables import (  # noqa: E402
+    asciimath2latex,
+    asciimath_grammar,
+    latex2asciimath,
+    latex_grammar,
+)
+
+LEXERS = [("contextual", "contextual"), ("trie", TrieLexer)]
+LATEX_LEXERS = [("contextual", "contextual"), ("trie", LatexLexer)]
+
+
+def best(f, repeat):
+    return min(timeit.repeat(f, number=1, repeat=repeat))
+
+
+def expression(size):
+    # A sum of `size` terms using symbols of every length
+    rnd = random.Random(size)
+    smb = [s for s in asciimath2latex["smb"] if s.isalpha()]
+    return " + ".join(
+        "sqrt(x_{}^2) {} frac{{a}}{{b}}".format(i, rnd.choice(smb))
+        for i in range(size)
+    )
+
+
+def latex_expression(size):
+    # A sum of `size` terms using commands of every length
+    rnd = random.Random(size)
+    smb = [s for s in latex2asciimath["smb"] if s[1:].isalpha()]
+    return " + ".join(
+        "\\sqrt{{x_{{{}}}^{{2}}}} {} \\frac{{a}}{{b}}".format(
+            i, rnd.choice(smb)
+        )
+        for i in range(size)
+    )
+
+
+def parsing_times(grammar, lexers, expression, size, repeat):
+    parsers = [
+        get_parser(grammar, lexer=lexer, parser="lalr") for _, lexer in lexers
+    ]
+    print(
+        "{:>10}".format("chars")
+        + "".join("{:>14}".format(name) for name, _ in lexers)
+    )
+    for n in (size // 20, size // 4, size):
+        text = expression(max(n, 1))
+        print(
+            "{:>10}".format(len(text))
+            + "".join(
+                "{:>14.2f}".format(
+                    best(lambda: p.parse(text), repeat) / len(text) * 1e6
+                )
+                for p in parsers
+            )
+        )
+
+
+def symbols_grammar(n):
+    # A grammar of `n` symbols, numbers and letters
+    rnd = random.Random(n)
+    symbols = set()
+    while len(symbols) < n:
+        symbols.add(
+            "\\"
+            + "".join(
+                rnd.choice("abcdefghijklmnopqrstuvwxyz")
+                for _ in range(rnd.randint(2, 10))
+            )
+        )
+    symbols = sorted(symbols)
+    grammar = (
+        "start: atom*\n"
+        "atom: NUMBER | LETTER | "
+        + " | ".join('"{}"'.format(s.replace("\\", "\\\\")) for s in symbols)
+        + "\n%import common.NUMBER\n%import common.LETTER\n"
+        "%import common.WS\n%ignore WS\n"
+    )
+    text = " ".join(rnd.choice(symbols) + " x 12" for _ in range(2000))
+    return grammar, text
+
+
+def main(size=200, repeat=5):
+    print("ASCIIMath grammar: parsing time per character (us)")
+    parsing_times(asciimath_grammar, LEXERS, expression, size, repeat)
+    print()
+    print("LaTeX grammar: parsing time per character (us)")
+    parsing_times(latex_grammar, LATEX_LEXERS, latex_expression, size, repeat)
+    print()
+    print("N symbols: lexing and parsing time per character (us)")
+    print(
+        "{:>10}".format("symbols")
+        + "".join("{:>14}".format(name) for name, _ in LEXERS)
+    )
+    for n in (10, 100, 300, 1000):
+        grammar, text = symbols_grammar(n)
+        times = []
+        for _, lexer in LEXERS:
+            p = get_parser(
+                grammar, lexer=lexer, parser="lalr", cache_dir=False
+            )
+            times.append(best(lambda: p.parse(text), repeat) / len(text))
+        print(
+            "{:>10}".format(n)
+            + "".join("{:>14.2f}".format(t * 1e6) for t in times)
+        )
+
+
+if __name__ == "__main__":
+    size = 200
+    repeat = 5
+    for arg in sys.argv[1:]:
+        if arg.startswith("--size="):
+            size = int(arg.split("=", 1)[1])
+        elif arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+    main(size, repeat)
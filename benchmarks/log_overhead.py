@@ -0,0 +1,76 @@
+"""Logging overhead benchmark: cost per transformed node
+
+Compares the transformer callbacks with logging disabled (raw methods)
+against the previous behaviour, where every call went through the `Log`
+decorator even when logging was disabled.
+
+Usage:
+  python benchmarks/log_overhead.py [--repeat=N]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.transformer.transformer import (  # noqa: E402
+    ASCIIMath2MathMLTransformer,
+    ASCIIMath2TexTransformer,
+)
+from py_asciimath.translator.translator import ASCIIMath2Tex  # noqa: E402
+
+EXP = "sum_(i=1)^n (x_i+1)/(y_i+2) + sqrt(x^2+y^2) "
+
+
+def legacy(transformer):
+    # Emulate the previous decorator: a new `Log` wrapper built on every
+    # call, describing the arguments even if the logger does nothing
+    for name in dir(type(transformer)):
+        f = getattr(type(transformer), name, None)
+        if getattr(f, "_log", False):
+            method = getattr(transformer, name)
+            setattr(
+                transformer,
+                name,
+                (lambda m: lambda items: transformer._logger(m)(items))(
+                    method
+                ),
+            )
+    return transformer
+
+
+def main(repeat=5):
+    tree = ASCIIMath2Tex(inplace=False).parser.parse(EXP * 10)
+    nodes = sum(1 for _ in tree.iter_subtrees())
+    print("Nodes per transformation: {}".format(nodes))
+    print("{:<30}{:>14}{:>14}".format("", "before (us)", "after (us)"))
+    for cls in (ASCIIMath2TexTransformer, ASCIIMath2MathMLTransformer):
+        before = legacy(cls(log=False))
+        after = cls(log=False)
+        assert before.transform(tree) == after.transform(tree)
+        t_before = min(
+            timeit.repeat(
+                lambda: before.transform(tree), number=10, repeat=repeat
+            )
+        )
+        t_after = min(
+            timeit.repeat(
+                lambda: after.transform(tree), number=10, repeat=repeat
+            )
+        )
+        print(
+            "{:<30}{:>14.2f}{:>14.2f}".format(
+                cls.__name__,
+                t_before / 10 / nodes * 1e6,
+                t_after / 10 / nodes * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    repeat = 5
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+    main(repeat)
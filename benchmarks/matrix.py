@@ -0,0 +1,89 @@
+"""Matrix benchmark: translation time of n x n numeric matrices and of
+matrices nested 2n times, which should grow linearly with the number of cells
+
+Usage:
+  python benchmarks/matrix.py [--repeat=N] [--size=N]
+"""
+
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.translator import (  # noqa: E402
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+)
+
+
+def square(size):
+    exp = (
+        "["
+        + ",".join(
+            "[" + ",".join(str(i * size + j) for j in range(size)) + "]"
+            for i in range(size)
+        )
+        + "]"
+    )
+    return exp, size * size
+
+
+def nested(size):
+    exp = "x"
+    for _ in range(2 * size):
+        exp = "[[" + exp + "],[1]]"
+    return exp, 4 * size
+
+
+def main(repeat=3, size=200):
+    logging.disable(logging.WARNING)
+    sizes = [size // 8, size // 4, size // 2, size]
+    print(
+        "{:<26}{:<8}{:>8}{:>12}{:>12}{:>14}".format(
+            "", "input", "size", "cells", "time (ms)", "us/cell"
+        )
+    )
+    for translator, kwargs in (
+        (ASCIIMath2Tex, {}),
+        (ASCIIMath2MathML, {}),
+        (ASCIIMath2MathML, {"tree": True}),
+    ):
+        t = translator(**kwargs)
+        name = translator.__name__ + (" (tree)" if kwargs else "")
+        # Raw MathML, since libxml2 limits the size of the documents
+        options = (
+            {"xml_pprint": False} if translator is ASCIIMath2MathML else {}
+        )
+        for make in (square, nested):
+            for n in sizes:
+                exp, cells = make(n)
+                elapsed = min(
+                    timeit.repeat(
+                        lambda: t.translate(exp, **options),
+                        number=1,
+                        repeat=repeat,
+                    )
+                )
+                print(
+                    "{:<26}{:<8}{:>8}{:>12}{:>12.2f}{:>14.2f}".format(
+                        name,
+                        make.__name__,
+                        n,
+                        cells,
+                        elapsed * 1e3,
+                        elapsed / cells * 1e6,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    repeat = 3
+    size = 200
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+        elif arg.startswith("--size="):
+            size = int(arg.split("=", 1)[1])
+    main(repeat, size)
@@ -0,0 +1,71 @@
+"""Memoization benchmark: transformation of long, repetitive expressions
+
+Usage:
+  python benchmarks/memoize.py [--repeat=N] [--terms=N]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.translator import (  # noqa: E402
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+)
+
+TERM = "(x+1)^2 + sum_(i=1)^n (x+1)/(y+2) + [[a,b],[c,d]] "
+
+
+def main(repeat=5, terms=50):
+    exp = TERM * terms
+    print("Expression length: {} characters".format(len(exp)))
+    print(
+        "{:<18}{:<12}{:>12}{:>12}{:>8}".format(
+            "", "memo", "plain (s)", "memo (s)", "x"
+        )
+    )
+    for translator in (ASCIIMath2Tex, ASCIIMath2MathML):
+        plain = translator()
+        memo = translator(memoize=True)
+        assert plain.translate(exp) == memo.translate(exp)
+        t_plain = min(
+            timeit.repeat(
+                lambda: plain.translate(exp), number=1, repeat=repeat
+            )
+        )
+        # Cold: only the repetitions inside the expression are memoized
+        t_cold = min(
+            timeit.repeat(
+                lambda: memo.translate(exp),
+                setup=memo.transformer.clear_memo,
+                number=1,
+                repeat=repeat,
+            )
+        )
+        # Warm: the whole expression has already been translated once
+        t_warm = min(
+            timeit.repeat(lambda: memo.translate(exp), number=1, repeat=repeat)
+        )
+        for name, t_memo in (("cold", t_cold), ("warm", t_warm)):
+            print(
+                "{:<18}{:<12}{:>12.4f}{:>12.4f}{:>8.1f}".format(
+                    translator.__name__,
+                    name,
+                    t_plain,
+                    t_memo,
+                    t_plain / t_memo,
+                )
+            )
+
+
+if __name__ == "__main__":
+    repeat = 5
+    terms = 50
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+        elif arg.startswith("--terms="):
+            terms = int(arg.split("=", 1)[1])
+    main(repeat, terms)
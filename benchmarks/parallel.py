@@ -0,0 +1,75 @@
+"""Throughput of translate_many with and without worker processes
+
+Usage:
+  python benchmarks/parallel.py [--size=N] [--workers=N,...]
+"""
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.translator import (  # noqa: E402
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+    Tex2ASCIIMath,
+)
+
+ASCIIMATH = [
+    "sum_(i=1)^{} i^3=((n(n+1))/2)^2",
+    "int_0^{} x^2 dx",
+    "[[a,b],[c,{}]]",
+    "sqrt(x^2+{}) - root(3)(y)",
+    "lim_(N->oo) f(x)/{}",
+]
+LATEX = [
+    "\\frac{{a}}{{{}}}",
+    "\\sum_{{i=1}}^{{{}}} i",
+    "\\sqrt[3]{{x^{{{}}}}}",
+]
+
+
+def run(translator, exps, workers, **kwargs):
+    start = time.time()
+    for _ in translator.translate_many(exps, workers=workers, **kwargs):
+        pass
+    return len(exps) / (time.time() - start)
+
+
+def main(size=2000, workers=(1, 2, 4)):
+    logging.disable(logging.CRITICAL)
+    asciimath = [ASCIIMATH[i % len(ASCIIMATH)].format(i) for i in range(size)]
+    latex = [LATEX[i % len(LATEX)].format(i) for i in range(size)]
+    print("{} CPUs, {} expressions".format(os.cpu_count(), size))
+    print(
+        "{:<18}{:>12}".format("", "sequential")
+        + "".join("{:>12}".format("workers=" + str(w)) for w in workers)
+        + "  (exp/s)"
+    )
+    for translator, exps, kwargs in [
+        (ASCIIMath2Tex(), asciimath, {}),
+        (ASCIIMath2MathML(), asciimath, {"xml_pprint": False}),
+        (Tex2ASCIIMath(), latex, {}),
+    ]:
+        print(
+            "{:<18}{:>12.0f}".format(
+                translator.__class__.__name__,
+                run(translator, exps, None, **kwargs),
+            )
+            + "".join(
+                "{:>12.0f}".format(run(translator, exps, w, **kwargs))
+                for w in workers
+            )
+        )
+
+
+if __name__ == "__main__":
+    size = 2000
+    workers = (1, 2, 4)
+    for arg in sys.argv[1:]:
+        if arg.startswith("--size="):
+            size = int(arg.split("=", 1)[1])
+        elif arg.startswith("--workers="):
+            workers = tuple(int(w) for w in arg.split("=", 1)[1].split(","))
+    main(size, workers)
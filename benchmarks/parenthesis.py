@@ -0,0 +1,104 @@
+"""Parenthesis removal benchmark: regex over the translated subexpressions vs
+structural removal, on deeply nested frac/sqrt chains
+
+Usage:
+  python benchmarks/parenthesis.py [--repeat=N] [--depth=N]
+"""
+
+import logging
+import os
+import re
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.translator import (  # noqa: E402
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+    Tex2ASCIIMath,
+)
+
+
+def regex_remove_parenthesis(transformer):
+    # Previous implementation: the whole translation is scanned at every node
+    transformer.remove_parenthesis = lambda s: re.sub(
+        transformer.start_end_par_pattern, r"\2", s
+    )
+    return transformer
+
+
+def timed_remove_parenthesis(transformer, elapsed):
+    # Accumulate in `elapsed` the time spent removing parenthesis
+    remove_parenthesis = transformer.remove_parenthesis
+
+    def timed(s):
+        start = time.perf_counter()
+        try:
+            return remove_parenthesis(s)
+        finally:
+            elapsed[0] += time.perf_counter() - start
+
+    transformer.remove_parenthesis = timed
+    return transformer
+
+
+def nested(depth):
+    exp = "x"
+    for i in range(depth):
+        exp = ("sqrt(({}))" if i % 2 else "frac(({}))(2)").format(exp)
+    return exp
+
+
+def main(repeat=3, depth=800):
+    logging.disable(logging.WARNING)
+    depths = [depth // 8, depth // 4, depth // 2, depth]
+    print(
+        "{:<18}{:>8}{:>26}{:>26}".format(
+            "", "depth", "regex: total/strip (ms)", "struct: total/strip (ms)"
+        )
+    )
+    for translator in (ASCIIMath2Tex, ASCIIMath2MathML, Tex2ASCIIMath):
+        for d in depths:
+            exp = nested(d)
+            if translator is Tex2ASCIIMath:
+                exp = ASCIIMath2Tex().translate(exp)
+            # Raw MathML, since libxml2 limits the depth of the documents
+            kwargs = (
+                {"xml_pprint": False} if translator is ASCIIMath2MathML else {}
+            )
+            regex = translator()
+            regex_remove_parenthesis(regex.transformer)
+            row = []
+            for t in (regex, translator()):
+                elapsed = [0.0]
+                timed_remove_parenthesis(t.transformer, elapsed)
+                total = min(
+                    timeit.repeat(
+                        lambda: t.translate(exp, **kwargs),
+                        number=1,
+                        repeat=repeat,
+                    )
+                )
+                row.append(
+                    "{:.2f}/{:.2f}".format(
+                        total * 1e3, elapsed[0] / repeat * 1e3
+                    )
+                )
+            print(
+                "{:<18}{:>8}{:>26}{:>26}".format(
+                    translator.__name__, d, row[0], row[1]
+                )
+            )
+
+
+if __name__ == "__main__":
+    repeat = 3
+    depth = 800
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+        elif arg.startswith("--depth="):
+            depth = int(arg.split("=", 1)[1])
+    main(repeat, depth)
@@ -0,0 +1,78 @@
+"""Output assembly benchmark: translation time of long and deeply nested
+expressions, which should grow linearly with their length
+
+Usage:
+  python benchmarks/rope.py [--repeat=N] [--size=N]
+"""
+
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.translator import (  # noqa: E402
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+)
+
+TERM = "sum_(i=1)^n (x_i+1)/(y_i+2) + sqrt(x^2+y^2) "
+
+
+def long(size):
+    return TERM * size
+
+
+def nested(size):
+    exp = "x"
+    for i in range(size):
+        exp = ("sqrt({} + 1)" if i % 2 else "frac({} + 1)(2)").format(exp)
+    return exp
+
+
+def main(repeat=3, size=800):
+    logging.disable(logging.WARNING)
+    sizes = [size // 8, size // 4, size // 2, size]
+    print(
+        "{:<18}{:<8}{:>8}{:>12}{:>12}{:>14}".format(
+            "", "input", "size", "chars", "time (ms)", "us/char"
+        )
+    )
+    for translator in (ASCIIMath2Tex, ASCIIMath2MathML):
+        t = translator()
+        # Raw MathML, since libxml2 limits the depth of the documents
+        kwargs = (
+            {"xml_pprint": False} if translator is ASCIIMath2MathML else {}
+        )
+        for name, make in (("long", long), ("nested", nested)):
+            for n in sizes:
+                exp = make(n)
+                elapsed = min(
+                    timeit.repeat(
+                        lambda: t.translate(exp, **kwargs),
+                        number=1,
+                        repeat=repeat,
+                    )
+                )
+                print(
+                    "{:<18}{:<8}{:>8}{:>12}{:>12.2f}{:>14.2f}".format(
+                        translator.__name__,
+                        name,
+                        n,
+                        len(exp),
+                        elapsed * 1e3,
+                        elapsed / len(exp) * 1e6,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    repeat = 3
+    size = 800
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+        elif arg.startswith("--size="):
+            size = int(arg.split("=", 1)[1])
+    main(repeat, size)
@@ -0,0 +1,117 @@
+"""Server benchmark: latency of a translation through a cold command line
+invocation, a command line invocation forwarding to a warm server
+(--server), a persistent client connection and an in-process translator
+
+Usage:
+  python benchmarks/server.py [--cli=N] [--requests=N] [--unix]
+"""
+
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from py_asciimath.translator.server import (  # noqa: E402
+    RemoteTranslator,
+    parse_address,
+)
+from py_asciimath.translator.translator import ASCIIMath2Tex  # noqa: E402
+
+EXP = "sum_(i=1)^n i^3=((n(n+1))/2)^2"
+
+
+def free_port():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def latencies(f, n):
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        f()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def cli(*args):
+    subprocess.run(
+        [sys.executable, "-m", "py_asciimath", EXP, "from", "asciimath"]
+        + ["to", "latex"]
+        + list(args),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=ROOT,
+        check=True,
+    )
+
+
+def main(n_cli=10, n_requests=1000, unix=False):
+    tmp = tempfile.mkdtemp()
+    if unix:
+        address = "unix:" + os.path.join(tmp, "server.sock")
+    else:
+        address = "127.0.0.1:" + str(free_port())
+    server = subprocess.Popen(
+        [sys.executable, "-m", "py_asciimath", "serve", "--server=" + address],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=ROOT,
+    )
+    remote = RemoteTranslator(parse_address(address), "asciimath", "latex")
+    try:
+        # Wait for the server to listen
+        for _ in range(200):
+            try:
+                remote.translate(EXP)
+                break
+            except OSError:
+                time.sleep(0.05)
+        local = ASCIIMath2Tex()
+        print(
+            "{:<26}{:>10}{:>14}{:>14}".format("", "n", "p50 (ms)", "p95 (ms)")
+        )
+        for name, f, n in (
+            ("cold CLI", cli, n_cli),
+            ("CLI --server", lambda: cli("--server=" + address), n_cli),
+            ("client connection", lambda: remote.translate(EXP), n_requests),
+            ("in-process", lambda: local.translate(EXP), n_requests),
+        ):
+            times = sorted(latencies(f, n))
+            print(
+                "{:<26}{:>10}{:>14.2f}{:>14.2f}".format(
+                    name,
+                    n,
+                    statistics.median(times) * 1e3,
+                    times[int(0.95 * (n - 1))] * 1e3,
+                )
+            )
+    finally:
+        remote.close()
+        server.terminate()
+        server.wait()
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    n_cli = 10
+    n_requests = 1000
+    unix = False
+    for arg in sys.argv[1:]:
+        if arg.startswith("--cli="):
+            n_cli = int(arg.split("=", 1)[1])
+        elif arg.startswith("--requests="):
+            n_requests = int(arg.split("=", 1)[1])
+        elif arg == "--unix":
+            unix = True
+    main(n_cli, n_requests, unix)
@@ -0,0 +1,50 @@
+"""Startup benchmark: cold grammar compilation vs cached parser tables
+
+Usage:
+  python benchmarks/startup.py [--repeat=N]
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.translator import (  # noqa: E402
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+    Tex2ASCIIMath,
+)
+
+
+def main(repeat=3):
+    cache_dir = tempfile.mkdtemp()
+    print("{:<18}{:>14}{:>14}{:>10}".format("", "cold (s)", "cached (s)", "x"))
+    for translator in (ASCIIMath2Tex, ASCIIMath2MathML, Tex2ASCIIMath):
+        cold = min(
+            timeit.repeat(
+                lambda: translator(cache_dir=False), number=1, repeat=repeat
+            )
+        )
+        # Populate the cache
+        translator(cache_dir=cache_dir)
+        cached = min(
+            timeit.repeat(
+                lambda: translator(cache_dir=cache_dir),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(
+            "{:<18}{:>14.3f}{:>14.3f}{:>10.1f}".format(
+                translator.__name__, cold, cached, cold / cached
+            )
+        )
+
+
+if __name__ == "__main__":
+    repeat = 3
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+    main(repeat)
@@ -0,0 +1,81 @@
+"""Multi-target benchmark: time to translate typical formulas to both LaTeX
+and MathML with ASCIIMath2Tex and ASCIIMath2MathML, parsing every formula
+twice, and with ASCIIMath2AST, parsing it once and rendering its abstract
+syntax tree twice, and time to render a stored tree
+
+Usage:
+  python benchmarks/targets.py [--number=N] [--repeat=N]
+"""
+
+import os
+import pickle
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.translator import (  # noqa: E402
+    ASCIIMath2AST,
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+)
+
+FORMULAS = [
+    "x^2",
+    "sum_(i=1)^n i^3=((n(n+1))/2)^2",
+    "sqrt(a^2+b^2)",
+    "int_0^1 f(x) dx",
+    "[[a,b],[c,d]]",
+    "e^(i pi)+1=0",
+    "lim_(x->oo) (1+1/x)^x",
+    'f(x) = {(x, "if" x >= 0), (-x, "otherwise"):}',
+]
+TARGETS = ["latex", "mathml"]
+OPTIONS = {"mathml": {"xml_pprint": False}}
+
+
+def main(number=200, repeat=5):
+    tex = ASCIIMath2Tex()
+    mathml = ASCIIMath2MathML()
+    ast = ASCIIMath2AST(renderers={"latex": tex, "mathml": mathml})
+    trees = [pickle.dumps(ast.translate(exp)) for exp in FORMULAS]
+
+    def separate():
+        for exp in FORMULAS:
+            tex.translate(exp)
+            mathml.translate(exp, xml_pprint=False)
+
+    def parse_once():
+        for exp in FORMULAS:
+            ast.translate(exp, targets=TARGETS, options=OPTIONS)
+
+    def stored():
+        for tree in trees:
+            tree = pickle.loads(tree)
+            for target in TARGETS:
+                ast.render(tree, target, **OPTIONS.get(target, {}))
+
+    print("Microseconds per formula, to LaTeX and MathML")
+    for name, f in [
+        ("two translators", separate),
+        ("ASCIIMath2AST", parse_once),
+        ("stored trees", stored),
+    ]:
+        f()
+        elapsed = min(timeit.repeat(f, number=number, repeat=repeat))
+        print(
+            "{:<20}{:>10.1f}".format(
+                name, elapsed / number / len(FORMULAS) * 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    number = 200
+    repeat = 5
+    for arg in sys.argv[1:]:
+        if arg.startswith("--number="):
+            number = int(arg.split("=", 1)[1])
+        elif arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+    main(number, repeat)
@@ -0,0 +1,63 @@
+"""MathML output benchmark: string building plus re-parse vs direct tree
+building
+
+Usage:
+  python benchmarks/tree.py [--terms=N] [--repeat=N] [--number=N]
+"""
+
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.translator import ASCIIMath2MathML  # noqa: E402
+
+TERM = "sum_(i=1)^n (x_i+1)/(y_i+2) + sqrt(x^2+y^2) + [[a,b],[c,d]]"
+
+
+def main(terms=40, repeat=3, number=5):
+    logging.disable(logging.WARNING)
+    exp = " + ".join([TERM] * terms)
+    paths = [
+        ("string", ASCIIMath2MathML(), {}),
+        ("string, cached DTD", ASCIIMath2MathML(), {"cached_dtd": True}),
+        ("tree", ASCIIMath2MathML(tree=True), {}),
+    ]
+    print("Expression of {} chars".format(len(exp)))
+    print("{:<24}{:>16}{:>16}".format("", "string (ms)", "etree (ms)"))
+    for name, translator, kwargs in paths:
+        times = []
+        for output in ("string", "etree"):
+            times.append(
+                min(
+                    timeit.repeat(
+                        lambda: translator.translate(
+                            exp, output=output, **kwargs
+                        ),
+                        number=number,
+                        repeat=repeat,
+                    )
+                )
+                / number
+            )
+        print(
+            "{:<24}{:>16.2f}{:>16.2f}".format(
+                name, times[0] * 1e3, times[1] * 1e3
+            )
+        )
+
+
+if __name__ == "__main__":
+    terms = 40
+    repeat = 3
+    number = 5
+    for arg in sys.argv[1:]:
+        if arg.startswith("--terms="):
+            terms = int(arg.split("=", 1)[1])
+        elif arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+        elif arg.startswith("--number="):
+            number = int(arg.split("=", 1)[1])
+    main(terms, repeat, number)
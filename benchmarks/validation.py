@@ -0,0 +1,58 @@
+"""MathML validation benchmark: DTD loaded at every parse vs cached DTD
+
+Usage:
+  python benchmarks/validation.py [--repeat=N] [--number=N]
+"""
+
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from py_asciimath.translator.translator import ASCIIMath2MathML  # noqa: E402
+
+EXP = "sum_(i=1)^n (x_i+1)/(y_i+2) + sqrt(x^2+y^2) + [[a,b],[c,d]]"
+
+
+def main(repeat=3, number=20):
+    logging.disable(logging.WARNING)
+    translator = ASCIIMath2MathML()
+    print(
+        "{:<10}{:>16}{:>16}{:>8}".format("", "loaded (ms)", "cached (ms)", "x")
+    )
+    for dtd in ("mathml1", "mathml2", "mathml3"):
+        times = []
+        for cached_dtd in (False, True):
+            times.append(
+                min(
+                    timeit.repeat(
+                        lambda: translator.translate(
+                            EXP,
+                            dtd=dtd,
+                            dtd_validation=True,
+                            cached_dtd=cached_dtd,
+                        ),
+                        number=number,
+                        repeat=repeat,
+                    )
+                )
+                / number
+            )
+        print(
+            "{:<10}{:>16.2f}{:>16.2f}{:>8.1f}".format(
+                dtd, times[0] * 1e3, times[1] * 1e3, times[0] / times[1]
+            )
+        )
+
+
+if __name__ == "__main__":
+    repeat = 3
+    number = 20
+    for arg in sys.argv[1:]:
+        if arg.startswith("--repeat="):
+            repeat = int(arg.split("=", 1)[1])
+        elif arg.startswith("--number="):
+            number = int(arg.split("=", 1)[1])
+    main(repeat, number)
@@ -1,24 +1,8 @@
-from itertools import islice
+from ..translation.tables import asciimath_grammar  # noqa: F401
 
-from ..asciimath import get_symbols_for
-from ..utils.utils import alias_string
-
-unary_functions = get_symbols_for("unary_functions", None)
-binary_functions = get_symbols_for("binary_functions", None)
-left_parenthesis = get_symbols_for("left_parenthesis", None)
-right_parenthesis = get_symbols_for("right_parenthesis", None)
-
-smb = get_symbols_for("misc_symbols", None)
-smb.update(get_symbols_for("colors", None))
-smb.update(get_symbols_for("function_symbols", None))
-smb.update(get_symbols_for("relation_symbols", None))
-smb.update(get_symbols_for("logical_symbols", None))
-smb.update(get_symbols_for("operation_symbols", None))
-smb.update(get_symbols_for("greek_letters", None))
-smb.update(get_symbols_for("arrows", None))
-smb = dict(sorted(smb.items(), key=lambda x: (-len(x[0]), x[0])))
-
-asciimath_grammar = r"""
+# Template of `asciimath_grammar`, filled with the symbols of
+# py_asciimath/asciimath.py by `python -m py_asciimath.translation.build`
+template = r"""
     %import common.WS
     %import common.LETTER
     %import common.NUMBER
@@ -46,13 +30,4 @@ asciimath_grammar = r"""
     !_asciimath1: {}
     !_asciimath2: {}
     QS: "\"" /(?<=").+?(?=")/ "\"" // Quoted String
-""".format(
-    alias_string(left_parenthesis, alias=False),
-    alias_string(right_parenthesis, alias=False),
-    alias_string(binary_functions, alias=False),
-    alias_string(unary_functions, alias=False),
-    alias_string(dict(islice(smb.items(), len(smb) // 2)), alias=False),
-    alias_string(
-        dict(islice(smb.items(), len(smb) // 2, len(smb))), alias=False
-    ),
-)
+"""
@@ -0,0 +1,216 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import zlib
+
+import lark
+from lark import Lark
+from lark.grammar import Rule
+from lark.lexer import TerminalDef
+
+from .. import PROJECT_ROOT
+
+BUNDLED_TABLES_DIR = os.path.join(PROJECT_ROOT, "grammar", "tables")
+
+# Lark options that can not be part of the cache key, either because they are
+# not serializable or because they are supplied again when loading the tables
+_UNHASHABLE_OPTIONS = (
+    "transformer",
+    "postlex",
+    "lexer_callbacks",
+    "edit_terminals",
+)
+
+
+def get_cache_dir():
+    """Return the default directory where the parser tables are cached
+
+    The directory can be set through the `PY_ASCIIMATH_CACHE_DIR` environment
+    variable; otherwise `$XDG_CACHE_HOME/py_asciimath` (or
+    `~/.cache/py_asciimath`) will be used
+
+    Returns:
+        str: Path of the cache directory
+    """
+    cache_dir = os.environ.get("PY_ASCIIMATH_CACHE_DIR")
+    if cache_dir is None:
+        cache_dir = os.path.join(
+            os.environ.get(
+                "XDG_CACHE_HOME",
+                os.path.join(os.path.expanduser("~"), ".cache"),
+            ),
+            "py_asciimath",
+        )
+    return cache_dir
+
+
+def get_cache_key(grammar, **options):
+    """Compute the key identifying the parser tables of a grammar
+
+    The key is computed from the grammar source, the lark version and
+    every option that changes how the parser is built
+
+    Args:
+        grammar (str): Lark grammar
+        **options: Options to the :class:`~lark.Lark` class
+
+    Returns:
+        str: Hexadecimal key; None if the options can not be hashed
+    """
+    if options.get("parser") != "lalr":
+        return None
+    if any(options.get(k) is not None for k in _UNHASHABLE_OPTIONS[1:]):
+        return None
+    options_str = repr(
+        sorted(
+            (k, repr(v))
+            for k, v in options.items()
+            if k not in _UNHASHABLE_OPTIONS
+        )
+    )
+    s = grammar + options_str + lark.__version__
+    return hashlib.sha256(s.encode("utf8")).hexdigest()
+
+
+def _get_table_path(cache_dir, key):
+    return os.path.join(cache_dir, key + ".lark")
+
+
+def _load_tables(path, transformer=None, lexer=None):
+    with open(path, "rb") as f:
+        tables = pickle.loads(zlib.decompress(f.read()))
+    return _from_tables(tables, transformer=transformer, lexer=lexer)
+
+
+def _from_tables(tables, transformer=None, lexer=None):
+    if lexer is not None:
+        # The LALR tables do not depend on the lexer: the tables of the
+        # contextual lexer are used with the custom lexer class `lexer`
+        data = tables["data"]
+        data["options"] = dict(data["options"], lexer=lexer)
+        data["parser"]["options"] = dict(
+            data["parser"]["options"], lexer=lexer
+        )
+        data["parser"]["lexer_conf"] = dict(
+            data["parser"]["lexer_conf"], lexer_type=lexer
+        )
+    return Lark.__new__(Lark)._load(tables, transformer=transformer)
+
+
+def _serialize(parser):
+    data, memo = parser.memo_serialize([TerminalDef, Rule])
+    # The transformer is supplied again when the tables are loaded
+    data["options"] = dict(data["options"], transformer=None)
+    data["parser"]["options"] = dict(
+        data["parser"]["options"], transformer=None
+    )
+    return {"data": data, "memo": memo}
+
+
+def save_tables(parser, path):
+    """Serialize the tables of a LALR parser to `path`
+
+    The tables are first written to a temporary file which is then renamed,
+    so that concurrent processes never read a partially written file
+
+    Args:
+        parser (lark.Lark): Parser to serialize
+        path (str): Destination path
+    """
+    dump = zlib.compress(pickle.dumps(_serialize(parser), protocol=4))
+    dirname = os.path.dirname(path)
+    os.makedirs(dirname, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(dump)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def get_parser(grammar, cache_dir=None, **options):
+    """Create a :class:`~lark.Lark` parser, loading its tables from cache
+
+    The tables are searched first in `cache_dir`, then among the ones bundled
+    with py_asciimath. If no tables are found, the grammar is compiled and
+    the resulting tables are saved in `cache_dir`. A custom lexer class,
+    such as :class:`~py_asciimath.grammar.lexer.TrieLexer`, shares the
+    tables of the contextual lexer.
+
+    Args:
+        grammar (str): Lark grammar
+        cache_dir (str, optional): Directory where the parser tables are
+            cached. If None, :func:`get_cache_dir` will be used. If False,
+            the cache is disabled. Defaults to None.
+        **options: Options to the :class:`~lark.Lark` class
+
+    Returns:
+        lark.Lark: The parser
+    """
+    lexer = options.get("lexer")
+    if isinstance(lexer, type):
+        table_options = dict(options, lexer="contextual")
+    else:
+        lexer = None
+        table_options = options
+    key = (
+        get_cache_key(grammar, **table_options)
+        if cache_dir is not False
+        else None
+    )
+    if key is None:
+        return Lark(grammar, **options)
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    transformer = options.get("transformer")
+    for dirname in (cache_dir, BUNDLED_TABLES_DIR):
+        path = _get_table_path(dirname, key)
+        if os.path.exists(path):
+            try:
+                logging.info("Loading parser tables from '" + path + "'...")
+                return _load_tables(path, transformer=transformer, lexer=lexer)
+            except Exception:
+                logging.warning(
+                    "Failed to load parser tables from '" + path + "'"
+                )
+    parser = Lark(grammar, **table_options)
+    try:
+        save_tables(parser, _get_table_path(cache_dir, key))
+    except OSError:
+        logging.warning("Can not write parser tables to '" + cache_dir + "'")
+    if lexer is not None:
+        parser = _from_tables(
+            _serialize(parser), transformer=transformer, lexer=lexer
+        )
+    return parser
+
+
+def build_bundled_tables(
+    lexer="contextual", parser="lalr"
+):  # pragma: no cover
+    """Build the parser tables bundled with py_asciimath
+
+    Args:
+        lexer (str, optional): Lexer used during parsing. Defaults to
+            "contextual".
+        parser (str, optional): Parser algorithm. Defaults to "lalr".
+    """
+    from .asciimath_grammar import asciimath_grammar
+    from .latex_grammar import latex_grammar
+
+    for f in os.listdir(BUNDLED_TABLES_DIR):
+        if f.endswith(".lark"):
+            os.remove(os.path.join(BUNDLED_TABLES_DIR, f))
+    for grammar in (asciimath_grammar, latex_grammar):
+        get_parser(
+            grammar, cache_dir=BUNDLED_TABLES_DIR, lexer=lexer, parser=parser
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    build_bundled_tables()
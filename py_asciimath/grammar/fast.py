@@ -0,0 +1,178 @@
+from .lexer import TrieLexer
+
+# Kinds of the terminals of the ASCIIMath grammar, by the rule listing them
+_LEFT, _RIGHT, _UNARY, _BINARY, _SYMBOL, _CONST, _QS = range(7)
+_kinds = {
+    "_l": _LEFT,
+    "_r": _RIGHT,
+    "_u": _UNARY,
+    "_b": _BINARY,
+    "_asciimath1": _SYMBOL,
+    "_asciimath2": _SYMBOL,
+    "_c": _CONST,
+}
+
+
+class _SyntaxError(Exception):
+    # Raised when the input is not in the grammar: the lark parser is run
+    # again to raise its own error
+    pass
+
+
+class _Parse(object):
+    # State of the parsing of `text`: the current token, as its value and
+    # terminal name, and the position of the next one
+    __slots__ = ("text", "pos", "value", "name")
+
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+        self.value = None
+        self.name = None
+
+
+class ASCIIMathParser(object):
+    """Recursive descent parser of the ASCIIMath grammar
+
+    The parser of `engine="fast"`: it parses the grammar of
+    :mod:`~py_asciimath.grammar.asciimath_grammar` and calls the callbacks
+    of the transformer directly, as the LALR parser of lark does when the
+    transformer is passed to it, without building lark tokens and trees.
+    The terminals are the ones of the lark parser, matched by a
+    :class:`~py_asciimath.grammar.lexer.TrieLexer` with the terminals
+    accepted by the lark contextual lexer at the same point, and the
+    conflicts of the grammar are resolved as the LALR parser does, i.e. by
+    shifting: `a_b^c` is `a` with both a subscript and a superscript,
+    while `a/b/c` is `a/b` followed by the symbol `/` and `c`. The
+    translations are the same as the ones of the lark parser: if the input
+    is not in the grammar, the lark parser is run again, to raise its own
+    error.
+
+    Args:
+        parser (lark.Lark): LALR parser of the ASCIIMath grammar
+        transformer (MathTransformer): Transformer whose callbacks are
+            called
+        inplace (bool, optional): True if `transformer` is called by
+            `parser`, see :class:`~lark.Lark`. Defaults to True.
+    """
+
+    def __init__(self, parser, transformer, inplace=True):
+        self.parser = parser
+        self.transformer = transformer
+        self.inplace = inplace
+        self._lexer = TrieLexer(parser.lexer_conf)
+        self._ignore = self._lexer.ignore_types
+        self._kinds = {}
+        # Callbacks of the operators of `i`, by terminal: the operators are
+        # symbols too, if they can not be shifted
+        self._ops = {}
+        for rule in parser.rules:
+            origin = rule.origin.name
+            if origin in _kinds:
+                for terminal in rule.expansion:
+                    self._kinds[terminal.name] = _kinds[origin]
+            elif origin == "s" and rule.alias == "q_str":
+                self._kinds[rule.expansion[0].name] = _QS
+            elif origin == "i" and len(rule.expansion) == 3:
+                self._ops[rule.expansion[1].name] = rule.alias
+        names = set(self._lexer.terminals_by_name)
+        right = set(n for n, k in self._kinds.items() if k == _RIGHT)
+        # Terminals accepted where an `s` must follow, i.e. at the start and
+        # after a function or an operator, and anywhere else
+        self._expect_s = self._lexer._build_state(names - right)
+        self._any = self._lexer._build_state(names)
+        self._super = None
+        for name, op in self._ops.items():
+            if op == "exp_super":
+                self._super = name
+        for name in transformer.rules:
+            setattr(self, "_" + name, getattr(transformer, name))
+
+    def parse(self, text):
+        """Parse `text`, returning what the transformer returns for it
+
+        Args:
+            text (str): ASCIIMath expression
+
+        Returns:
+            object: The transformed expression
+        """
+        p = _Parse(text)
+        try:
+            self._next(p, self._expect_s)
+            result = self._start(p)
+            if p.name is not None:
+                raise _SyntaxError
+            return result
+        except (_SyntaxError, RecursionError):
+            tree = self.parser.parse(text)
+            return tree if self.inplace else self.transformer.transform(tree)
+
+    def _next(self, p, state):
+        # Read the next token, None at the end of the text
+        text = p.text
+        while p.pos < len(text):
+            res = self._lexer.match(text, p.pos, state)
+            if res is None:
+                raise _SyntaxError
+            p.pos = p.pos + len(res[0])
+            if res[1] not in self._ignore:
+                p.value, p.name = res
+                return
+        p.value = p.name = None
+
+    def _start(self, p):
+        # start: i start*, whose right-recursive sequences are flattened,
+        # as by `MathTransformer.transform`: `exp` is called once with all
+        # the items
+        items = [self._i(p)]
+        while p.name is not None and self._kinds.get(p.name) != _RIGHT:
+            items.append(self._i(p))
+        return self._exp(items)
+
+    def _i(self, p):
+        s = self._s(p)
+        op = self._ops.get(p.name)
+        if op is None:
+            return self._exp_interm([s])
+        self._next(p, self._expect_s)
+        s2 = self._s(p)
+        if op == "exp_under" and p.name == self._super:
+            self._next(p, self._expect_s)
+            return self._exp_under_super([s, s2, self._s(p)])
+        return getattr(self, "_" + op)([s, s2])
+
+    def _s(self, p):
+        kind = self._kinds.get(p.name)
+        value = p.value
+        if kind == _SYMBOL:
+            self._next(p, self._any)
+            return self._symbol([value])
+        elif kind == _CONST:
+            self._next(p, self._any)
+            return self._const([value])
+        elif kind == _LEFT:
+            self._next(p, self._any)
+            if self._kinds.get(p.name) == _RIGHT:
+                right = p.value
+                self._next(p, self._any)
+                return self._exp_par([value, right])
+            if p.name is None:
+                raise _SyntaxError
+            exp = self._start(p)
+            if p.name is None:
+                raise _SyntaxError
+            right = p.value
+            self._next(p, self._any)
+            return self._exp_par([value, exp, right])
+        elif kind == _UNARY:
+            self._next(p, self._expect_s)
+            return self._exp_unary([value, self._s(p)])
+        elif kind == _BINARY:
+            self._next(p, self._expect_s)
+            s = self._s(p)
+            return self._exp_binary([value, s, self._s(p)])
+        elif kind == _QS:
+            self._next(p, self._any)
+            return self._q_str([value])
+        raise _SyntaxError
@@ -1,16 +1,8 @@
-from itertools import islice
+from ..translation.tables import latex_grammar  # noqa: F401
 
-from ..utils.utils import alias_string
-from ..translation.latex2asciimath import (
-    left_parenthesis,
-    right_parenthesis,
-    smb,
-    unary_functions,
-    binary_functions,
-)
-
-
-latex_grammar = r"""
+# Template of `latex_grammar`, filled with the symbols of
+# py_asciimath/latex.py by `python -m py_asciimath.translation.build`
+template = r"""
     %import common.WS
     %import common.LETTER
     %import common.NUMBER
@@ -43,19 +35,4 @@ latex_grammar = r"""
     !_u: {} // unary functions
     !_latex1: {}
     !_latex2: {}
-""".format(
-    alias_string(left_parenthesis, alias=False, lang_from="latex"),
-    alias_string(right_parenthesis, alias=False, lang_from="latex"),
-    alias_string(binary_functions, alias=False, lang_from="latex"),
-    alias_string(unary_functions, alias=False, lang_from="latex"),
-    alias_string(
-        dict(islice(smb.items(), len(smb) // 2)),
-        alias=False,
-        lang_from="latex",
-    ),
-    alias_string(
-        dict(islice(smb.items(), len(smb) // 2, len(smb))),
-        alias=False,
-        lang_from="latex",
-    ),
-)
+"""
@@ -0,0 +1,322 @@
+import re
+
+from lark.exceptions import UnexpectedCharacters, UnexpectedToken
+from lark.lexer import Lexer, PatternStr, Token, _regexp_has_newline
+
+# Regular expressions of the LaTeX grammar that match a single string, such
+# as `/\\alpha/`, and their escapes
+_LITERAL_RE = re.compile(r"(?:\\[^A-Za-z0-9]|[A-Za-z0-9}]|{(?![0-9,]))+")
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+
+class _State(object):
+    # Terminals of a LALR state: the string terminals that can be matched,
+    # the alternation of the regular expressions, in the lark order, and
+    # the (key, unless) couple of every regular expression, where `unless`
+    # maps the strings fully matched by it to their own terminal
+    __slots__ = ("strings", "regexp", "regexps", "allowed")
+
+    def __init__(self, strings, regexp, regexps, allowed):
+        self.strings = strings
+        self.regexp = regexp
+        self.regexps = regexps
+        self.allowed = allowed
+
+
+class TrieLexer(Lexer):
+    """Longest-match lexer for the LALR parsers of py_asciimath
+
+    A drop-in replacement of the lark contextual lexer, plugged into
+    :class:`~lark.Lark` as a custom lexer (`lexer=TrieLexer`). The string
+    terminals, i.e. the symbols of the grammar, are stored in a trie that is
+    walked once per token, instead of trying a regular expression
+    alternation of every symbol: lexing time depends on the length of the
+    input and of the longest symbol, not on the number of symbols. The few
+    regular expression terminals, such as numbers and letters, are matched
+    by a single alternation.
+
+    Tokens are the same as the ones of the contextual lexer: only the
+    terminals accepted by the current state of the parser are matched, and
+    among them the first one in the lark order (priority, maximum width,
+    length of the pattern, name) wins, so that, e.g., numbers are matched
+    before symbols and longer symbols before their prefixes.
+
+    Args:
+        conf (lark.common.LexerConf): Configuration of the lexer
+    """
+
+    __future_interface__ = True
+
+    def __init__(self, conf):
+        self.terminals = list(conf.terminals)
+        self.terminals_by_name = conf.terminals_by_name
+        self.ignore_types = frozenset(conf.ignore)
+        self.newline_types = frozenset(
+            t.name
+            for t in self.terminals
+            if _regexp_has_newline(t.pattern.to_regexp())
+        )
+        self.callbacks = conf.callbacks
+        self._re = conf.re_module
+        self._flags = conf.g_regex_flags
+        # Order of the terminals when more than one matches, the same used
+        # by lark to sort the alternatives of its regular expressions
+        self._keys = {
+            t.name: (
+                -t.priority,
+                -t.pattern.max_width,
+                -len(t.pattern.value),
+                t.name,
+            )
+            for t in self.terminals
+        }
+        self._trie = {}
+        self._strings = {}
+        self._regexps = {}
+        for t in self.terminals:
+            value = self._literal(t.pattern)
+            if value is not None and value not in self._strings.values():
+                node = self._trie
+                for c in value:
+                    node = node.setdefault(c, {})
+                node[None] = t.name
+                self._strings[t.name] = value
+            else:
+                self._regexps[t.name] = self._re.compile(
+                    t.pattern.to_regexp(), self._flags
+                )
+        # LALR states by id, built when first reached
+        self._states = {}
+        self._root = None
+
+    def _literal(self, pattern):
+        # The string matched by `pattern`, if it is a string terminal
+        if isinstance(pattern, PatternStr) and not pattern.flags:
+            return pattern.value
+        return None
+
+    def _build_state(self, accepts):
+        accepts = set(accepts) | self.ignore_types
+        regexps = {}
+        alternatives = []
+        embedded = set()
+        for name in sorted(self._regexps, key=self._keys.__getitem__):
+            if name not in accepts:
+                continue
+            regexp = self._regexps[name]
+            priority = self.terminals_by_name[name].priority
+            unless = {}
+            # Strings fully matched by an accepted regular expression are
+            # matched by the regular expression, as lark does
+            for t in self.terminals:
+                value = self._strings.get(t.name)
+                if (
+                    t.name in accepts
+                    and value is not None
+                    and t.priority <= priority
+                ):
+                    m = regexp.match(value)
+                    if m is not None and m.group(0) == value:
+                        unless[value] = t.name
+                        embedded.add(t.name)
+            regexps[name] = (self._keys[name], unless)
+            alternatives.append("(?P<" + name + ">" + regexp.pattern + ")")
+        strings = frozenset(
+            name
+            for name in accepts
+            if name in self._strings and name not in embedded
+        )
+        allowed = (accepts - self.ignore_types) & set(self._keys)
+        return _State(
+            strings,
+            (
+                self._re.compile("|".join(alternatives), self._flags)
+                if alternatives
+                else None
+            ),
+            regexps,
+            allowed or {"<END-OF-FILE>"},
+        )
+
+    def _get_state(self, parser_state):
+        position = parser_state.position
+        state = self._states.get(position)
+        if state is None:
+            state = self._build_state(parser_state.parse_conf.states[position])
+            self._states[position] = state
+        return state
+
+    def match(self, text, pos, state):
+        """Match the next terminal of `text` at `pos`
+
+        Args:
+            text (str): Text to tokenize
+            pos (int): Position of the terminal
+            state (_State): Terminals accepted by the parser
+
+        Returns:
+            tuple: The value and the name of the terminal, or None if no
+                terminal matches
+        """
+        best_key = None
+        best = self._longest_string(text, pos, state.strings)
+        if best is not None:
+            best_key = self._keys[best[1]]
+            best = (text[pos : best[0]], best[1])
+        if state.regexp is not None:
+            # The first regular expression matched, if it comes before the
+            # string in the lark order
+            m = state.regexp.match(text, pos)
+            if m is not None:
+                name = m.lastgroup
+                key, unless = state.regexps[name]
+                if best_key is None or key < best_key:
+                    value = m.group(0)
+                    return value, unless.get(value, name)
+        return best
+
+    def _longest_string(self, text, pos, strings):
+        # End and name of the longest string terminal in `strings` matched
+        # at `pos`, or None
+        best = None
+        node = self._trie
+        end = pos
+        n = len(text)
+        while end < n:
+            node = node.get(text[end])
+            if node is None:
+                break
+            end = end + 1
+            name = node.get(None)
+            if name is not None and name in strings:
+                best = (end, name)
+        return best
+
+    def lex(self, lexer_state, parser_state):
+        line_ctr = lexer_state.line_ctr
+        text = lexer_state.text
+        while line_ctr.char_pos < len(text):
+            state = self._get_state(parser_state)
+            res = self.match(text, line_ctr.char_pos, state)
+            if res is None:
+                self._raise(lexer_state, parser_state, state)
+            value, type_ = res
+            if type_ in self.ignore_types:
+                if type_ in self.callbacks:
+                    self.callbacks[type_](
+                        Token(
+                            type_,
+                            value,
+                            line_ctr.char_pos,
+                            line_ctr.line,
+                            line_ctr.column,
+                        )
+                    )
+                line_ctr.feed(value, type_ in self.newline_types)
+                continue
+            t = Token(
+                type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column
+            )
+            line_ctr.feed(value, type_ in self.newline_types)
+            t.end_line = line_ctr.line
+            t.end_column = line_ctr.column
+            t.end_pos = line_ctr.char_pos
+            if type_ in self.callbacks:
+                t = self.callbacks[type_](t)
+            lexer_state.last_token = t
+            yield t
+
+    def _raise(self, lexer_state, parser_state, state):
+        # Raise the errors of the contextual lexer: an unexpected token if
+        # the text matches a terminal not accepted by the parser, unexpected
+        # characters otherwise
+        line_ctr = lexer_state.line_ctr
+        history = lexer_state.last_token and [lexer_state.last_token]
+        if self._root is None:
+            self._root = self._build_state(self._keys)
+        res = self.match(lexer_state.text, line_ctr.char_pos, self._root)
+        if res is not None and res[1] not in self.ignore_types:
+            token = Token(
+                res[1],
+                res[0],
+                line_ctr.char_pos,
+                line_ctr.line,
+                line_ctr.column,
+            )
+            raise UnexpectedToken(
+                token,
+                state.allowed,
+                state=parser_state,
+                token_history=history,
+                terminals_by_name=self.terminals_by_name,
+            )
+        raise UnexpectedCharacters(
+            lexer_state.text,
+            line_ctr.char_pos,
+            line_ctr.line,
+            line_ctr.column,
+            allowed=state.allowed,
+            token_history=history,
+            state=parser_state,
+            terminals_by_name=self.terminals_by_name,
+        )
+
+
+class LatexLexer(TrieLexer):
+    """Longest-match lexer for the LaTeX grammar
+
+    The LaTeX commands of the grammar are regular expression terminals, e.g.
+    `/\\alpha/`, one for every symbol of
+    :mod:`~py_asciimath.translation.latex2asciimath`. Here they are matched
+    as strings: a command, i.e. a backslash followed by letters or by a
+    single character, is scanned once and its terminal is found with a
+    dictionary lookup. A command that is not in the grammar is matched as
+    the longest command it starts with, as the regular expressions do, e.g.
+    `\\alphax` is `\\alpha` followed by `x`.
+
+    Args:
+        conf (lark.common.LexerConf): Configuration of the lexer
+    """
+
+    _command_re = re.compile(r"\\(?:[A-Za-z]+|[^A-Za-z])")
+
+    def __init__(self, conf):
+        super(LatexLexer, self).__init__(conf)
+        # Terminals of the commands, and the commands that are the start of
+        # a longer string, e.g. `\\mathbb` of `\\mathbb{R}`, looked up in
+        # the trie
+        self._commands = {}
+        self._prefixes = set()
+        for name, value in self._strings.items():
+            m = self._command_re.match(value)
+            if m is None:
+                continue
+            if m.end() == len(value):
+                self._commands[value] = name
+            else:
+                self._prefixes.add(m.group(0))
+
+    def _literal(self, pattern):
+        value = super(LatexLexer, self)._literal(pattern)
+        if (
+            value is None
+            and not pattern.flags
+            and pattern.value.startswith("\\\\")
+            and _LITERAL_RE.fullmatch(pattern.value)
+        ):
+            value = _ESCAPE_RE.sub(r"\1", pattern.value)
+        return value
+
+    def _longest_string(self, text, pos, strings):
+        if text.startswith("\\", pos):
+            m = self._command_re.match(text, pos)
+            if m is not None:
+                command = m.group(0)
+                name = self._commands.get(command)
+                if (
+                    name is not None
+                    and name in strings
+                    and command not in self._prefixes
+                ):
+                    return m.end(), name
+        return super(LatexLexer, self)._longest_string(text, pos, strings)
@@ -1,10 +1,14 @@
 import logging
 import re
+import threading
+from collections import namedtuple
 
 import lxml.etree
 
 from .. import PROJECT_ROOT
 
+CachedDTD = namedtuple("CachedDTD", ["dtd", "lock", "nsmap", "entities"])
+
 
 class MathMLParser(object):
 
@@ -15,6 +19,10 @@ class MathMLParser(object):
         r"(<!DOCTYPE math ([A-Z]+).*?mathml(\d)?\.dtd\">)", re.MULTILINE
     )
 
+    # Process-wide cache of the local MathML DTDs, see `get_dtd`
+    _dtds = {}
+    _dtds_lock = threading.Lock()
+
     def __init__(self, *args, **kwargs):  # pragma: no cover
         super(MathMLParser, self).__init__()
 
@@ -133,6 +141,25 @@ class MathMLParser(object):
             s = s[:start] + doctype + s[start:]
         return s
 
+    @classmethod
+    def set_tree_doctype(cls, tree, network, dtd=None):
+        """Set the MathML DOCTYPE of a XML document tree
+
+        Args:
+            tree (lxml.etree._ElementTree): XML document
+            network (bool): If True, set the PUBLIC MathML DTD;
+                otherwise use the local MathML DTD
+            dtd (str): Version of the MathML DTD. If None will be used
+                MathML3 DTD. Defaults to None
+        """
+        match = re.match(
+            r'<!DOCTYPE math (?:PUBLIC "(.*?)"|SYSTEM) "(.*?)">',
+            cls.get_doctype(dtd, network),
+        )
+        if match.group(1) is not None:
+            tree.docinfo.public_id = match.group(1)
+        tree.docinfo.system_url = match.group(2)
+
     @classmethod
     def get_doctype_version(cls, xml):
         """Get the MathML DTD version from DOCTYPE declaration
@@ -208,6 +235,89 @@ class MathMLParser(object):
             )
         return doctype
 
+    @classmethod
+    def get_dtd(cls, dtd=None):
+        """Get the local MathML DTD, loading it only the first time
+
+        The DTDs are cached process-wide, together with a lock that must be
+        held while validating against them, the namespace declarations
+        fixed by the DTD on the `math` element and the names of the
+        entities declared by the DTD
+
+        Args:
+            dtd (str, optional): MathML DTD version. Must be on of the
+                following: `mathml1`, `mathml2` or `mathml3`. If None will be
+                used MathML3 DTD. Defaults to None.
+
+        Raises:
+            NotImplementedError: Other DTD declarations but MathML
+                will be discarded
+
+        Returns:
+            CachedDTD: Named tuple with the DTD, its lock, the namespace
+                declarations and the entity names
+        """
+        dtd = "mathml3" if dtd is None else dtd.lower()
+        cached = cls._dtds.get(dtd)
+        if cached is None:
+            if dtd not in ("mathml1", "mathml2", "mathml3"):
+                raise NotImplementedError(
+                    "DTD validation only against MathML DTD 1, 2 or 3"
+                )
+            with cls._dtds_lock:
+                cached = cls._dtds.get(dtd)
+                if cached is None:
+                    logging.info("Loading " + dtd + " dtd...")
+                    mathml_dtd = lxml.etree.DTD(
+                        PROJECT_ROOT + "/dtd/" + dtd + "/" + dtd + ".dtd"
+                    )
+                    nsmap = {}
+                    for el in mathml_dtd.iterelements():
+                        if el.name == "math":
+                            nsmap = {
+                                attr.name: attr.default_value
+                                for attr in el.iterattributes()
+                                if attr.prefix == "xmlns"
+                                and attr.default_value is not None
+                            }
+                    cached = CachedDTD(
+                        mathml_dtd,
+                        threading.Lock(),
+                        nsmap,
+                        frozenset(e.name for e in mathml_dtd.iterentities()),
+                    )
+                    cls._dtds[dtd] = cached
+        return cached
+
+    @classmethod
+    def validate(cls, root, dtd=None):
+        """Validate a MathML XML against a cached local MathML DTD
+
+        Like a parser loading the DTD, check that every entity is declared
+        and declare on `root` the namespaces fixed by the DTD
+
+        Args:
+            root (lxml.etree._Element): Root of the MathML XML
+            dtd (str, optional): MathML DTD version. Must be on of the
+                following: `mathml1`, `mathml2` or `mathml3`. If None will be
+                used MathML3 DTD. Defaults to None.
+
+        Raises:
+            lxml.etree.DocumentInvalid: If the XML is not valid
+        """
+        mathml_dtd, lock, nsmap, entities = cls.get_dtd(dtd)
+        for entity in root.iter(lxml.etree.Entity):
+            if entity.name not in entities:
+                raise lxml.etree.DocumentInvalid(
+                    "Entity '" + entity.name + "' not defined"
+                )
+        with lock:
+            mathml_dtd.assertValid(root)
+        if nsmap:
+            lxml.etree.cleanup_namespaces(
+                root, top_nsmap=nsmap, keep_ns_prefixes=list(nsmap)
+            )
+
     @staticmethod
     def get_parser(
         dtd_validation=True,
@@ -249,6 +359,8 @@ class MathMLParser(object):
         network=False,
         ns_clean=True,
         resolve_entities=False,
+        parser=None,
+        cached_dtd=False,
         **kwargs
     ):  # pragma: no cover
         """Parse a MathML XML
@@ -268,12 +380,28 @@ class MathMLParser(object):
                 declarations. Defaults to True.
             resolve_entities (bool, optional): replace entities by their text
                 value. Defaults to False.
+            parser (lxml.etree.XMLParser, optional): Parser to reuse, as
+                returned by `get_parser`. If specified, `ns_clean`,
+                `resolve_entities` and the additional options are ignored.
+                Defaults to None.
+            cached_dtd (bool, optional): If True and `dtd_validation` is
+                True, parse without loading the DTD and validate the parsed
+                XML against the local DTD cached by `get_dtd`, which is much
+                faster. Entities are never resolved. Defaults to False.
             **kwargs: Additional ~lxml.extree.XMLParser options
 
+        Raises:
+            lxml.etree.DocumentInvalid: If `cached_dtd` is True and the XML
+                is not valid
+
         Returns:
             lxml.etree._Element: Root of the parsed and possibly
                 validated MathML XML
         """
+        if cached_dtd and dtd_validation:
+            return MathMLParser._parse_cached_dtd(
+                xml, dtd, from_file, network, ns_clean, parser, **kwargs
+            )
         if not from_file:
             encoding = MathMLParser.get_encoding(xml)
             if encoding is None:
@@ -284,14 +412,51 @@ class MathMLParser(object):
             xml = xml.encode(encoding)
         if dtd_validation:
             logging.info("Loading dtd and validating...")
-        mathml_parser = MathMLParser.get_parser(
-            dtd_validation=dtd_validation,
-            network=network,
-            ns_clean=ns_clean,
-            resolve_entities=resolve_entities,
-            **kwargs
-        )
+        if parser is not None:
+            mathml_parser = parser
+        else:
+            mathml_parser = MathMLParser.get_parser(
+                dtd_validation=dtd_validation,
+                network=network,
+                ns_clean=ns_clean,
+                resolve_entities=resolve_entities,
+                **kwargs
+            )
         if from_file:
             return lxml.etree.parse(xml, mathml_parser)
         else:
             return lxml.etree.fromstring(xml, mathml_parser)
+
+    @staticmethod
+    def _parse_cached_dtd(
+        xml, dtd, from_file, network, ns_clean, parser, **kwargs
+    ):  # pragma: no cover
+        if not from_file:
+            encoding = MathMLParser.get_encoding(xml)
+            if encoding is None:
+                logging.warning("The XML encoding is None: default to UTF-8")
+                encoding = "UTF-8"
+            xml = MathMLParser.set_doctype(xml, network, dtd=dtd).encode(
+                encoding
+            )
+        if parser is None:
+            parser = MathMLParser.get_parser(
+                dtd_validation=False,
+                network=network,
+                ns_clean=ns_clean,
+                resolve_entities=False,
+                **kwargs
+            )
+        if from_file:
+            parsed = lxml.etree.parse(xml, parser)
+            root = parsed.getroot()
+        else:
+            parsed = root = lxml.etree.fromstring(xml, parser)
+        version = MathMLParser.get_doctype_version(
+            root.getroottree().docinfo.doctype
+        )
+        logging.info("Validating against the cached dtd...")
+        MathMLParser.validate(
+            root, dtd="mathml" + version if version is not None else dtd
+        )
+        return parsed
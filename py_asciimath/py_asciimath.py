@@ -17,19 +17,45 @@ Usage:
                                     [options]
   py_asciimath.py from-file <PATH>  (-i <ILANG> | --input=ILANG) (-o <OLANG> | --output=OLANG)
                                     [options]
+  py_asciimath.py --batch <PATH>    from <ILANG> to <OLANG>
+                                    [options]
+  py_asciimath.py --batch <PATH>    (-i <ILANG> | --input=ILANG) (-o <OLANG> | --output=OLANG)
+                                    [options]
+  py_asciimath.py document <PATH>   from <ILANG> to <OLANG>
+                                    [options]
+  py_asciimath.py document <PATH>   (-i <ILANG> | --input=ILANG) (-o <OLANG> | --output=OLANG)
+                                    [options]
+  py_asciimath.py serve             [options]
   py_asciimath.py (-h | --help)
   py_asciimath.py --version
 
 Options:
+  --batch                       Translate the expressions read from PATH, one
+                                per line
   --dstyle                      Add display style
+  --format=FORMAT               Works only with --batch. Format of the
+                                expressions: lines or jsonl [default: lines]
+  --html                        Works only with document and ILANG=asciimath.
+                                Translate the math nodes of an HTML document
   -i <ILANG> --input=ILANG      Input language
                                 Supported input language: asciimath, latex, mathml
+  --jobs=N                      Works only with document and --batch.
+                                Translate the math with N worker processes
   --log                         Log the transformation process
+  --max-concurrency=N           Works only with serve. Maximum number of
+                                requests translated at once [default: 4]
   --network                     Works only with ILANG=mathnml or OLANG=mathml
                                 Use network to validate XML against DTD
   -o <OLANG> --output=OLANG     Output language
                                 Supported output language: latex, mathml
+  --on-error=POLICY             Works only with --batch. Policy for the
+                                expressions that can not be translated: skip,
+                                emit-error or abort [default: emit-error]
   --pprint                      Works only with OLANG=mathml. Pretty print
+  --server=ADDRESS              Forward the translations to the server
+                                listening on ADDRESS, which can be HOST:PORT,
+                                PORT or unix:PATH. With serve, listen on
+                                ADDRESS (by default 127.0.0.1:8765)
   --to-file=OPATH               Save translation to OPATH file
   --version                     Show version
   --xml-declaration             Works only with OLANG=mathml.Add the XML
@@ -37,18 +63,34 @@ Options:
   --xml-validate=MathMLDTD      Works only with OLANG=mathml
                                 Validate against a MathML DTD
                                 MathMLDTD can be: mathml1, mathml2 or mathml3
+
+The document command translates the math embedded in a text document, such
+as Markdown, read from PATH (or from the standard input if PATH is -):
+ASCIIMath between backticks if ILANG=asciimath, LaTeX between $...$, $$...$$
+or \\[...\\] if ILANG=latex. The rest of the document is left untouched.
+With --html, the document is HTML and the math is the content of the elements
+with class "math" and of the <script type="math/asciimath"> elements.
+
+With --batch, the expressions are read from PATH (or from the standard input
+if PATH is -) and their translations are written as soon as they are ready,
+one per line. With --format=jsonl, every line is a JSON string or a JSON
+object with the expression in its "exp" field, and every translation is
+written as the input object with the "translation" (or "error") field added.
+
+The serve command starts a translation server, which keeps the translators in
+memory and answers JSON requests over HTTP, on ADDRESS. Every other command
+sends its translations to the server listening on ADDRESS if --server=ADDRESS
+is given.
 """
+import signal
 import sys
 
 from docopt import docopt
 
 from . import __version__
-from .translator.translator import (
-    ASCIIMath2MathML,
-    ASCIIMath2Tex,
-    MathML2Tex,
-    Tex2ASCIIMath,
-)
+from .translator.batch import BatchTranslator
+from .translator.document import DocumentTranslator, HTMLTranslator
+from .translator.translator import get_translator
 
 _supported_ilang = ["asciimath", "latex", "mathml"]
 _supported_olang = ["asciimath", "latex", "mathml"]
@@ -56,6 +98,9 @@ _supported_olang = ["asciimath", "latex", "mathml"]
 
 def main():
     arguments = docopt(__doc__, version=__version__)
+    if arguments["serve"]:
+        serve(arguments)
+        sys.exit(0)
     ilang = (
         arguments["<ILANG>"].lower()
         if arguments["from"]
@@ -80,6 +125,31 @@ def main():
             "Translation from 'latex' to 'mathml' is still under development"
         )
         sys.exit(1)
+    if arguments["document"]:
+        if ilang == "mathml":
+            print("Supported <ILANG> with document: 'asciimath', 'latex'")
+            sys.exit(1)
+        if arguments["--html"] and ilang != "asciimath":
+            print("Supported <ILANG> with document --html: 'asciimath'")
+            sys.exit(1)
+        if arguments["--html"] and arguments["--server"]:
+            print("--server is not supported with document --html")
+            sys.exit(1)
+        translate_document(arguments, ilang, olang)
+        sys.exit(0)
+    if arguments["--batch"]:
+        if arguments["--format"] not in BatchTranslator.formats:
+            print("Supported FORMAT: " + ", ".join(BatchTranslator.formats))
+            sys.exit(1)
+        if arguments["--on-error"] not in BatchTranslator.policies:
+            print("Supported POLICY: " + ", ".join(BatchTranslator.policies))
+            sys.exit(1)
+        try:
+            translate_batch(arguments, ilang, olang)
+        except Exception as e:
+            print("Batch aborted: " + repr(e), file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
     exp = (
         "".join(arguments["<PATH>"])
         if arguments["from-file"]
@@ -87,7 +157,7 @@ def main():
     )
     if ilang == "asciimath":
         if olang == "latex":
-            parser = ASCIIMath2Tex(log=arguments["--log"], inplace=True)
+            parser = get_parser(arguments, "asciimath", "latex")
             print(
                 parser.translate(
                     exp,
@@ -98,7 +168,7 @@ def main():
                 )
             )
         elif olang == "mathml":
-            parser = ASCIIMath2MathML(log=arguments["--log"], inplace=True)
+            parser = get_parser(arguments, "asciimath", "mathml")
             validate = (
                 True if arguments["--xml-validate"] is not None else False
             )
@@ -118,7 +188,7 @@ def main():
             )
     elif ilang == "latex":
         if olang == "asciimath":
-            parser = Tex2ASCIIMath(log=arguments["--log"], inplace=True)
+            parser = get_parser(arguments, "latex", "asciimath")
             print(
                 parser.translate(
                     exp,
@@ -128,7 +198,7 @@ def main():
                 )
             )
     elif ilang == "mathml":
-        parser = MathML2Tex()
+        parser = get_parser(arguments, "mathml", "latex")
         print(
             parser.translate(
                 exp,
@@ -138,3 +208,110 @@ def main():
             )
         )
     sys.exit(0)
+
+
+def get_parser(arguments, ilang, olang):
+    """Return the translator from `ilang` to `olang` specified by the
+    command line `arguments`"""
+    if arguments["--server"]:
+        from .translator.server import RemoteTranslator, parse_address
+
+        return RemoteTranslator(
+            parse_address(arguments["--server"]), ilang, olang
+        )
+    if ilang == "mathml":
+        return get_translator(ilang, olang)
+    return get_translator(ilang, olang, log=arguments["--log"], inplace=True)
+
+
+def get_kwargs(arguments, ilang, olang):
+    """Return the keyword arguments to `translate(exp, **kwargs)` specified
+    by the command line `arguments`"""
+    kwargs = {"pprint": False}
+    if ilang == "asciimath":
+        kwargs["displaystyle"] = arguments["--dstyle"]
+    if olang == "mathml":
+        kwargs.update(
+            dtd=arguments["--xml-validate"],
+            dtd_validation=arguments["--xml-validate"] is not None,
+            network=arguments["--network"],
+            xml_declaration=arguments["--xml-declaration"],
+            xml_pprint=arguments["--pprint"],
+        )
+    elif ilang == "mathml":
+        kwargs = {"network": arguments["--network"]}
+    return kwargs
+
+
+def translate_batch(arguments, ilang, olang):
+    """Translate the expressions read from the file specified by the command
+    line `arguments`, one per line, streaming the translations to the
+    standard output or to a file"""
+    parser = get_parser(arguments, ilang, olang)
+    batch = BatchTranslator(
+        parser, format=arguments["--format"], on_error=arguments["--on-error"]
+    )
+    jobs = int(arguments["--jobs"]) if arguments["--jobs"] else None
+    path = arguments["<PATH>"]
+    src = sys.stdin if path == "-" else open(path)
+    to_file = arguments["--to-file"]
+    dst = sys.stdout if to_file is None else open(to_file, "w")
+    try:
+        batch.translate_stream(
+            src, dst, workers=jobs, **get_kwargs(arguments, ilang, olang)
+        )
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+
+def translate_document(arguments, ilang, olang):
+    """Translate the math embedded in the document specified by the command
+    line `arguments`, streaming it to the standard output or to a file"""
+    parser = get_parser(arguments, ilang, olang)
+    kwargs = get_kwargs(arguments, ilang, olang)
+    path = arguments["<PATH>"]
+    to_file = arguments["--to-file"]
+    if arguments["--html"]:
+        src = sys.stdin.buffer if path == "-" else open(path, "rb")
+        dst = (
+            sys.stdout
+            if to_file is None
+            else open(to_file, "w", encoding="utf-8")
+        )
+        document = HTMLTranslator(parser)
+    else:
+        kwargs["workers"] = (
+            int(arguments["--jobs"]) if arguments["--jobs"] else None
+        )
+        src = sys.stdin if path == "-" else open(path)
+        dst = sys.stdout if to_file is None else open(to_file, "w")
+        document = DocumentTranslator(parser)
+    try:
+        document.translate_stream(src, dst, **kwargs)
+    finally:
+        if src not in (sys.stdin, sys.stdin.buffer):
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+
+def serve(arguments):
+    """Start the translation server specified by the command line
+    `arguments`, until it is interrupted"""
+    from .translator.server import TranslationServer, parse_address
+
+    address = parse_address(arguments["--server"] or "127.0.0.1:8765")
+    server = TranslationServer(
+        address, max_concurrency=int(arguments["--max-concurrency"])
+    )
+    # Close the server, removing its Unix domain socket, when terminated
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
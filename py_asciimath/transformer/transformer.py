@@ -1,8 +1,11 @@
+import collections
+import copy
 import logging
 import re
-from functools import wraps
+from functools import lru_cache, wraps
 
-from lark import Transformer
+from lark import Token, Transformer, Tree
+from lark.visitors import Discard
 
 from ..translation.asciimath2latex import binary_functions as latex_bin
 from ..translation.asciimath2latex import left_parenthesis as latex_left
@@ -20,8 +23,12 @@ from ..translation.latex2asciimath import left_parenthesis as l2mml_left
 from ..translation.latex2asciimath import right_parenthesis as l2mml_right
 from ..translation.latex2asciimath import smb as l2mml_smb
 from ..translation.latex2asciimath import unary_functions as l2mml_una
+from ..utils.ast import Node
 from ..utils.log import Log
-from ..utils.utils import UtilsMat, encapsulate_mrow
+from ..utils.rope import Rope
+
+# Imported by ASCIIMath2MathMLTreeTransformer, the only transformer using it
+lxml = None
 
 # TODO: MathematicaTransformer
 """ class MathematicaTransformer(Transformer):
@@ -32,7 +39,36 @@ from ..utils.utils import UtilsMat, encapsulate_mrow
 # ["\\)", ":\\)", "\\]", "\\}", ":\\}"]
 
 
+class _Seq(Rope):
+    # Translation of a sequence of expressions, `start: i start*`, which
+    # keeps the translations of its items
+    __slots__ = ("items",)
+
+
+class _Group(Rope):
+    # Translation of a parenthesized expression. If it can be a row of a
+    # matrix, `row_par` is its left parenthesis and `cells` are the
+    # translations of the items of its content, split by the commas
+    __slots__ = ("row_par", "cells")
+
+
 class MathTransformer(Transformer):  # pragma: no cover
+    # Callbacks of the grammar rules
+    rules = [
+        "exp",
+        "exp_interm",
+        "exp_frac",
+        "exp_under",
+        "exp_super",
+        "exp_under_super",
+        "exp_par",
+        "exp_unary",
+        "exp_binary",
+        "symbol",
+        "const",
+        "q_str",
+    ]
+
     def __init__(
         self,
         log=True,
@@ -40,6 +76,8 @@ class MathTransformer(Transformer):  # pragma: no cover
         left_par=[],
         right_par=[],
         visit_tokens=False,
+        memoize=False,
+        memo_size=4096,
     ):
         Transformer.__init__(self, visit_tokens=visit_tokens)
         formatted_left_parenthesis = "|".join(left_par)
@@ -49,22 +87,240 @@ class MathTransformer(Transformer):  # pragma: no cover
                 formatted_left_parenthesis, formatted_right_parenthesis,
             )
         )
+        # Outer parenthesis that can be removed, for every couple of left
+        # and right parenthesis: see `group`
+        self._strip = {}
         self._logger_func = logging.info
         if not log:
             self._logger_func = lambda x: x
         self._logger = Log(logger_func=self._logger_func)
+        self.memoize = memoize
+        if memoize:
+            for rule in self.rules:
+                f = self._memoize(getattr(self, rule), memo_size)
+                setattr(self, rule, f)
+        # Logging is decided once: if disabled, the callbacks are left
+        # untouched; otherwise every callback marked with `log` is wrapped
+        if log:
+            for name in self._callbacks():
+                setattr(self, name, self._logger(getattr(self, name)))
+
+    def _callbacks(self):
+        # Names of the callbacks marked with `log`
+        cls = type(self)
+        return [
+            name
+            for name in dir(cls)
+            if getattr(getattr(cls, name, None), "_log", False)
+        ]
+
+    def set_tracer(self, tracer):
+        """Count and time the calls to every callback with `tracer`
+
+        Must be called before the transformer is passed to a parser.
+
+        Args:
+            tracer (Tracer): The tracer. See
+                :class:`~py_asciimath.utils.trace.Tracer`
+        """
+        for name in self._callbacks():
+            setattr(self, name, tracer.wrap(name, getattr(self, name)))
+
+    @staticmethod
+    def _memoize(f, maxsize):
+        # Identical subtrees are transformed into equal items: every
+        # callback is memoized on its items, so that an identical subtree is
+        # transformed only once across all the transformations. Memoized
+        # translations are returned as they are, hence their hash is
+        # computed only once, when they are used as items of the parent
+        cached = lru_cache(maxsize=maxsize)(lambda items: f(list(items)))
+
+        @wraps(f)
+        def memoized(items):
+            return cached(tuple(items))
+
+        memoized.cache_info = cached.cache_info
+        memoized.cache_clear = cached.cache_clear
+        return memoized
+
+    def clear_memo(self):
+        """Clear the memoized transformations, if `memoize` is True"""
+        if self.memoize:
+            for rule in self.rules:
+                getattr(self, rule).cache_clear()
+
+    def group(self, left, body, right):
+        """Return the translation `left + body + right` of a parenthesized
+        expression, as a rope whose `inner` attribute is the translation
+        without the outer parenthesis, so that `remove_parenthesis` does
+        not scan it
+
+        Whether the parenthesis can be removed, and what remains of them,
+        is decided once for every couple by `start_end_par_pattern`.
+
+        Args:
+            left (str): Translation of the left parenthesis
+            body (str or Rope): Translation of the content
+            right (str): Translation of the right parenthesis
+
+        Returns:
+            Rope: The translation
+        """
+        try:
+            strip = self._strip[(left, right)]
+        except KeyError:
+            # The content never contains a NUL character
+            m = self.start_end_par_pattern.match(left + "\0" + right)
+            strip = m.group(2).split("\0") if m else None
+            self._strip[(left, right)] = strip
+        s = _Group(left, body, right)
+        s.row_par = None
+        s.cells = None
+        if strip is not None:
+            s.inner = Rope(strip[0], body, strip[1]) if any(strip) else body
+        return s
 
     def remove_parenthesis(self, s):
-        return re.sub(self.start_end_par_pattern, r"\2", s)
+        if isinstance(s, Rope) and s.inner is not None:
+            return s.inner
+        return s
+
+    # Couples of parenthesis delimiting the rows of a matrix
+    _row_par = {"[": "]", "(": ")"}
+
+    @staticmethod
+    def _sequence(s):
+        # Translations of the items of the sequence `s`: the sequences are
+        # right-recursive, hence they are flattened without recursion
+        items = []
+        stack = [s]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, _Seq):
+                stack.extend(reversed(item.items))
+            else:
+                items.append(item)
+        return items
+
+    def _cells(self, items, comma):
+        # Translations `items` split by `comma`
+        cells = [[]]
+        for item in items:
+            if isinstance(item, str) and item == comma:
+                cells.append([])
+            else:
+                cells[-1].append(item)
+        return cells
+
+    def _rows(self, items, comma):
+        """Return the rows of the matrix whose content is translated as
+        `items`, or None if it is not a matrix
+
+        A matrix is made by at least two rows separated by `comma`, with an
+        optional trailing comma. Every row is parenthesized by the same
+        couple of `_row_par` and has the same number of columns. The
+        columns of the rows are known when the rows are translated, hence
+        the check takes time proportional to the number of `items`.
+
+        Args:
+            items (list): Translations of the items of the content
+            comma (str): Translation of the comma
+
+        Returns:
+            list: The rows, as lists of cells, or None
+        """
+        rows = []
+        for i, item in enumerate(items):
+            if i % 2:
+                if not (isinstance(item, str) and item == comma):
+                    return None
+            elif (
+                not isinstance(item, _Group)
+                or item.cells is None
+                or (rows and item.row_par != items[0].row_par)
+                or (rows and len(item.cells) != len(rows[0]))
+            ):
+                return None
+            else:
+                rows.append(item.cells)
+        return rows if len(rows) > 1 else None
+
+    def _mark_row(self, s, items, seq, comma, mat=None):
+        # Mark the translation `s` of the parenthesized expression `items`,
+        # whose content is translated as `seq`, as a row of a matrix if it
+        # is parenthesized by a couple of `_row_par`. A row whose content is
+        # the matrix `mat` has a single cell
+        if self._row_par.get(items[0]) == items[-1]:
+            s.row_par = items[0]
+            s.cells = [[mat]] if mat is not None else self._cells(seq, comma)
+        return s
+
+    def transform(self, tree):
+        """Transform `tree`, as :meth:`lark.Transformer.transform`, but
+        without recursion
+
+        The tree is visited in post-order with an explicit stack, hence its
+        depth is not bounded by the recursion limit. The sequences are
+        flattened: the right-recursive `exp` subtrees of a sequence,
+        `start: i start*`, are transformed with a single call to `exp`
+        with all the items, so that a long expression is transformed in
+        time proportional to its length.
+
+        Args:
+            tree (lark.Tree or Node): The tree to transform, a parse tree
+                or an abstract syntax tree, see
+                :class:`~py_asciimath.utils.ast.Node`
+
+        Returns:
+            object: The transformed tree
+        """
+        result = []
+        # Every frame is a subtree, the iterator of its children and their
+        # transformations
+        stack = [(None, iter([tree]), result)]
+        while stack:
+            tree, children, items = stack[-1]
+            for child in children:
+                if isinstance(child, (Tree, Node)):
+                    stack.append((child, iter(self._items(child)), []))
+                    break
+                try:
+                    if self.__visit_tokens__ and isinstance(child, Token):
+                        child = self._call_userfunc_token(child)
+                    items.append(child)
+                except Discard:
+                    pass
+            else:
+                stack.pop()
+                if tree is not None:
+                    try:
+                        stack[-1][2].append(self._call_userfunc(tree, items))
+                    except Discard:
+                        pass
+        return result[0]
+
+    @staticmethod
+    def _items(tree):
+        # Children of `tree`, where the children of the sequences that are
+        # items of a sequence are spliced in place of them
+        if tree.data != "exp":
+            return tree.children
+        items = []
+        stack = list(reversed(tree.children))
+        while stack:
+            child = stack.pop()
+            if isinstance(child, (Tree, Node)) and child.data == "exp":
+                stack.extend(reversed(child.children))
+            else:
+                items.append(child)
+        return items
 
     @classmethod
     def log(cls, f):
-        @wraps(f)
-        def decorator(*args, **kwargs):
-            self = args[0]
-            return self._logger.__call__(f)(*args, **kwargs)
-
-        return decorator
+        """Mark `f` as a callback to be logged, if logging is enabled
+        when the transformer is created"""
+        f._log = True
+        return f
 
     def exp(self, items):
         raise NotImplementedError
@@ -106,7 +362,9 @@ class MathTransformer(Transformer):  # pragma: no cover
 class ASCIIMath2TexTransformer(MathTransformer):
     """Trasformer class, read `lark.Transformer`."""
 
-    def __init__(self, log=True, visit_tokens=False):
+    def __init__(
+        self, log=True, visit_tokens=False, memoize=False, memo_size=4096
+    ):
         MathTransformer.__init__(
             self,
             log,
@@ -114,11 +372,15 @@ class ASCIIMath2TexTransformer(MathTransformer):
             ["\\(", "\\(:", "\\[", "\\{", "\\{:"],
             ["\\)", ":\\)", "\\]", "\\}", ":\\}"],
             visit_tokens,
+            memoize,
+            memo_size,
         )
 
     @MathTransformer.log
     def exp(self, items):
-        return " ".join(items)
+        s = _Seq.join(" ", items)
+        s.items = items
+        return s
 
     @MathTransformer.log
     def exp_interm(self, items):
@@ -128,42 +390,64 @@ class ASCIIMath2TexTransformer(MathTransformer):
     def exp_frac(self, items):
         items[0] = self.remove_parenthesis(items[0])
         items[1] = self.remove_parenthesis(items[1])
-        return "\\frac{" + items[0] + "}{" + items[1] + "}"
+        return Rope("\\frac{", items[0], "}{", items[1], "}")
 
     @MathTransformer.log
     def exp_under(self, items):
         items[1] = self.remove_parenthesis(items[1])
-        return "{" + items[0] + "}_{" + items[1] + "}"
+        return Rope("{", items[0], "}_{", items[1], "}")
 
     @MathTransformer.log
     def exp_super(self, items):
         items[1] = self.remove_parenthesis(items[1])
-        return "{" + items[0] + "}^{" + items[1] + "}"
+        return Rope("{", items[0], "}^{", items[1], "}")
 
     @MathTransformer.log
     def exp_under_super(self, items):
         items[1] = self.remove_parenthesis(items[1])
         items[2] = self.remove_parenthesis(items[2])
-        return "{" + items[0] + "}_{" + items[1] + "}^{" + items[2] + "}"
+        return Rope("{", items[0], "}_{", items[1], "}^{", items[2], "}")
+
+    @staticmethod
+    def _mat_row(cells):
+        # Row of a LaTeX matrix: empty cells are filled with `\null`
+        parts = []
+        for cell in cells[:-1]:
+            parts.extend(cell)
+            parts.append(" & " if cell else "\\null & ")
+        parts.extend(cells[-1])
+        row = Rope.join(" ", parts)
+        return row if cells[-1] else Rope(row, "\\null")
 
     @MathTransformer.log
     def exp_par(self, items):
-        yeah_mat = False
-        s = ", ".join(items[1:-1])
-        if s.startswith("\\left"):
-            yeah_mat, row_par = UtilsMat.check_mat(s)
-            if yeah_mat:
-                s = UtilsMat.get_latex_mat(s, row_par)
+        s = Rope.join(", ", items[1:-1])
+        seq = self._sequence(items[1]) if len(items) == 3 else []
+        mat = None
+        if self._rows(seq, ",") is not None:
+            mat = Rope(
+                "\\begin{matrix}",
+                Rope.join(
+                    " ",
+                    [
+                        " \\\\ " if i % 2 else self._mat_row(item.cells)
+                        for i, item in enumerate(seq)
+                    ],
+                ),
+                "\\end{matrix}",
+            )
         lpar = (
             "\\left"
             + latex_left[items[0]]
             + (" " if items[0] == "langle" else "")
         )
         rpar = "\\right" + latex_right[items[-1]]
-        return (
-            lpar
-            + ("\\begin{matrix}" + s + "\\end{matrix}" if yeah_mat else s)
-            + rpar
+        return self._mark_row(
+            self.group(lpar, mat if mat is not None else s, rpar),
+            items,
+            seq,
+            ",",
+            mat,
         )
 
     @MathTransformer.log
@@ -171,15 +455,15 @@ class ASCIIMath2TexTransformer(MathTransformer):
         unary = latex_una[items[0]]
         items[1] = self.remove_parenthesis(items[1])
         if unary == "norm":
-            return "\\left\\lVert " + items[1] + " \\right\\rVert"
+            return Rope("\\left\\lVert ", items[1], " \\right\\rVert")
         elif unary == "abs":
-            return "\\left\\mid " + items[1] + " \\right\\mid"
+            return Rope("\\left\\mid ", items[1], " \\right\\mid")
         elif unary == "floor":
-            return "\\left\\lfloor " + items[1] + " \\right\\rfloor"
+            return Rope("\\left\\lfloor ", items[1], " \\right\\rfloor")
         elif unary == "ceil":
-            return "\\left\\lceil " + items[1] + " \\right\\rceil"
+            return Rope("\\left\\lceil ", items[1], " \\right\\rceil")
         else:
-            return unary + "{" + items[1] + "}"
+            return Rope(unary, "{", items[1], "}")
 
     @MathTransformer.log
     def exp_binary(self, items):
@@ -187,9 +471,9 @@ class ASCIIMath2TexTransformer(MathTransformer):
         items[1] = self.remove_parenthesis(items[1])
         items[2] = self.remove_parenthesis(items[2])
         if binary == "\\sqrt":
-            return binary + "[" + items[1] + "]" + "{" + items[2] + "}"
+            return Rope(binary, "[", items[1], "]{", items[2], "}")
         else:
-            return binary + "{" + items[1] + "}" + "{" + items[2] + "}"
+            return Rope(binary, "{", items[1], "}{", items[2], "}")
 
     @MathTransformer.log
     def symbol(self, items):
@@ -201,9 +485,10 @@ class ASCIIMath2TexTransformer(MathTransformer):
 
     @MathTransformer.log
     def const(self, items):
-        if len(items[0].value) == 2 and items[0].value[0] == "d":
-            return "\\mathrm{" + items[0].value + "}"
-        return items[0].value
+        const = str(items[0])
+        if len(const) == 2 and const[0] == "d":
+            return "\\mathrm{" + const + "}"
+        return const
 
     @MathTransformer.log
     def q_str(self, items):
@@ -213,7 +498,9 @@ class ASCIIMath2TexTransformer(MathTransformer):
 class ASCIIMath2MathMLTransformer(MathTransformer):
     """Trasformer class, read `lark.Transformer`."""
 
-    def __init__(self, log=True, visit_tokens=False):
+    def __init__(
+        self, log=True, visit_tokens=False, memoize=False, memo_size=4096
+    ):
         MathTransformer.__init__(
             self,
             log,
@@ -225,11 +512,35 @@ class ASCIIMath2MathMLTransformer(MathTransformer):
             ["\\(", "\\(:", "\\[", "\\{", "\\{:"],
             ["\\)", ":\\)", "\\]", "\\}", ":\\}"],
             visit_tokens,
+            memoize,
+            memo_size,
         )
 
+    # Maximum length of `<mrow>color</mrow>`
+    _color_len = len("<mrow></mrow>") + max(len(c) for c in colors)
+
+    @staticmethod
+    def _mrow(s):
+        return Rope("<mrow>", s, "</mrow>")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _split(template):
+        return template.split("{}")
+
+    def _format(self, template, *args):
+        # Rope of `template` formatted with `args`, like `str.format`
+        parts = self._split(template)
+        rope = [parts[0]]
+        for arg, part in zip(args, parts[1:]):
+            rope.extend((arg, part))
+        return Rope(*rope)
+
     @MathTransformer.log
     def exp(self, items):
-        return "".join(items)
+        s = _Seq(*items)
+        s.items = items
+        return s
 
     @MathTransformer.log
     def exp_interm(self, items):
@@ -239,69 +550,84 @@ class ASCIIMath2MathMLTransformer(MathTransformer):
     def exp_frac(self, items):
         items[0] = self.remove_parenthesis(items[0])
         items[1] = self.remove_parenthesis(items[1])
-        return encapsulate_mrow(
-            "<mfrac>"
-            + encapsulate_mrow(items[0])
-            + encapsulate_mrow(items[1])
-            + "</mfrac>"
+        return self._mrow(
+            Rope(
+                "<mfrac>",
+                self._mrow(items[0]),
+                self._mrow(items[1]),
+                "</mfrac>",
+            )
         )
 
     @MathTransformer.log
     def exp_under(self, items):
         items[1] = self.remove_parenthesis(items[1])
-        return encapsulate_mrow(
-            "<msub>"
-            + encapsulate_mrow(items[0])
-            + encapsulate_mrow(items[1])
-            + "</msub>"
+        return self._mrow(
+            Rope(
+                "<msub>",
+                self._mrow(items[0]),
+                self._mrow(items[1]),
+                "</msub>",
+            )
         )
 
     @MathTransformer.log
     def exp_super(self, items):
         items[1] = self.remove_parenthesis(items[1])
-        return encapsulate_mrow(
-            "<msup>"
-            + encapsulate_mrow(items[0])
-            + encapsulate_mrow(items[1])
-            + "</msup>"
+        return self._mrow(
+            Rope(
+                "<msup>",
+                self._mrow(items[0]),
+                self._mrow(items[1]),
+                "</msup>",
+            )
         )
 
     @MathTransformer.log
     def exp_under_super(self, items):
         items[1] = self.remove_parenthesis(items[1])
         items[2] = self.remove_parenthesis(items[2])
-        return encapsulate_mrow(
-            "<msubsup>"
-            + encapsulate_mrow(items[0])
-            + encapsulate_mrow(items[1])
-            + encapsulate_mrow(items[2])
-            + "</msubsup>"
+        return self._mrow(
+            Rope(
+                "<msubsup>",
+                self._mrow(items[0]),
+                self._mrow(items[1]),
+                self._mrow(items[2]),
+                "</msubsup>",
+            )
         )
 
     @MathTransformer.log
     def exp_par(self, items):
-        yeah_mat = False
-        s = ", ".join(items[1:-1])
-        if re.match(
-            r"^<mrow><mo>(\[|\(|\{|\{:|\|:|\|\|:|<<|\(:|langle)</mo>", s
-        ):
-            yeah_mat, row_par = UtilsMat.check_mat(s)
-            if yeah_mat:
-                s = (
-                    "<mtable>"
-                    + UtilsMat.get_mathml_mat(s, row_par)
-                    + "</mtable>"
-                )
+        s = Rope.join(", ", items[1:-1])
+        seq = self._sequence(items[1]) if len(items) == 3 else []
+        rows = self._rows(seq, "<mo>,</mo>")
+        mat = None
+        if rows is not None:
+            mat = Rope(
+                "<mtable>",
+                *[
+                    Rope(
+                        "<mtr>",
+                        *[Rope("<mtd>", *cell, "</mtd>") for cell in row],
+                        "</mtr>"
+                    )
+                    for row in rows
+                ],
+                "</mtable>"
+            )
         lpar = mathml_left[items[0]]
         rpar = mathml_right[items[-1]]
-        return encapsulate_mrow(
-            "<mo>"
-            + lpar
-            + "</mo>"
-            + (encapsulate_mrow(s) if not yeah_mat else s)
-            + "<mo>"
-            + rpar
-            + "</mo>"
+        return self._mark_row(
+            self.group(
+                "<mrow><mo>" + lpar + "</mo>",
+                mat if mat is not None else self._mrow(s),
+                "<mo>" + rpar + "</mo></mrow>",
+            ),
+            items,
+            seq,
+            "<mo>,</mo>",
+            mat,
         )
 
     @MathTransformer.log
@@ -309,27 +635,30 @@ class ASCIIMath2MathMLTransformer(MathTransformer):
         unary = mathml_una[items[0]]
         items[1] = self.remove_parenthesis(items[1])
         if items[0] == "text":
-            return encapsulate_mrow(
-                unary.format(re.sub(r"<.*?>", "", items[1]))
+            return self._mrow(
+                self._format(unary, re.sub(r"<.*?>", "", str(items[1])))
             )
-        return encapsulate_mrow(unary.format(encapsulate_mrow(items[1])))
+        return self._mrow(self._format(unary, self._mrow(items[1])))
 
     @MathTransformer.log
     def exp_binary(self, items):
         binary = mathml_bin[items[0]]
         items[1] = self.remove_parenthesis(items[1])
         items[2] = self.remove_parenthesis(items[2])
-        if items[1][6:-7] in colors:
-            s = binary.format(items[1][6:-7], encapsulate_mrow(items[2]))
+        color = (
+            str(items[1])[6:-7] if len(items[1]) <= self._color_len else None
+        )
+        if color in colors:
+            s = self._format(binary, color, self._mrow(items[2]))
         elif items[0] != "root":
-            s = binary.format(
-                encapsulate_mrow(items[1]), encapsulate_mrow(items[2]),
+            s = self._format(
+                binary, self._mrow(items[1]), self._mrow(items[2])
             )
         else:
-            s = binary.format(
-                encapsulate_mrow(items[2]), encapsulate_mrow(items[1]),
+            s = self._format(
+                binary, self._mrow(items[2]), self._mrow(items[1])
             )
-        return encapsulate_mrow(s)
+        return self._mrow(s)
 
     @MathTransformer.log
     def symbol(self, items):
@@ -343,15 +672,523 @@ class ASCIIMath2MathMLTransformer(MathTransformer):
     @MathTransformer.log
     def const(self, items):
         if items[0].isnumeric():
-            return "<mn>" + items[0].value + "</mn>"
+            return "<mn>" + str(items[0]) + "</mn>"
         else:
-            return "<mi>" + items[0].value + "</mi>"
+            return "<mi>" + str(items[0]) + "</mi>"
 
     @MathTransformer.log
     def q_str(self, items):
         return "<mtext>" + items[0].strip('"') + "</mtext>"
 
 
+class ASCIIMath2MathMLTreeTransformer(MathTransformer):
+    """Trasformer class, read `lark.Transformer`.
+
+    Build the MathML tree directly with `lxml.etree`, instead of building a
+    string that must be parsed again. Every callback returns the list of the
+    nodes of a subexpression: elements, entities and strings of text. The
+    returned elements have no tail: text is always a separate node.
+    """
+
+    _ns = "http://www.w3.org/1998/Math/MathML"
+    _nsmap = {None: _ns}
+    # Parenthesis removed by `remove_parenthesis`
+    _left_par = ("(", "(:", "[", "{", "{:")
+    _right_par = (")", ":)", "]", "}", ":}")
+    _ref_pattern = re.compile(r"&(#x[0-9a-fA-F]+|#[0-9]+|\w+);")
+    _predefined = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "apos": "'"}
+
+    def __init__(self, log=True, visit_tokens=False):
+        global lxml
+        import lxml.etree
+
+        MathTransformer.__init__(
+            self,
+            log,
+            r"^(?:<mrow>)?"
+            r"(?:<mo>(?:({}))</mo>)"
+            r"(.*?)"
+            r"(?:<mo>(?:({}))</mo>)"
+            r"(?:</mrow>)?$",
+            ["\\(", "\\(:", "\\[", "\\{", "\\{:"],
+            ["\\)", ":\\)", "\\]", "\\}", ":\\}"],
+            visit_tokens,
+        )
+        self._templates = {}
+
+    def _tag(self, tag):
+        return "{" + self._ns + "}" + tag
+
+    def _element(self, tag, nodes=()):
+        el = lxml.etree.Element(self._tag(tag), nsmap=self._nsmap)
+        self._insert(el, 0, nodes)
+        return el
+
+    @staticmethod
+    def _insert(parent, index, nodes):
+        # Insert `nodes` in `parent` at `index`, appending the strings to
+        # the text of `parent` or to the tail of the previous node. The
+        # nodes inserted after the last child are appended, since inserting
+        # at an index takes time proportional to it
+        prev = parent[index - 1] if index > 0 else None
+        append = index == len(parent)
+        for node in nodes:
+            if isinstance(node, str):
+                if prev is None:
+                    parent.text = (parent.text or "") + node
+                else:
+                    prev.tail = (prev.tail or "") + node
+            else:
+                node.tail = None
+                if append:
+                    parent.append(node)
+                else:
+                    parent.insert(index, node)
+                index = index + 1
+                prev = node
+
+    @staticmethod
+    def _children(el):
+        # Nodes of `el`, with the tails of its children as separate strings
+        nodes = [el.text] if el.text else []
+        for child in el:
+            nodes.append(child)
+            if child.tail:
+                nodes.append(child.tail)
+        return nodes
+
+    @staticmethod
+    def _text(nodes):
+        return "".join(
+            node
+            if isinstance(node, str)
+            else "".join(node.itertext()) + (node.tail or "")
+            for node in nodes
+        )
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _refs(cls, s):
+        # Split `s` into strings and names of the entities referenced by it
+        parts = []
+        for i, part in enumerate(re.split(cls._ref_pattern, s)):
+            if i % 2 == 0:
+                if part != "":
+                    parts.append((False, part))
+            elif part.startswith("#x"):
+                parts.append((False, chr(int(part[2:], 16))))
+            elif part.startswith("#"):
+                parts.append((False, chr(int(part[1:]))))
+            elif part in cls._predefined:
+                parts.append((False, cls._predefined[part]))
+            else:
+                parts.append((True, part))
+        return tuple(parts)
+
+    def _content(self, s):
+        # Nodes of a string of MathML text, with entity references
+        return [
+            lxml.etree.Entity(part) if entity else part
+            for entity, part in self._refs(s)
+        ]
+
+    def _is_mo(self, node, texts):
+        return (
+            not isinstance(node, str)
+            and node.tag == self._tag("mo")
+            and len(node) == 0
+            and not node.attrib
+            and node.text is not None
+            and node.text in texts
+        )
+
+    def _is_par(self, node, left_par, right_par):
+        return (
+            not isinstance(node, str)
+            and node.tag == self._tag("mrow")
+            and node.text is None
+            and not node.attrib
+            and len(node) > 1
+            and node[-1].tail is None
+            and self._is_mo(node[0], left_par)
+            and self._is_mo(node[-1], right_par)
+        )
+
+    def _template(self, s):
+        # Parse a MathML template: `{}` in text are replaced by `slot`
+        # elements, while `{}` in attribute values are kept
+        template = self._templates.get(s)
+        if template is None:
+            xml = re.sub(r"\{\}(?![^<]*>)", "<slot/>", s)
+            xml = re.sub(
+                self._ref_pattern,
+                lambda m: m.group(0)
+                if m.group(1).startswith("#") or m.group(1) in self._predefined
+                else "<entity name='" + m.group(1) + "'/>",
+                xml,
+            )
+            template = lxml.etree.fromstring(
+                "<t xmlns='" + self._ns + "'>" + xml + "</t>"
+            )
+            for el in list(template.iter(self._tag("entity"))):
+                entity = lxml.etree.Entity(el.get("name"))
+                entity.tail = el.tail
+                el.addprevious(entity)
+                el.getparent().remove(el)
+            self._templates[s] = template
+        return template
+
+    def _fill(self, s, *args):
+        # Nodes of the template `s`, with its slots filled by `args`
+        t = copy.deepcopy(self._template(s))
+        args = iter(args)
+        for el in list(t.iter(lxml.etree.Element)):
+            for k, v in el.attrib.items():
+                if v == "{}":
+                    arg = next(args)
+                    el.set(k, arg if isinstance(arg, str) else self._text(arg))
+            if el.tag == self._tag("slot"):
+                parent = el.getparent()
+                index = parent.index(el)
+                tail = el.tail
+                parent.remove(el)
+                arg = next(args)
+                if isinstance(arg, str):
+                    arg = [arg]
+                self._insert(parent, index, arg + ([tail] if tail else []))
+        return self._children(t)
+
+    def remove_parenthesis(self, nodes):
+        if len(nodes) == 1 and self._is_par(
+            nodes[0], self._left_par, self._right_par
+        ):
+            return self._children(nodes[0])[1:-1]
+        return nodes
+
+    def _mat(self, nodes):
+        # Table of the matrix whose rows are `nodes`, or None if there are
+        # less than two rows or they are not all parenthesized by the same
+        # couple of `_row_par` and with the same columns
+        rows = []
+        row_par = None
+        expect_row = True
+        for node in nodes:
+            if expect_row:
+                if row_par is None:
+                    if not self._is_par(
+                        node, self._row_par, self._row_par.values()
+                    ):
+                        return None
+                    row_par = (node[0].text, self._row_par[node[0].text])
+                if not self._is_par(node, row_par[0], row_par[1]):
+                    return None
+                inner = node[1]
+                if len(node) != 3 or inner.tail is not None:
+                    return None
+                if inner.tag == self._tag("mtable"):
+                    row = [[inner]]
+                elif inner.tag != self._tag("mrow"):
+                    return None
+                else:
+                    row = [[]]
+                    for child in self._children(inner):
+                        if self._is_mo(child, ","):
+                            row.append([])
+                        else:
+                            row[-1].append(child)
+                if rows and len(row) != len(rows[0]):
+                    return None
+                rows.append(row)
+                expect_row = False
+            elif self._is_mo(node, ","):
+                expect_row = True
+            else:
+                return None
+        if len(rows) < 2:
+            return None
+        mtable = self._element("mtable")
+        for row in rows:
+            mtr = lxml.etree.SubElement(mtable, self._tag("mtr"))
+            for cell in row:
+                mtd = lxml.etree.SubElement(mtr, self._tag("mtd"))
+                self._insert(mtd, 0, cell)
+        return mtable
+
+    def math(self, nodes, displaystyle=False, namespace=True):
+        """Build the `math` element of the MathML document
+
+        Args:
+            nodes (list): Nodes of the translated expression
+            displaystyle (bool, optional): Add displaystyle attribute.
+                Defaults to False.
+            namespace (bool, optional): If False, the elements are not in
+                the MathML namespace, as required by MathML1.
+                Defaults to True.
+
+        Returns:
+            lxml.etree._Element: The `math` element
+        """
+        math = self._element("math")
+        if displaystyle:
+            mstyle = lxml.etree.SubElement(
+                math, self._tag("mstyle"), displaystyle="true"
+            )
+            self._insert(mstyle, 0, nodes)
+        else:
+            self._insert(math, 0, nodes)
+        if not namespace:
+            for el in math.iter(lxml.etree.Element):
+                el.tag = lxml.etree.QName(el).localname
+            lxml.etree.cleanup_namespaces(math)
+        return math
+
+    @MathTransformer.log
+    def exp(self, items):
+        # The sequences are right-recursive when built by the parser: the
+        # nodes of the items are prepended to the ones of the last item,
+        # a deque returned by `exp` itself, in time proportional to their
+        # number
+        nodes = items[-1]
+        if not isinstance(nodes, collections.deque):
+            nodes = collections.deque(nodes)
+        for item in reversed(items[:-1]):
+            nodes.extendleft(reversed(item))
+        return nodes
+
+    @MathTransformer.log
+    def exp_interm(self, items):
+        return items[0]
+
+    @MathTransformer.log
+    def exp_frac(self, items):
+        items[0] = self.remove_parenthesis(items[0])
+        items[1] = self.remove_parenthesis(items[1])
+        return [
+            self._element(
+                "mrow",
+                [
+                    self._element(
+                        "mfrac",
+                        [
+                            self._element("mrow", items[0]),
+                            self._element("mrow", items[1]),
+                        ],
+                    )
+                ],
+            )
+        ]
+
+    def _script(self, tag, items):
+        return [
+            self._element(
+                "mrow",
+                [
+                    self._element(
+                        tag, [self._element("mrow", item) for item in items]
+                    )
+                ],
+            )
+        ]
+
+    @MathTransformer.log
+    def exp_under(self, items):
+        items[1] = self.remove_parenthesis(items[1])
+        return self._script("msub", items)
+
+    @MathTransformer.log
+    def exp_super(self, items):
+        items[1] = self.remove_parenthesis(items[1])
+        return self._script("msup", items)
+
+    @MathTransformer.log
+    def exp_under_super(self, items):
+        items[1] = self.remove_parenthesis(items[1])
+        items[2] = self.remove_parenthesis(items[2])
+        return self._script("msubsup", items)
+
+    @MathTransformer.log
+    def exp_par(self, items):
+        nodes = items[1] if len(items) == 3 else []
+        mat = self._mat(nodes)
+        mrow = self._element("mrow")
+        lpar = lxml.etree.SubElement(mrow, self._tag("mo"))
+        self._insert(lpar, 0, self._content(mathml_left[items[0]]))
+        mrow.append(mat if mat is not None else self._element("mrow", nodes))
+        rpar = lxml.etree.SubElement(mrow, self._tag("mo"))
+        self._insert(rpar, 0, self._content(mathml_right[items[-1]]))
+        return [mrow]
+
+    @MathTransformer.log
+    def exp_unary(self, items):
+        unary = mathml_una[items[0]]
+        items[1] = self.remove_parenthesis(items[1])
+        if items[0] == "text":
+            nodes = [
+                node
+                if isinstance(node, str)
+                else lxml.etree.Entity(node.name)
+                for node in self._flatten(items[1])
+            ]
+            return [self._element("mrow", self._fill(unary, nodes))]
+        return [
+            self._element(
+                "mrow", self._fill(unary, [self._element("mrow", items[1])])
+            )
+        ]
+
+    def _flatten(self, nodes):
+        # Strings and entities of `nodes`, in document order, visited with
+        # an explicit stack: a string is pushed after the children of its
+        # element, to be yielded after them
+        stack = list(reversed(nodes))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                yield node
+                continue
+            if node.tail:
+                stack.append(node.tail)
+            if node.tag is lxml.etree.Entity:
+                yield node
+            else:
+                stack.extend(reversed(node))
+                if node.text:
+                    yield node.text
+
+    @MathTransformer.log
+    def exp_binary(self, items):
+        binary = mathml_bin[items[0]]
+        items[1] = self.remove_parenthesis(items[1])
+        items[2] = self.remove_parenthesis(items[2])
+        if (
+            len(items[1]) == 1
+            and not isinstance(items[1][0], str)
+            and items[1][0].tag == self._tag("mrow")
+            and len(items[1][0]) == 0
+            and items[1][0].text in colors
+        ):
+            nodes = self._fill(
+                binary, items[1][0].text, [self._element("mrow", items[2])]
+            )
+        elif items[0] != "root":
+            nodes = self._fill(
+                binary,
+                [self._element("mrow", items[1])],
+                [self._element("mrow", items[2])],
+            )
+        else:
+            nodes = self._fill(
+                binary,
+                [self._element("mrow", items[2])],
+                [self._element("mrow", items[1])],
+            )
+        return [self._element("mrow", nodes)]
+
+    @MathTransformer.log
+    def symbol(self, items):
+        if items[0] in colors:
+            return [str(items[0])]
+        elif items[0] == "\\":
+            return [self._element("mo", [lxml.etree.Entity("setminus")])]
+        else:
+            return [self._element("mo", self._content(mathml_smb[items[0]]))]
+
+    @MathTransformer.log
+    def const(self, items):
+        if items[0].isnumeric():
+            return [self._element("mn", [str(items[0])])]
+        else:
+            return [self._element("mi", [str(items[0])])]
+
+    @MathTransformer.log
+    def q_str(self, items):
+        return [self._element("mtext", self._content(items[0].strip('"')))]
+
+
+class ASCIIMath2ASTTransformer(MathTransformer):
+    """Trasformer class, read `lark.Transformer`.
+
+    Build the abstract syntax tree of the expression, see
+    :class:`~py_asciimath.utils.ast.Node`, that is translated later by the
+    other ASCIIMath transformers. The right-recursive sequences built by
+    the parser are flattened by `sequence` when they are complete, i.e. in
+    a parenthesized expression and at the top.
+    """
+
+    def __init__(self, log=True, visit_tokens=False):
+        MathTransformer.__init__(self, log, visit_tokens=visit_tokens)
+
+    @staticmethod
+    def _node(data, items):
+        return Node(
+            data,
+            [item if isinstance(item, Node) else str(item) for item in items],
+        )
+
+    def sequence(self, node):
+        """Flatten the sequence `node` in place, if it is one
+
+        Args:
+            node (Node): The node
+
+        Returns:
+            Node: The node
+        """
+        if isinstance(node, Node) and node.data == "exp":
+            node.children = self._items(node)
+        return node
+
+    @MathTransformer.log
+    def exp(self, items):
+        return self._node("exp", items)
+
+    @MathTransformer.log
+    def exp_interm(self, items):
+        return self._node("exp_interm", items)
+
+    @MathTransformer.log
+    def exp_frac(self, items):
+        return self._node("exp_frac", items)
+
+    @MathTransformer.log
+    def exp_under(self, items):
+        return self._node("exp_under", items)
+
+    @MathTransformer.log
+    def exp_super(self, items):
+        return self._node("exp_super", items)
+
+    @MathTransformer.log
+    def exp_under_super(self, items):
+        return self._node("exp_under_super", items)
+
+    @MathTransformer.log
+    def exp_par(self, items):
+        if len(items) == 3:
+            self.sequence(items[1])
+        return self._node("exp_par", items)
+
+    @MathTransformer.log
+    def exp_unary(self, items):
+        return self._node("exp_unary", items)
+
+    @MathTransformer.log
+    def exp_binary(self, items):
+        return self._node("exp_binary", items)
+
+    @MathTransformer.log
+    def symbol(self, items):
+        return self._node("symbol", items)
+
+    @MathTransformer.log
+    def const(self, items):
+        return self._node("const", items)
+
+    @MathTransformer.log
+    def q_str(self, items):
+        return self._node("q_str", items)
+
+
 class Tex2ASCIIMathTransformer(MathTransformer):  # pragma: no cover
     def __init__(self, log=True, visit_tokens=False):
         MathTransformer.__init__(
@@ -363,17 +1200,13 @@ class Tex2ASCIIMathTransformer(MathTransformer):  # pragma: no cover
             visit_tokens=visit_tokens,
         )
 
-    def log(f):
-        @wraps(f)
-        def decorator(*args, **kwargs):
-            self = args[0]
-            return self._logger.__call__(f)(*args, **kwargs)
-
-        return decorator
+    log = MathTransformer.log
 
     @log
     def exp(self, items):
-        return " ".join(items)
+        if len(items) == 1 and isinstance(items[0], Rope):
+            return items[0]
+        return Rope.join(" ", items)
 
     @log
     def exp_interm(self, items):
@@ -383,26 +1216,26 @@ class Tex2ASCIIMathTransformer(MathTransformer):  # pragma: no cover
     def exp_frac(self, items):
         items[0] = self.remove_parenthesis(items[0])
         items[1] = self.remove_parenthesis(items[1])
-        return "(" + items[0] + ")/(" + items[1] + ")"
+        return Rope("(", items[0], ")/(", items[1], ")")
 
     @log
     def exp_under(self, items):
         items[0] = self.remove_parenthesis(items[0])
         items[1] = self.remove_parenthesis(items[1])
-        return "(" + items[0] + ")_(" + items[1] + ")"
+        return Rope("(", items[0], ")_(", items[1], ")")
 
     @log
     def exp_super(self, items):
         items[0] = self.remove_parenthesis(items[0])
         items[1] = self.remove_parenthesis(items[1])
-        return "(" + items[0] + ")^(" + items[1] + ")"
+        return Rope("(", items[0], ")^(", items[1], ")")
 
     @log
     def exp_under_super(self, items):
         items[0] = self.remove_parenthesis(items[0])
         items[1] = self.remove_parenthesis(items[1])
         items[2] = self.remove_parenthesis(items[2])
-        return "(" + items[0] + ")_(" + items[1] + ")^(" + items[2] + ")"
+        return Rope("(", items[0], ")_(", items[1], ")^(", items[2], ")")
 
     @log
     def exp_par(self, items):
@@ -420,17 +1253,17 @@ class Tex2ASCIIMathTransformer(MathTransformer):  # pragma: no cover
             right = ":|"
         elif right != "]":
             right = l2mml_right[items[-1].value]
-        return left + " ".join(items[1:-1]) + right
+        return self.group(left, Rope.join(" ", items[1:-1]), right)
 
     @log
     def exp_unary(self, items):
-        return l2mml_una[items[0]] + "(" + items[1] + ")"
+        return Rope(l2mml_una[items[0]], "(", items[1], ")")
 
     @log
     def exp_binary(self, items):
         if items[0].startswith("\\sqrt"):
-            return "root(" + "".join(items[1:-1]) + ")(" + items[-1] + ")"
-        return l2mml_bin[items[0]] + "(" + items[1] + ")(" + items[2] + ")"
+            return Rope("root(", Rope(*items[1:-1]), ")(", items[-1], ")")
+        return Rope(l2mml_bin[items[0]], "(", items[1], ")(", items[2], ")")
 
     @log
     def symbol(self, items):
@@ -444,21 +1277,13 @@ class Tex2ASCIIMathTransformer(MathTransformer):  # pragma: no cover
     def q_str(self, items):
         return items
 
-    def _get_row(self, items, sep="&", mat=False):
-        s = ""
-        for i in items:
-            if i == sep:
-                i = ","
-            s = s + i
-        if mat:
-            return "{:" + s + ":}"
-        else:
-            return "[" + s + "]"
+    def _get_row(self, items, sep="&"):
+        return Rope(*["," if i == sep else i for i in items])
 
     @log
     def exp_mat(self, items):
-        return self._get_row(items, sep="\\\\", mat=True)
+        return self.group("{:", self._get_row(items, sep="\\\\"), ":}")
 
     @log
     def row_mat(self, items):
-        return self._get_row(items, sep="&")
+        return Rope("[", self._get_row(items, sep="&"), "]")
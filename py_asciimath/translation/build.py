@@ -0,0 +1,178 @@
+from collections import OrderedDict
+from itertools import islice
+
+from .. import PROJECT_ROOT, asciimath, latex
+from ..utils.utils import alias_string
+
+TABLES_PATH = PROJECT_ROOT + "/translation/tables.py"
+
+# Tables of every translation, computed from the symbols of the input
+# language module
+_tables = ("unary_functions", "binary_functions", "left_parenthesis")
+_tables = _tables + ("right_parenthesis", "colors")
+# Symbol groups merged, in this order, into the `smb` table
+_asciimath_smb = (
+    "misc_symbols",
+    "colors",
+    "function_symbols",
+    "relation_symbols",
+    "logical_symbols",
+    "operation_symbols",
+    "greek_letters",
+    "arrows",
+)
+_latex_smb = (
+    "misc_symbols",
+    "function_symbols",
+    "colors",
+    "relation_symbols",
+    "logical_symbols",
+    "operation_symbols",
+    "greek_letters",
+    "arrows",
+)
+# Name of the tables of every translation: (module, lang_to, smb groups)
+_translations = OrderedDict(
+    [
+        ("asciimath2latex", (asciimath, "latex", _asciimath_smb)),
+        ("asciimath2mathml", (asciimath, "mathml", _asciimath_smb)),
+        ("latex2asciimath", (latex, "asciimath", _latex_smb)),
+    ]
+)
+
+
+def get_symbol_tables(module, lang_to, smb_groups):
+    """Compute the symbol tables of a translation from the symbols of
+    `module`
+
+    Args:
+        module (module): `py_asciimath.asciimath` or `py_asciimath.latex`
+        lang_to (str): Output language, or None to keep only the symbols
+        smb_groups (tuple): Symbol groups merged into the `smb` table
+
+    Returns:
+        OrderedDict: The tables by name. The symbols of `smb` are sorted by
+            decreasing length
+    """
+    tables = OrderedDict(
+        (name, module.get_symbols_for(name, lang_to)) for name in _tables
+    )
+    smb = {}
+    for group in smb_groups:
+        smb.update(module.get_symbols_for(group, lang_to))
+    tables["smb"] = dict(sorted(smb.items(), key=lambda x: (-len(x[0]), x[0])))
+    return tables
+
+
+def _format_grammar(template, tables, lang_from=None):
+    smb = tables["smb"]
+    return template.format(
+        alias_string(
+            tables["left_parenthesis"], alias=False, lang_from=lang_from
+        ),
+        alias_string(
+            tables["right_parenthesis"], alias=False, lang_from=lang_from
+        ),
+        alias_string(
+            tables["binary_functions"], alias=False, lang_from=lang_from
+        ),
+        alias_string(
+            tables["unary_functions"], alias=False, lang_from=lang_from
+        ),
+        alias_string(
+            dict(islice(smb.items(), len(smb) // 2)),
+            alias=False,
+            lang_from=lang_from,
+        ),
+        alias_string(
+            dict(islice(smb.items(), len(smb) // 2, len(smb))),
+            alias=False,
+            lang_from=lang_from,
+        ),
+    )
+
+
+def get_tables():
+    """Compute every table stored in `py_asciimath.translation.tables`: the
+    symbol tables of every translation and the grammars built from them
+
+    Returns:
+        OrderedDict: The tables by name
+    """
+    from ..grammar.asciimath_grammar import template as asciimath_template
+    from ..grammar.latex_grammar import template as latex_template
+
+    tables = OrderedDict(
+        (name, get_symbol_tables(*args))
+        for name, args in _translations.items()
+    )
+    tables["asciimath_grammar"] = _format_grammar(
+        asciimath_template, tables["asciimath2latex"]
+    )
+    tables["latex_grammar"] = _format_grammar(
+        latex_template, tables["latex2asciimath"], lang_from="latex"
+    )
+    return tables
+
+
+def _format_value(value, indent):
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        lines = ["{"]
+        for k, v in value.items():
+            lines.append(
+                indent
+                + "    "
+                + repr(k)
+                + ": "
+                + _format_value(v, indent + "    ")
+                + ","
+            )
+        lines.append(indent + "}")
+        return "\n".join(lines)
+    if isinstance(value, str) and "\n" in value:
+        # One line of the grammar per line of the module
+        lines = ["("]
+        for line in value.splitlines(True):
+            lines.append(indent + "    " + repr(line))
+        lines.append(indent + ")")
+        return "\n".join(lines)
+    return repr(value)
+
+
+def format_tables(tables):
+    """Format `tables` as the source of `py_asciimath.translation.tables`
+
+    Args:
+        tables (OrderedDict): Tables by name, see :func:`get_tables`
+
+    Returns:
+        str: Source of the module
+    """
+    source = [
+        "# Generated by `python -m py_asciimath.translation.build` from the",
+        "# symbols of py_asciimath/asciimath.py and py_asciimath/latex.py and",
+        "# from the grammar templates: do not edit",
+        "# flake8: noqa",
+        "",
+    ]
+    for name, value in tables.items():
+        source.append(name + " = " + _format_value(value, ""))
+    return "\n".join(source) + "\n"
+
+
+def build_tables():  # pragma: no cover
+    """Write `py_asciimath.translation.tables`: the symbol tables and the
+    grammars are stored as literals, loaded from the bytecode cache instead of
+    being computed at every start-up. Run it after changing the symbols or the
+    grammar templates, then rebuild the bundled parser tables with
+    :func:`~py_asciimath.grammar.cache.build_bundled_tables`
+    """
+    source = format_tables(get_tables())
+    with open(TABLES_PATH, "w") as f:
+        f.write(source)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    build_tables()
@@ -0,0 +1,1425 @@
+# Generated by `python -m py_asciimath.translation.build` from the
+# symbols of py_asciimath/asciimath.py and py_asciimath/latex.py and
+# from the grammar templates: do not edit
+# flake8: noqa
+
+asciimath2latex = {
+    'unary_functions': {
+        'sqrt': '\\sqrt',
+        'text': '\\textrm',
+        'abs': 'abs',
+        'floor': 'floor',
+        'ceil': 'ceil',
+        'norm': 'norm',
+        'ubrace': '\\underbrace',
+        'underbrace': '\\underbrace',
+        'obrace': '\\overbrace',
+        'overbrace': '\\overbrace',
+        'cancel': '\\cancel',
+        'bb': '\\boldsymbol',
+        'bbb': '\\mathbb',
+        'cc': '\\mathcal',
+        'tt': '\\texttt',
+        'fr': '\\mathfrak',
+        'sf': '\\textsf',
+        'ul': '\\underline',
+        'underline': '\\underline',
+        'bar': '\\overline',
+        'overline': '\\overline',
+        'hat': '\\hat',
+        'vec': '\\vec',
+        'dot': '\\dot',
+        'ddot': '\\ddot',
+        'dstyle': '\\displaystyle',
+    },
+    'binary_functions': {
+        'frac': '\\frac',
+        'root': '\\sqrt',
+        'stackrel': '\\stackrel',
+        'overset': '\\overset',
+        'underset': '\\underset',
+        'color': '\\textcolor',
+    },
+    'left_parenthesis': {
+        '(:': '\\langle',
+        '(': '(',
+        '[': '[',
+        '{:': '.',
+        '{': '\\{',
+        '|:': '\\vert',
+        '||:': '\\lVert',
+        'langle': '\\langle',
+        '<<': '\\langle',
+    },
+    'right_parenthesis': {
+        ':)': '\\rangle',
+        ')': ')',
+        ']': ']',
+        ':}': '.',
+        '}': '\\}',
+        ':|': '\\vert',
+        ':||': '\\rVert',
+        'rangle': '\\rangle',
+        '>>': '\\rangle',
+    },
+    'colors': {
+        'red': 'red',
+    },
+    'smb': {
+        'twoheadrightarrowtail': '\\twoheadrightarrowtail',
+        'twoheadrightarrow': '\\twoheadrightarrow',
+        'Leftrightarrow': '\\Leftrightarrow',
+        'leftrightarrow': '\\leftrightarrow',
+        'rightarrowtail': '\\rightarrowtail',
+        'rightarrow': '\\rightarrow',
+        'varepsilon': '\\varepsilon',
+        'Leftarrow': '\\Leftarrow',
+        'downarrow': '\\downarrow',
+        'leftarrow': '\\leftarrow',
+        'therefore': '\\therefore',
+        'bigwedge': '\\bigwedge',
+        'emptyset': '\\emptyset',
+        'integral': '\\int',
+        'lceiling': '\\lceiling',
+        'rceiling': '\\rceiling',
+        'setminus': '\\setminus',
+        'subseteq': '\\subseteq',
+        'supseteq': '\\supseteq',
+        'triangle': '\\triangle',
+        'vartheta': '\\vartheta',
+        'because': '\\because',
+        'diamond': '\\diamond',
+        'epsilon': '\\epsilon',
+        'implies': '\\implies',
+        'partial': '\\partial',
+        'uparrow': '\\uparrow',
+        'upsilon': '\\upsilon',
+        'Lambda': '\\Lambda',
+        'approx': '\\approx',
+        'arccos': '\\arccos',
+        'arcsin': '\\arcsin',
+        'arctan': '\\arctan',
+        'bigcap': '\\bigcap',
+        'bigcup': '\\bigcup',
+        'bigvee': '\\bigvee',
+        'bowtie': '\\bowtie',
+        'exists': '\\exists',
+        'forall': '\\forall',
+        'lambda': '\\lambda',
+        'lfloor': '\\lfloor',
+        'ltimes': '\\ltimes',
+        'mapsto': '\\mapsto',
+        'models': '\\models',
+        'otimes': '\\otimes',
+        'preceq': '\\preceq',
+        'propto': '\\propto',
+        'rfloor': '\\rfloor',
+        'rtimes': '\\rtimes',
+        'square': '\\square',
+        'subset': '\\subset',
+        'succeq': '\\succeq',
+        'supset': '\\supset',
+        'varphi': '\\varphi',
+        'Delta': '\\Delta',
+        'Gamma': '\\Gamma',
+        'Omega': '\\Omega',
+        'Sigma': '\\Sigma',
+        'Theta': '\\Theta',
+        'aleph': '\\aleph',
+        'alpha': '\\alpha',
+        'angle': '\\angle',
+        'cdots': '\\cdots',
+        'ddots': '\\ddots',
+        'delta': '\\delta',
+        'equiv': '\\equiv',
+        'frown': '\\frown',
+        'gamma': '\\gamma',
+        'infty': '\\infty',
+        'kappa': '\\kappa',
+        'ldots': '\\ldots',
+        'nabla': '\\nabla',
+        'notin': '\\notin',
+        'omega': '\\omega',
+        'oplus': '\\oplus',
+        'sigma': '\\sigma',
+        'theta': '\\theta',
+        'times': '\\times',
+        'vdash': '\\vdash',
+        'vdots': '\\vdots',
+        'wedge': '\\wedge',
+        '/_\\\\': '\\triangle',
+        '>->>': '\\twoheadrightarrowtail',
+        'beta': '\\beta',
+        'cdot': '\\cdot',
+        'circ': '\\circ',
+        'cong': '\\cong',
+        'cosh': '\\cosh',
+        'coth': '\\coth',
+        'csch': '\\csch',
+        'darr': '\\downarrow',
+        'grad': '\\nabla',
+        'hArr': '\\Leftrightarrow',
+        'harr': '\\leftrightarrow',
+        'iota': '\\iota',
+        'lArr': '\\Leftarrow',
+        'larr': '\\leftarrow',
+        'odot': '\\odot',
+        'oint': '\\oint',
+        'prec': '\\prec',
+        'prod': '\\prod',
+        'prop': '\\propto',
+        'quad': '\\quad',
+        'rArr': '\\Rightarrow',
+        'rarr': '\\rightarrow',
+        'sech': '\\sech',
+        'sinh': '\\sinh',
+        'star': '\\star',
+        'sube': '\\subseteq',
+        'succ': '\\succ',
+        'supe': '\\supseteq',
+        'tanh': '\\tanh',
+        'uarr': '\\uparrow',
+        'zeta': '\\zeta',
+        '|><|': '\\bowtie',
+        '!in': '\\notin',
+        '***': '\\star',
+        '-<=': '\\preceq',
+        '->>': '\\twoheadrightarrow',
+        '...': '\\ldots',
+        '<=>': '\\iff',
+        '>-=': '\\succeq',
+        '>->': '\\rightarrowtail',
+        '><|': '\\rtimes',
+        'Phi': '\\Phi',
+        'Psi': '\\Psi',
+        '^^^': '\\bigwedge',
+        '__|': '\\rfloor',
+        '_|_': '\\bot',
+        'and': '\\mathmr{and}',
+        'ast': '\\ast',
+        'bot': '\\bot',
+        'cap': '\\cap',
+        'chi': '\\chi',
+        'cos': '\\cos',
+        'cot': '\\cot',
+        'csc': '\\csc',
+        'cup': '\\cup',
+        'del': '\\partial',
+        'det': '\\det',
+        'dim': '\\dim',
+        'div': '\\div',
+        'eta': '\\eta',
+        'exp': '\\exp',
+        'gcd': '\\gcd',
+        'glb': '\\glb',
+        'iff': '\\iff',
+        'int': '\\int',
+        'lcm': '\\lcm',
+        'lim': '\\lim',
+        'log': '\\log',
+        'lub': '\\lub',
+        'max': '\\max',
+        'min': '\\min',
+        'mod': '\\mod',
+        'neg': '\\neg',
+        'nnn': '\\bigcap',
+        'not': '\\neg',
+        'phi': '\\phi',
+        'psi': '\\psi',
+        'red': 'red',
+        'rho': '\\rho',
+        'sec': '\\sec',
+        'sin': '\\sin',
+        'sub': '\\subset',
+        'sum': '\\sum',
+        'sup': '\\supset',
+        'tan': '\\tan',
+        'tau': '\\tau',
+        'top': '\\top',
+        'uuu': '\\bigcup',
+        'vee': '\\vee',
+        'vvv': '\\bigvee',
+        '|--': '\\vdash',
+        '|->': '\\mapsto',
+        '|==': '\\models',
+        '|><': '\\ltimes',
+        '|__': '\\lfloor',
+        '!=': '\\ne',
+        '**': '\\ast',
+        '+-': '\\pm',
+        '-:': '\\div',
+        '-<': '\\prec',
+        '-=': '\\equiv',
+        '->': '\\to',
+        '//': '/',
+        '/_': '\\angle',
+        ":'": '\\because',
+        ':.': '\\therefore',
+        '<=': '\\le',
+        '=>': '\\implies',
+        '>-': '\\succ',
+        '>=': '\\ge',
+        'AA': '\\forall',
+        'CC': '\\mathbb{C}',
+        'EE': '\\exists',
+        'NN': '\\mathbb{N}',
+        'O/': '\\emptyset',
+        'Pi': '\\Pi',
+        'QQ': '\\mathbb{Q}',
+        'RR': '\\mathbb{R}',
+        'TT': '\\top',
+        'Xi': '\\Xi',
+        'ZZ': '\\mathbb{Z}',
+        '\\\\': '\\setminus',
+        '^^': '\\wedge',
+        'ge': '\\ge',
+        'gt': '>',
+        'if': '\\mathmr{if}',
+        'in': '\\in',
+        'le': '\\le',
+        'ln': '\\ln',
+        'lt': '<',
+        'mu': '\\mu',
+        'ne': '\\ne',
+        'nn': '\\cap',
+        'nu': '\\nu',
+        'o+': '\\oplus',
+        'o.': '\\odot',
+        'oo': '\\infty',
+        'or': '\\mathmr{and}',
+        'ox': '\\otimes',
+        'pi': '\\pi',
+        'pm': '\\pm',
+        'to': '\\to',
+        'uu': '\\cup',
+        'vv': '\\vee',
+        'xi': '\\xi',
+        'xx': '\\times',
+        '|~': '\\lceiling',
+        '~=': '\\cong',
+        '~|': '\\rceiling',
+        '~~': '\\approx',
+        "'": "'",
+        '*': '\\cdot',
+        '+': '+',
+        ',': ',',
+        '-': '-',
+        '.': '.',
+        '/': '/',
+        ':': ':',
+        '<': '<',
+        '=': '=',
+        '>': '>',
+        '@': '\\circ',
+        '^': '^',
+        '_': '_',
+        'f': 'f',
+        'g': 'g',
+        '|': '|',
+    },
+}
+asciimath2mathml = {
+    'unary_functions': {
+        'sqrt': '<msqrt>{}</msqrt>',
+        'text': '<mtext>{}</mtext>',
+        'abs': '<mo>|</mo>{}<mo>|</mo>',
+        'floor': '<mo>&lfloor;</mo>{}<mo>&rfloor;</mo>',
+        'ceil': '<mo>&lceil;</mo>{}<mo>&rceil;</mo>',
+        'norm': '<mo>&DoubleVerticalBar;</mo>{}<mo>&DoubleVerticalBar;</mo>',
+        'ubrace': '<munder>{}<mo>&#x23DF;</mo></munder>',
+        'underbrace': '<munder>{}<mo>&#x23DF;</mo></munder>',
+        'obrace': '<mover>{}<mo>&#x23DF;</mo></mover>',
+        'overbrace': '<mover>{}<mo>&#x23DF;</mo></mover>',
+        'cancel': "<menclose notation='updiagonalstrike'>{}</menclose>",
+        'bb': "<mstyle mathvariant='bold'>{}</mstyle>",
+        'bbb': "<mstyle mathvariant='double-struck'>{}</mstyle>",
+        'cc': "<mstyle mathvariant='script'>{}</mstyle>",
+        'tt': "<mstyle mathvariant='monospace'>{}</mstyle>",
+        'fr': "<mstyle mathvariant='fraktur'>{}</mstyle>",
+        'sf': "<mstyle mathvariant='sanf-serif'>{}</mstyle>",
+        'ul': '<munder>{}<mo>&#x332;</mo></munder>',
+        'underline': '<munder>{}<mo>&#x332;</mo></munder>',
+        'bar': '<mover>{}<mo>&#x332;</mo></mover>',
+        'overline': '<mover>{}<mo>&#x332;</mo></mover>',
+        'hat': '<mover>{}<mo>^</mo></mover>',
+        'vec': "<mover>{}<mo stretchy='false'>&#x2192;</mo></mover>",
+        'dot': "<mover>{}<mo stretchy='false'>.</mo></mover>",
+        'ddot': "<mover>{}<mo stretchy='false'>..</mo></mover>",
+        'dstyle': "<mstyle displaystyle='true'>{}</mstyle>",
+    },
+    'binary_functions': {
+        'frac': '<mfrac>{}{}</mfrac>',
+        'root': '<mroot>{}{}</mroot>',
+        'stackrel': '<mover>{}{}</mover>',
+        'overset': '<mover>{}{}</mover>',
+        'underset': '<munder>{}{}</munder>',
+        'color': "<mstyle mathcolor='{}'>{}</mstyle>",
+    },
+    'left_parenthesis': {
+        '(:': '&langle;',
+        '(': '(',
+        '[': '[',
+        '{:': '',
+        '{': '{',
+        '|:': '&VerticalBar;',
+        '||:': '&DoubleVerticalBar;',
+        'langle': '&langle;',
+        '<<': '&langle;',
+    },
+    'right_parenthesis': {
+        ':)': '&rangle;',
+        ')': ')',
+        ']': ']',
+        ':}': '',
+        '}': '}',
+        ':|': '&VerticalBar;',
+        ':||': '&DoubleVerticalBar;',
+        'rangle': '&rangle;',
+        '>>': '&rangle;',
+    },
+    'colors': {
+        'red': 'red',
+    },
+    'smb': {
+        'twoheadrightarrowtail': '&Rarrtl;',
+        'twoheadrightarrow': '&twoheadrightarrow;',
+        'Leftrightarrow': '&Leftrightarrow;',
+        'leftrightarrow': '&leftrightarrow;',
+        'rightarrowtail': '&rightarrowtail;',
+        'rightarrow': '&rightarrow;',
+        'varepsilon': '&varepsilon;',
+        'Leftarrow': '&Leftarrow;',
+        'downarrow': '&downarrow;',
+        'leftarrow': '&leftarrow;',
+        'therefore': '&therefore;',
+        'bigwedge': '&bigwedge;',
+        'emptyset': '&emptyset;',
+        'integral': '&int;',
+        'lceiling': '&lceil;',
+        'rceiling': '&rceil;',
+        'setminus': '&setminus;',
+        'subseteq': '&SubsetEqual;',
+        'supseteq': '&SupersetEqual;',
+        'triangle': '&bigtriangleup;',
+        'vartheta': '&vartheta;',
+        'because': '&because;',
+        'diamond': '&diamond;',
+        'epsilon': '&epsiv;',
+        'implies': '&Implies;',
+        'partial': '&part;',
+        'uparrow': '&uparrow;',
+        'upsilon': '&upsilon;',
+        'Lambda': '&Lambda;',
+        'approx': '&approx;',
+        'arccos': 'arccos',
+        'arcsin': 'arcsin',
+        'arctan': 'arctan',
+        'bigcap': '&bigcap;',
+        'bigcup': '&bigcup;',
+        'bigvee': '&bigvee;',
+        'bowtie': '&bowtie;',
+        'exists': '&Exists;',
+        'forall': '&ForAll;',
+        'lambda': '&lambda;',
+        'lfloor': '&lfloor;',
+        'ltimes': '&ltimes;',
+        'mapsto': '&mapsto;',
+        'models': '&DoubleRightTee;',
+        'otimes': '&times;',
+        'preceq': '&PrecedesEqual;',
+        'propto': '&prop;',
+        'rfloor': '&rfloor;',
+        'rtimes': '&rtimes;',
+        'square': '&square;',
+        'subset': '&subset;',
+        'succeq': '&SucceedsEqual;',
+        'supset': '&supset;',
+        'varphi': '&varphi;',
+        'Delta': '&Delta;',
+        'Gamma': '&Gamma;',
+        'Omega': '&Omega;',
+        'Sigma': '&Sigma;',
+        'Theta': '&Theta;',
+        'aleph': '&aleph;',
+        'alpha': '&alpha;',
+        'angle': '&angle;',
+        'cdots': '&ctdot;',
+        'ddots': '&dtdot;',
+        'delta': '&delta;',
+        'equiv': '&equiv;',
+        'frown': '&frown;',
+        'gamma': '&gamma;',
+        'infty': '&infin;',
+        'kappa': '&kappa;',
+        'ldots': '...',
+        'nabla': '&Del;',
+        'notin': '&notin;',
+        'omega': '&omega;',
+        'oplus': '&oplus;',
+        'sigma': '&sigma;',
+        'theta': '&theta;',
+        'times': '&times;',
+        'vdash': '&RightTee;',
+        'vdots': '&vellip;',
+        'wedge': '&wedge;',
+        '/_\\\\': '&bigtriangleup;',
+        '>->>': '&Rarrtl;',
+        'beta': '&beta;',
+        'cdot': '&sdot;',
+        'circ': '&SmallCircle;',
+        'cong': '&cong;',
+        'cosh': 'cosh',
+        'coth': 'coth',
+        'csch': 'csch',
+        'darr': '&darr;',
+        'grad': '&Del;',
+        'hArr': '&hArr;',
+        'harr': '&harr;',
+        'iota': '&iota;',
+        'lArr': '&lArr;',
+        'larr': '&larr;',
+        'odot': '&odot;',
+        'oint': '&conint;',
+        'prec': '&Precedes;',
+        'prod': '&prod;',
+        'prop': '&prop;',
+        'quad': '&nbsp;',
+        'rArr': '&rArr;',
+        'rarr': '&rarr;',
+        'sech': 'sech',
+        'sinh': 'sinh',
+        'star': '&Star;',
+        'sube': '&SubsetEqual;',
+        'succ': '&Succeeds;',
+        'supe': '&SupersetEqual;',
+        'tanh': 'tanh',
+        'uarr': '&uarr;',
+        'zeta': '&zeta;',
+        '|><|': '&bowtie;',
+        '!in': '&notin;',
+        '***': '&Star;',
+        '-<=': '&PrecedesEqual;',
+        '->>': '&twoheadrightarrow;',
+        '...': '...',
+        '<=>': '&iff;',
+        '>-=': '&SucceedsEqual;',
+        '>->': '&rightarrowtail;',
+        '><|': '&rtimes;',
+        'Phi': '&Phi;',
+        'Psi': '&Psi;',
+        '^^^': '&bigwedge;',
+        '__|': '&rfloor;',
+        '_|_': '&bot;',
+        'and': 'and',
+        'ast': '&ast;',
+        'bot': '&bot;',
+        'cap': '&cap;',
+        'chi': '&chi;',
+        'cos': 'cos',
+        'cot': 'cot',
+        'csc': 'csc',
+        'cup': '&cup;',
+        'del': '&part;',
+        'det': 'det',
+        'dim': 'dim',
+        'div': '&div;',
+        'eta': '&eta;',
+        'exp': 'exp',
+        'gcd': 'gcd',
+        'glb': 'glb',
+        'iff': '&iff;',
+        'int': '&int;',
+        'lcm': 'lcm',
+        'lim': 'lim',
+        'log': 'log',
+        'lub': 'lub',
+        'max': 'max',
+        'min': 'min',
+        'mod': 'mod',
+        'neg': '&not;',
+        'nnn': '&bigcap;',
+        'not': '&not;',
+        'phi': '&phi;',
+        'psi': '&psi;',
+        'red': 'red',
+        'rho': '&rho;',
+        'sec': 'sec',
+        'sin': 'sin',
+        'sub': '&subset;',
+        'sum': '&sum;',
+        'sup': '&supset;',
+        'tan': 'tan',
+        'tau': '&tau;',
+        'top': '&top;',
+        'uuu': '&bigcup;',
+        'vee': '&vee;',
+        'vvv': '&bigvee;',
+        '|--': '&RightTee;',
+        '|->': '&mapsto;',
+        '|==': '&DoubleRightTee;',
+        '|><': '&ltimes;',
+        '|__': '&lfloor;',
+        '!=': '&NotEqual;',
+        '**': '&ast;',
+        '+-': '&PlusMinus;',
+        '-:': '&div;',
+        '-<': '&Precedes;',
+        '-=': '&equiv;',
+        '->': '&rightarrow;',
+        '//': '/',
+        '/_': '&angle;',
+        ":'": '&because;',
+        ':.': '&therefore;',
+        '<=': '&leq;',
+        '=>': '&Implies;',
+        '>-': '&Succeeds;',
+        '>=': '&geq;',
+        'AA': '&ForAll;',
+        'CC': '&Copf;',
+        'EE': '&Exists;',
+        'NN': '&Nopf;',
+        'O/': '&emptyset;',
+        'Pi': '&Pi;',
+        'QQ': '&Qopf;',
+        'RR': '&Ropf;',
+        'TT': '&top;',
+        'Xi': '&Xi;',
+        'ZZ': '&Zopf;',
+        '\\\\': '&setminus;',
+        '^^': '&wedge;',
+        'ge': '&geq;',
+        'gt': '&gt;',
+        'if': 'if',
+        'in': '&in;',
+        'le': '&leq;',
+        'ln': 'ln',
+        'lt': '&lt;',
+        'mu': '&mu;',
+        'ne': '&NotEqual;',
+        'nn': '&cap;',
+        'nu': '&nu;',
+        'o+': '&oplus;',
+        'o.': '&odot;',
+        'oo': '&infin;',
+        'or': 'or',
+        'ox': '&times;',
+        'pi': '&pi;',
+        'pm': '&PlusMinus;',
+        'to': '&rightarrow;',
+        'uu': '&cup;',
+        'vv': '&vee;',
+        'xi': '&xi;',
+        'xx': '&times;',
+        '|~': '&lceil;',
+        '~=': '&cong;',
+        '~|': '&rceil;',
+        '~~': '&approx;',
+        "'": "'",
+        '*': '&sdot;',
+        '+': '+',
+        ',': ',',
+        '-': '-',
+        '.': '.',
+        '/': '/',
+        ':': ':',
+        '<': '&lt;',
+        '=': '=',
+        '>': '&gt;',
+        '@': '&SmallCircle;',
+        '^': '&#x5E;',
+        '_': '_',
+        'f': 'f',
+        'g': 'g',
+        '|': '|',
+    },
+}
+latex2asciimath = {
+    'unary_functions': {
+        '\\sqrt': 'sqrt',
+        '\\text': 'text',
+        '\\textrm': 'text',
+        '\\mathrm': 'text',
+        '\\underbrace': 'ubrace',
+        '\\overbrace': 'obrace',
+        '\\cancel': 'cancel',
+        '\\boldsymbol': 'bb',
+        '\\mathbb': 'bbb',
+        '\\mathcal': 'cc',
+        '\\texttt': 'tt',
+        '\\mathfrak': 'fr',
+        '\\textsf': 'sf',
+        '\\underline': 'ul',
+        '\\overline': 'bar',
+        '\\hat': 'hat',
+        '\\vec': 'vec',
+        '\\dot': 'dot',
+        '\\ddot': 'ddot',
+        '\\displaystyle': 'dstyle',
+    },
+    'binary_functions': {
+        '\\frac': 'frac',
+        '\\stackrel': 'stackrel',
+        '\\overset': 'overset',
+        '\\underset': 'underset',
+        '\\textcolor': 'color',
+    },
+    'left_parenthesis': {
+        '(': '(',
+        '[': '[',
+        '\\{': '{',
+        '\\lVert': '||:',
+        '\\langle': 'langle',
+    },
+    'right_parenthesis': {
+        ')': ')',
+        ']': ']',
+        '\\}': '}',
+        '\\rVert': ':||',
+        '\\rangle': 'rangle',
+    },
+    'colors': {
+        'red': 'red',
+    },
+    'smb': {
+        '\\twoheadrightarrowtail': '>->>',
+        '\\twoheadrightarrow': '->>',
+        '\\Leftrightarrow': 'hArr',
+        '\\leftrightarrow': 'harr',
+        '\\rightarrowtail': '>->',
+        '\\mathmr{and}': 'and',
+        '\\mathmr{if}': 'if',
+        '\\mathmr{or}': 'or',
+        '\\rightarrow': 'rarr',
+        '\\varepsilon': 'varepsilon',
+        '\\Leftarrow': 'lArr',
+        '\\downarrow': 'darr',
+        '\\leftarrow': 'larr',
+        '\\mathbb{C}': 'CC',
+        '\\mathbb{N}': 'NN',
+        '\\mathbb{Q}': 'QQ',
+        '\\mathbb{R}': 'RR',
+        '\\mathbb{Z}': 'ZZ',
+        '\\therefore': ':.',
+        '\\bigwedge': '^^^',
+        '\\emptyset': 'O/',
+        '\\lceiling': '|~',
+        '\\rceiling': '~|',
+        '\\setminus': '\\\\',
+        '\\subseteq': 'sube',
+        '\\supseteq': 'supe',
+        '\\triangle': '/_\\\\',
+        '\\vartheta': 'vartheta',
+        '\\because': ":'",
+        '\\diamond': 'diamond',
+        '\\epsilon': 'epsilon',
+        '\\implies': '=>',
+        '\\partial': 'del',
+        '\\uparrow': 'uarr',
+        '\\upsilon': 'upsilon',
+        '\\Lambda': 'Lambda',
+        '\\approx': '~~',
+        '\\arccos': 'arccos',
+        '\\arcsin': 'arcsin',
+        '\\arctan': 'arctan',
+        '\\bigcap': 'nnn',
+        '\\bigcup': 'uuu',
+        '\\bigvee': 'vvv',
+        '\\bowtie': '|><|',
+        '\\exists': 'EE',
+        '\\forall': 'AA',
+        '\\lambda': 'lambda',
+        '\\lfloor': '|__',
+        '\\ltimes': '|><',
+        '\\mapsto': '|->',
+        '\\models': '|==',
+        '\\otimes': 'ox',
+        '\\preceq': '-<=',
+        '\\propto': 'prop',
+        '\\rfloor': '__|',
+        '\\rtimes': '><|',
+        '\\square': 'square',
+        '\\subset': 'sub',
+        '\\succeq': '>-=',
+        '\\supset': 'sup',
+        '\\varphi': 'varphi',
+        '\\Delta': 'Delta',
+        '\\Gamma': 'Gamma',
+        '\\Omega': 'Omega',
+        '\\Sigma': 'Sigma',
+        '\\Theta': 'Theta',
+        '\\aleph': 'aleph',
+        '\\alpha': 'alpha',
+        '\\angle': '/_',
+        '\\cdots': 'cdots',
+        '\\ddots': 'ddots',
+        '\\delta': 'delta',
+        '\\equiv': '-=',
+        '\\frown': 'frown',
+        '\\gamma': 'gamma',
+        '\\infty': 'oo',
+        '\\kappa': 'kappa',
+        '\\ldots': '...',
+        '\\nabla': 'grad',
+        '\\notin': '!in',
+        '\\omega': 'omega',
+        '\\oplus': 'o+',
+        '\\sigma': 'sigma',
+        '\\theta': 'theta',
+        '\\times': 'xx',
+        '\\vdash': '|--',
+        '\\vdots': 'vdots',
+        '\\wedge': '^^',
+        '\\beta': 'beta',
+        '\\cdot': '*',
+        '\\circ': '@',
+        '\\cong': '~=',
+        '\\cosh': 'cosh',
+        '\\coth': 'coth',
+        '\\csch': 'csch',
+        '\\iota': 'iota',
+        '\\odot': 'o.',
+        '\\oint': 'oint',
+        '\\prec': '-<',
+        '\\prod': 'prod',
+        '\\quad': 'quad',
+        '\\sech': 'sech',
+        '\\sinh': 'sinh',
+        '\\star': '***',
+        '\\succ': '>-',
+        '\\tanh': 'tanh',
+        '\\vert': '|',
+        '\\zeta': 'zeta',
+        '\\Phi': 'Phi',
+        '\\Psi': 'Psi',
+        '\\ast': '**',
+        '\\bot': '_|_',
+        '\\cap': 'nn',
+        '\\chi': 'chi',
+        '\\cos': 'cos',
+        '\\cot': 'cot',
+        '\\csc': 'csc',
+        '\\cup': 'uu',
+        '\\det': 'det',
+        '\\dim': 'dim',
+        '\\div': '-:',
+        '\\eta': 'eta',
+        '\\exp': 'exp',
+        '\\gcd': 'gcd',
+        '\\glb': 'glb',
+        '\\iff': '<=>',
+        '\\int': 'int',
+        '\\lcm': 'lcm',
+        '\\lim': 'lim',
+        '\\log': 'log',
+        '\\lub': 'lub',
+        '\\max': 'max',
+        '\\mid': '|',
+        '\\min': 'min',
+        '\\mod': 'mod',
+        '\\neg': 'not',
+        '\\phi': 'phi',
+        '\\psi': 'psi',
+        '\\rho': 'rho',
+        '\\sec': 'sec',
+        '\\sin': 'sin',
+        '\\sum': 'sum',
+        '\\tan': 'tan',
+        '\\tau': 'tau',
+        '\\top': 'TT',
+        '\\vee': 'vv',
+        '\\Pi': 'Pi',
+        '\\Xi': 'Xi',
+        '\\ge': '>=',
+        '\\in': 'in',
+        '\\le': '<=',
+        '\\ln': 'ln',
+        '\\mu': 'mu',
+        '\\ne': '!=',
+        '\\nu': 'nu',
+        '\\pi': 'pi',
+        '\\pm': '+-',
+        '\\to': '->',
+        '\\xi': 'xi',
+        'red': 'red',
+        "'": "'",
+        '*': '**',
+        '+': '+',
+        ',': ',',
+        '-': '-',
+        '.': '.',
+        '/': '//',
+        ':': ':',
+        '<': '<',
+        '=': '=',
+        '>': '>',
+        '^': '^',
+        '_': '_',
+        'f': 'f',
+        'g': 'g',
+        '|': '|',
+    },
+}
+asciimath_grammar = (
+    '\n'
+    '    %import common.WS\n'
+    '    %import common.LETTER\n'
+    '    %import common.NUMBER\n'
+    '    %ignore WS\n'
+    '    start: i start* -> exp\n'
+    '    i: s -> exp_interm\n'
+    '        | s "/" s -> exp_frac\n'
+    '        | s "_" s -> exp_under\n'
+    '        | s "^" s -> exp_super\n'
+    '        | s "_" s "^" s -> exp_under_super\n'
+    '    s: _l start? _r -> exp_par\n'
+    '        | _u s -> exp_unary\n'
+    '        | _b s s -> exp_binary\n'
+    '        | _asciimath1 -> symbol\n'
+    '        | _asciimath2 -> symbol\n'
+    '        | _c -> const\n'
+    '        | QS -> q_str\n'
+    '    !_c: /d[A-Za-z]/\n'
+    '        | NUMBER\n'
+    '        | LETTER\n'
+    '    !_l: "(:"\n'
+    '\t| "("\n'
+    '\t| "["\n'
+    '\t| "{:"\n'
+    '\t| "{"\n'
+    '\t| "|:"\n'
+    '\t| "||:"\n'
+    '\t| "langle"\n'
+    '\t| "<<" // left parenthesis\n'
+    '    !_r: ":)"\n'
+    '\t| ")"\n'
+    '\t| "]"\n'
+    '\t| ":}"\n'
+    '\t| "}"\n'
+    '\t| ":|"\n'
+    '\t| ":||"\n'
+    '\t| "rangle"\n'
+    '\t| ">>" // right parenthesis\n'
+    '    !_b: "frac"\n'
+    '\t| "root"\n'
+    '\t| "stackrel"\n'
+    '\t| "overset"\n'
+    '\t| "underset"\n'
+    '\t| "color" // binary functions\n'
+    '    !_u: "sqrt"\n'
+    '\t| "text"\n'
+    '\t| "abs"\n'
+    '\t| "floor"\n'
+    '\t| "ceil"\n'
+    '\t| "norm"\n'
+    '\t| "ubrace"\n'
+    '\t| "underbrace"\n'
+    '\t| "obrace"\n'
+    '\t| "overbrace"\n'
+    '\t| "cancel"\n'
+    '\t| "bb"\n'
+    '\t| "bbb"\n'
+    '\t| "cc"\n'
+    '\t| "tt"\n'
+    '\t| "fr"\n'
+    '\t| "sf"\n'
+    '\t| "ul"\n'
+    '\t| "underline"\n'
+    '\t| "bar"\n'
+    '\t| "overline"\n'
+    '\t| "hat"\n'
+    '\t| "vec"\n'
+    '\t| "dot"\n'
+    '\t| "ddot"\n'
+    '\t| "dstyle" // unary functions\n'
+    '    !_asciimath1: "twoheadrightarrowtail"\n'
+    '\t| "twoheadrightarrow"\n'
+    '\t| "Leftrightarrow"\n'
+    '\t| "leftrightarrow"\n'
+    '\t| "rightarrowtail"\n'
+    '\t| "rightarrow"\n'
+    '\t| "varepsilon"\n'
+    '\t| "Leftarrow"\n'
+    '\t| "downarrow"\n'
+    '\t| "leftarrow"\n'
+    '\t| "therefore"\n'
+    '\t| "bigwedge"\n'
+    '\t| "emptyset"\n'
+    '\t| "integral"\n'
+    '\t| "lceiling"\n'
+    '\t| "rceiling"\n'
+    '\t| "setminus"\n'
+    '\t| "subseteq"\n'
+    '\t| "supseteq"\n'
+    '\t| "triangle"\n'
+    '\t| "vartheta"\n'
+    '\t| "because"\n'
+    '\t| "diamond"\n'
+    '\t| "epsilon"\n'
+    '\t| "implies"\n'
+    '\t| "partial"\n'
+    '\t| "uparrow"\n'
+    '\t| "upsilon"\n'
+    '\t| "Lambda"\n'
+    '\t| "approx"\n'
+    '\t| "arccos"\n'
+    '\t| "arcsin"\n'
+    '\t| "arctan"\n'
+    '\t| "bigcap"\n'
+    '\t| "bigcup"\n'
+    '\t| "bigvee"\n'
+    '\t| "bowtie"\n'
+    '\t| "exists"\n'
+    '\t| "forall"\n'
+    '\t| "lambda"\n'
+    '\t| "lfloor"\n'
+    '\t| "ltimes"\n'
+    '\t| "mapsto"\n'
+    '\t| "models"\n'
+    '\t| "otimes"\n'
+    '\t| "preceq"\n'
+    '\t| "propto"\n'
+    '\t| "rfloor"\n'
+    '\t| "rtimes"\n'
+    '\t| "square"\n'
+    '\t| "subset"\n'
+    '\t| "succeq"\n'
+    '\t| "supset"\n'
+    '\t| "varphi"\n'
+    '\t| "Delta"\n'
+    '\t| "Gamma"\n'
+    '\t| "Omega"\n'
+    '\t| "Sigma"\n'
+    '\t| "Theta"\n'
+    '\t| "aleph"\n'
+    '\t| "alpha"\n'
+    '\t| "angle"\n'
+    '\t| "cdots"\n'
+    '\t| "ddots"\n'
+    '\t| "delta"\n'
+    '\t| "equiv"\n'
+    '\t| "frown"\n'
+    '\t| "gamma"\n'
+    '\t| "infty"\n'
+    '\t| "kappa"\n'
+    '\t| "ldots"\n'
+    '\t| "nabla"\n'
+    '\t| "notin"\n'
+    '\t| "omega"\n'
+    '\t| "oplus"\n'
+    '\t| "sigma"\n'
+    '\t| "theta"\n'
+    '\t| "times"\n'
+    '\t| "vdash"\n'
+    '\t| "vdots"\n'
+    '\t| "wedge"\n'
+    '\t| "/_\\\\"\n'
+    '\t| ">->>"\n'
+    '\t| "beta"\n'
+    '\t| "cdot"\n'
+    '\t| "circ"\n'
+    '\t| "cong"\n'
+    '\t| "cosh"\n'
+    '\t| "coth"\n'
+    '\t| "csch"\n'
+    '\t| "darr"\n'
+    '\t| "grad"\n'
+    '\t| "hArr"\n'
+    '\t| "harr"\n'
+    '\t| "iota"\n'
+    '\t| "lArr"\n'
+    '\t| "larr"\n'
+    '\t| "odot"\n'
+    '\t| "oint"\n'
+    '\t| "prec"\n'
+    '\t| "prod"\n'
+    '\t| "prop"\n'
+    '\t| "quad"\n'
+    '\t| "rArr"\n'
+    '\t| "rarr"\n'
+    '\t| "sech"\n'
+    '\t| "sinh"\n'
+    '\t| "star"\n'
+    '\t| "sube"\n'
+    '\t| "succ"\n'
+    '\t| "supe"\n'
+    '\t| "tanh"\n'
+    '\t| "uarr"\n'
+    '\t| "zeta"\n'
+    '\t| "|><|"\n'
+    '\t| "!in"\n'
+    '\t| "***"\n'
+    '\t| "-<="\n'
+    '\t| "->>"\n'
+    '\t| "..."\n'
+    '\t| "<=>"\n'
+    '\t| ">-="\n'
+    '\t| ">->"\n'
+    '\t| "><|"\n'
+    '\t| "Phi"\n'
+    '    !_asciimath2: "Psi"\n'
+    '\t| "^^^"\n'
+    '\t| "__|"\n'
+    '\t| "_|_"\n'
+    '\t| "and"\n'
+    '\t| "ast"\n'
+    '\t| "bot"\n'
+    '\t| "cap"\n'
+    '\t| "chi"\n'
+    '\t| "cos"\n'
+    '\t| "cot"\n'
+    '\t| "csc"\n'
+    '\t| "cup"\n'
+    '\t| "del"\n'
+    '\t| "det"\n'
+    '\t| "dim"\n'
+    '\t| "div"\n'
+    '\t| "eta"\n'
+    '\t| "exp"\n'
+    '\t| "gcd"\n'
+    '\t| "glb"\n'
+    '\t| "iff"\n'
+    '\t| "int"\n'
+    '\t| "lcm"\n'
+    '\t| "lim"\n'
+    '\t| "log"\n'
+    '\t| "lub"\n'
+    '\t| "max"\n'
+    '\t| "min"\n'
+    '\t| "mod"\n'
+    '\t| "neg"\n'
+    '\t| "nnn"\n'
+    '\t| "not"\n'
+    '\t| "phi"\n'
+    '\t| "psi"\n'
+    '\t| "red"\n'
+    '\t| "rho"\n'
+    '\t| "sec"\n'
+    '\t| "sin"\n'
+    '\t| "sub"\n'
+    '\t| "sum"\n'
+    '\t| "sup"\n'
+    '\t| "tan"\n'
+    '\t| "tau"\n'
+    '\t| "top"\n'
+    '\t| "uuu"\n'
+    '\t| "vee"\n'
+    '\t| "vvv"\n'
+    '\t| "|--"\n'
+    '\t| "|->"\n'
+    '\t| "|=="\n'
+    '\t| "|><"\n'
+    '\t| "|__"\n'
+    '\t| "!="\n'
+    '\t| "**"\n'
+    '\t| "+-"\n'
+    '\t| "-:"\n'
+    '\t| "-<"\n'
+    '\t| "-="\n'
+    '\t| "->"\n'
+    '\t| "//"\n'
+    '\t| "/_"\n'
+    '\t| ":\'"\n'
+    '\t| ":."\n'
+    '\t| "<="\n'
+    '\t| "=>"\n'
+    '\t| ">-"\n'
+    '\t| ">="\n'
+    '\t| "AA"\n'
+    '\t| "CC"\n'
+    '\t| "EE"\n'
+    '\t| "NN"\n'
+    '\t| "O/"\n'
+    '\t| "Pi"\n'
+    '\t| "QQ"\n'
+    '\t| "RR"\n'
+    '\t| "TT"\n'
+    '\t| "Xi"\n'
+    '\t| "ZZ"\n'
+    '\t| "\\\\"\n'
+    '\t| "^^"\n'
+    '\t| "ge"\n'
+    '\t| "gt"\n'
+    '\t| "if"\n'
+    '\t| "in"\n'
+    '\t| "le"\n'
+    '\t| "ln"\n'
+    '\t| "lt"\n'
+    '\t| "mu"\n'
+    '\t| "ne"\n'
+    '\t| "nn"\n'
+    '\t| "nu"\n'
+    '\t| "o+"\n'
+    '\t| "o."\n'
+    '\t| "oo"\n'
+    '\t| "or"\n'
+    '\t| "ox"\n'
+    '\t| "pi"\n'
+    '\t| "pm"\n'
+    '\t| "to"\n'
+    '\t| "uu"\n'
+    '\t| "vv"\n'
+    '\t| "xi"\n'
+    '\t| "xx"\n'
+    '\t| "|~"\n'
+    '\t| "~="\n'
+    '\t| "~|"\n'
+    '\t| "~~"\n'
+    '\t| "\'"\n'
+    '\t| "*"\n'
+    '\t| "+"\n'
+    '\t| ","\n'
+    '\t| "-"\n'
+    '\t| "."\n'
+    '\t| "/"\n'
+    '\t| ":"\n'
+    '\t| "<"\n'
+    '\t| "="\n'
+    '\t| ">"\n'
+    '\t| "@"\n'
+    '\t| "^"\n'
+    '\t| "_"\n'
+    '\t| "f"\n'
+    '\t| "g"\n'
+    '\t| "|"\n'
+    '    QS: "\\"" /(?<=").+?(?=")/ "\\"" // Quoted String\n'
+)
+latex_grammar = (
+    '\n'
+    '    %import common.WS\n'
+    '    %import common.LETTER\n'
+    '    %import common.NUMBER\n'
+    '    %ignore WS\n'
+    '    start: "\\\\[" exp "\\\\]" -> exp\n'
+    '        | "$$" exp "$$" -> exp\n'
+    '        | "$" exp "$" -> exp\n'
+    '        | exp -> exp\n'
+    '    exp: i exp* -> exp\n'
+    '    i: s -> exp_interm\n'
+    '        | s "_" s -> exp_under\n'
+    '        | s "^" s -> exp_super\n'
+    '        | s "_" s "^" s -> exp_under_super\n'
+    '    s: _l exp? _r -> exp_par\n'
+    '        | "\\\\left" (_l | /\\./ | /\\\\vert/ | /\\\\mid/) start? "\\\\right" (_r | /\\./ | /\\\\vert/ | /\\\\mid/) -> exp_par\n'
+    '        | "\\\\begin{matrix}" row_mat (/\\\\\\\\/ row_mat?)* "\\\\end{matrix}" -> exp_mat\n'
+    '        | /\\\\sqrt/ "[" i+ "]" "{" exp "}" -> exp_binary\n'
+    '        | "{" i+ "}" -> exp\n'
+    '        | _u "{" exp "}" -> exp_unary\n'
+    '        | _b "{" exp "}" "{" exp "}" -> exp_binary\n'
+    '        | _latex1 -> symbol\n'
+    '        | _latex2 -> symbol\n'
+    '        | _c -> const\n'
+    '    !_c: NUMBER\n'
+    '        | LETTER\n'
+    '    !row_mat: exp ("&" exp?)* -> row_mat\n'
+    '    !_l: "("\n'
+    '\t| "["\n'
+    '\t| /\\\\{/\n'
+    '\t| /\\\\lVert/\n'
+    '\t| /\\\\langle/ // left parenthesis\n'
+    '    !_r: ")"\n'
+    '\t| "]"\n'
+    '\t| /\\\\}/\n'
+    '\t| /\\\\rVert/\n'
+    '\t| /\\\\rangle/ // right parenthesis\n'
+    '    !_b: /\\\\frac/\n'
+    '\t| /\\\\stackrel/\n'
+    '\t| /\\\\overset/\n'
+    '\t| /\\\\underset/\n'
+    '\t| /\\\\textcolor/ // binary functions\n'
+    '    !_u: /\\\\sqrt/\n'
+    '\t| /\\\\text/\n'
+    '\t| /\\\\textrm/\n'
+    '\t| /\\\\mathrm/\n'
+    '\t| /\\\\underbrace/\n'
+    '\t| /\\\\overbrace/\n'
+    '\t| /\\\\cancel/\n'
+    '\t| /\\\\boldsymbol/\n'
+    '\t| /\\\\mathbb/\n'
+    '\t| /\\\\mathcal/\n'
+    '\t| /\\\\texttt/\n'
+    '\t| /\\\\mathfrak/\n'
+    '\t| /\\\\textsf/\n'
+    '\t| /\\\\underline/\n'
+    '\t| /\\\\overline/\n'
+    '\t| /\\\\hat/\n'
+    '\t| /\\\\vec/\n'
+    '\t| /\\\\dot/\n'
+    '\t| /\\\\ddot/\n'
+    '\t| /\\\\displaystyle/ // unary functions\n'
+    '    !_latex1: /\\\\twoheadrightarrowtail/\n'
+    '\t| /\\\\twoheadrightarrow/\n'
+    '\t| /\\\\Leftrightarrow/\n'
+    '\t| /\\\\leftrightarrow/\n'
+    '\t| /\\\\rightarrowtail/\n'
+    '\t| /\\\\mathmr{and}/\n'
+    '\t| /\\\\mathmr{if}/\n'
+    '\t| /\\\\mathmr{or}/\n'
+    '\t| /\\\\rightarrow/\n'
+    '\t| /\\\\varepsilon/\n'
+    '\t| /\\\\Leftarrow/\n'
+    '\t| /\\\\downarrow/\n'
+    '\t| /\\\\leftarrow/\n'
+    '\t| /\\\\mathbb{C}/\n'
+    '\t| /\\\\mathbb{N}/\n'
+    '\t| /\\\\mathbb{Q}/\n'
+    '\t| /\\\\mathbb{R}/\n'
+    '\t| /\\\\mathbb{Z}/\n'
+    '\t| /\\\\therefore/\n'
+    '\t| /\\\\bigwedge/\n'
+    '\t| /\\\\emptyset/\n'
+    '\t| /\\\\lceiling/\n'
+    '\t| /\\\\rceiling/\n'
+    '\t| /\\\\setminus/\n'
+    '\t| /\\\\subseteq/\n'
+    '\t| /\\\\supseteq/\n'
+    '\t| /\\\\triangle/\n'
+    '\t| /\\\\vartheta/\n'
+    '\t| /\\\\because/\n'
+    '\t| /\\\\diamond/\n'
+    '\t| /\\\\epsilon/\n'
+    '\t| /\\\\implies/\n'
+    '\t| /\\\\partial/\n'
+    '\t| /\\\\uparrow/\n'
+    '\t| /\\\\upsilon/\n'
+    '\t| /\\\\Lambda/\n'
+    '\t| /\\\\approx/\n'
+    '\t| /\\\\arccos/\n'
+    '\t| /\\\\arcsin/\n'
+    '\t| /\\\\arctan/\n'
+    '\t| /\\\\bigcap/\n'
+    '\t| /\\\\bigcup/\n'
+    '\t| /\\\\bigvee/\n'
+    '\t| /\\\\bowtie/\n'
+    '\t| /\\\\exists/\n'
+    '\t| /\\\\forall/\n'
+    '\t| /\\\\lambda/\n'
+    '\t| /\\\\lfloor/\n'
+    '\t| /\\\\ltimes/\n'
+    '\t| /\\\\mapsto/\n'
+    '\t| /\\\\models/\n'
+    '\t| /\\\\otimes/\n'
+    '\t| /\\\\preceq/\n'
+    '\t| /\\\\propto/\n'
+    '\t| /\\\\rfloor/\n'
+    '\t| /\\\\rtimes/\n'
+    '\t| /\\\\square/\n'
+    '\t| /\\\\subset/\n'
+    '\t| /\\\\succeq/\n'
+    '\t| /\\\\supset/\n'
+    '\t| /\\\\varphi/\n'
+    '\t| /\\\\Delta/\n'
+    '\t| /\\\\Gamma/\n'
+    '\t| /\\\\Omega/\n'
+    '\t| /\\\\Sigma/\n'
+    '\t| /\\\\Theta/\n'
+    '\t| /\\\\aleph/\n'
+    '\t| /\\\\alpha/\n'
+    '\t| /\\\\angle/\n'
+    '\t| /\\\\cdots/\n'
+    '\t| /\\\\ddots/\n'
+    '\t| /\\\\delta/\n'
+    '\t| /\\\\equiv/\n'
+    '\t| /\\\\frown/\n'
+    '\t| /\\\\gamma/\n'
+    '\t| /\\\\infty/\n'
+    '\t| /\\\\kappa/\n'
+    '\t| /\\\\ldots/\n'
+    '\t| /\\\\nabla/\n'
+    '\t| /\\\\notin/\n'
+    '\t| /\\\\omega/\n'
+    '\t| /\\\\oplus/\n'
+    '\t| /\\\\sigma/\n'
+    '\t| /\\\\theta/\n'
+    '\t| /\\\\times/\n'
+    '\t| /\\\\vdash/\n'
+    '\t| /\\\\vdots/\n'
+    '\t| /\\\\wedge/\n'
+    '    !_latex2: /\\\\beta/\n'
+    '\t| /\\\\cdot/\n'
+    '\t| /\\\\circ/\n'
+    '\t| /\\\\cong/\n'
+    '\t| /\\\\cosh/\n'
+    '\t| /\\\\coth/\n'
+    '\t| /\\\\csch/\n'
+    '\t| /\\\\iota/\n'
+    '\t| /\\\\odot/\n'
+    '\t| /\\\\oint/\n'
+    '\t| /\\\\prec/\n'
+    '\t| /\\\\prod/\n'
+    '\t| /\\\\quad/\n'
+    '\t| /\\\\sech/\n'
+    '\t| /\\\\sinh/\n'
+    '\t| /\\\\star/\n'
+    '\t| /\\\\succ/\n'
+    '\t| /\\\\tanh/\n'
+    '\t| /\\\\vert/\n'
+    '\t| /\\\\zeta/\n'
+    '\t| /\\\\Phi/\n'
+    '\t| /\\\\Psi/\n'
+    '\t| /\\\\ast/\n'
+    '\t| /\\\\bot/\n'
+    '\t| /\\\\cap/\n'
+    '\t| /\\\\chi/\n'
+    '\t| /\\\\cos/\n'
+    '\t| /\\\\cot/\n'
+    '\t| /\\\\csc/\n'
+    '\t| /\\\\cup/\n'
+    '\t| /\\\\det/\n'
+    '\t| /\\\\dim/\n'
+    '\t| /\\\\div/\n'
+    '\t| /\\\\eta/\n'
+    '\t| /\\\\exp/\n'
+    '\t| /\\\\gcd/\n'
+    '\t| /\\\\glb/\n'
+    '\t| /\\\\iff/\n'
+    '\t| /\\\\int/\n'
+    '\t| /\\\\lcm/\n'
+    '\t| /\\\\lim/\n'
+    '\t| /\\\\log/\n'
+    '\t| /\\\\lub/\n'
+    '\t| /\\\\max/\n'
+    '\t| /\\\\mid/\n'
+    '\t| /\\\\min/\n'
+    '\t| /\\\\mod/\n'
+    '\t| /\\\\neg/\n'
+    '\t| /\\\\phi/\n'
+    '\t| /\\\\psi/\n'
+    '\t| /\\\\rho/\n'
+    '\t| /\\\\sec/\n'
+    '\t| /\\\\sin/\n'
+    '\t| /\\\\sum/\n'
+    '\t| /\\\\tan/\n'
+    '\t| /\\\\tau/\n'
+    '\t| /\\\\top/\n'
+    '\t| /\\\\vee/\n'
+    '\t| /\\\\Pi/\n'
+    '\t| /\\\\Xi/\n'
+    '\t| /\\\\ge/\n'
+    '\t| /\\\\in/\n'
+    '\t| /\\\\le/\n'
+    '\t| /\\\\ln/\n'
+    '\t| /\\\\mu/\n'
+    '\t| /\\\\ne/\n'
+    '\t| /\\\\nu/\n'
+    '\t| /\\\\pi/\n'
+    '\t| /\\\\pm/\n'
+    '\t| /\\\\to/\n'
+    '\t| /\\\\xi/\n'
+    '\t| "red"\n'
+    '\t| "\'"\n'
+    '\t| "*"\n'
+    '\t| "+"\n'
+    '\t| ","\n'
+    '\t| "-"\n'
+    '\t| "."\n'
+    '\t| "/"\n'
+    '\t| ":"\n'
+    '\t| "<"\n'
+    '\t| "="\n'
+    '\t| ">"\n'
+    '\t| "^"\n'
+    '\t| "_"\n'
+    '\t| "f"\n'
+    '\t| "g"\n'
+    '\t| "|"\n'
+)
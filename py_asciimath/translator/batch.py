@@ -0,0 +1,165 @@
+import json
+import logging
+from collections import deque
+
+from .translator import Translator, _error_message
+
+
+class BatchTranslator(object):
+    """Translate a stream of expressions, one per line
+
+    The expressions are read lazily from a text stream and every
+    translation is written, in the order of the expressions, as soon as it
+    is available, so that the translator is built once for the whole
+    stream. Two formats are supported:
+
+    * `lines`: every line is an expression and every translation is
+      written on its own line. Blank lines are copied as they are.
+    * `jsonl`: every line is a JSON string, i.e. the expression, or a JSON
+      object with the expression in its `exp` field. Every record is
+      written back as a JSON object with the translation in its
+      `translation` field, and the other fields of the input record, such
+      as ids, copied as they are. Blank lines are skipped.
+
+    An expression that can not be translated, or a record that can not be
+    read, is handled according to `on_error`:
+
+    * `skip`: the expression is skipped and a warning is logged.
+    * `emit-error`: an empty line (`lines`) or a record with the error
+      message in its `error` field and the line number in its `line`
+      field (`jsonl`) is written in place of the translation.
+    * `abort`: the error is raised.
+
+    Args:
+        translator (Translator): Translator of the expressions
+        format (str, optional): Format of the stream: `lines` or `jsonl`.
+            Defaults to "lines".
+        on_error (str, optional): Error policy: `skip`, `emit-error` or
+            `abort`. Defaults to "emit-error".
+    """
+
+    formats = ("lines", "jsonl")
+    policies = ("skip", "emit-error", "abort")
+
+    def __init__(self, translator, format="lines", on_error="emit-error"):
+        if not isinstance(translator, Translator):
+            raise TypeError("translator must be a Translator")
+        if format not in self.formats:
+            raise ValueError(
+                "format must be one of: " + ", ".join(self.formats)
+            )
+        if on_error not in self.policies:
+            raise ValueError(
+                "on_error must be one of: " + ", ".join(self.policies)
+            )
+        self.translator = translator
+        self.format = format
+        self.on_error = on_error
+
+    def _read(self, src):
+        # Yield (lineno, record, exp) for every line of `src`: exp is None
+        # if the line is not translated, in which case record is the line
+        # to copy or the error raised while reading it
+        for lineno, line in enumerate(src, 1):
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                if self.format == "lines":
+                    yield lineno, line, None
+                continue
+            if self.format == "lines":
+                yield lineno, None, line
+                continue
+            try:
+                record = json.loads(line)
+                if isinstance(record, str):
+                    record = {"exp": record}
+                elif not isinstance(record, dict) or not isinstance(
+                    record.get("exp"), str
+                ):
+                    raise ValueError(
+                        "Expected a JSON string or an object with an 'exp' "
+                        "string"
+                    )
+            except ValueError as e:
+                if self.on_error == "abort":
+                    raise ValueError("Line " + str(lineno) + ": " + str(e))
+                yield lineno, e, None
+                continue
+            yield lineno, record, record["exp"]
+
+    def _format(self, lineno, record, translated):
+        # Line written for the record, or None if nothing is written
+        error = isinstance(translated, Exception)
+        if error:
+            logging.warning("Line " + str(lineno) + ": " + repr(translated))
+            if self.on_error == "skip":
+                return None
+        if self.format == "lines":
+            return "" if error else translated
+        if error:
+            record = dict(record) if isinstance(record, dict) else {}
+            record.update(line=lineno, error=_error_message(translated))
+        else:
+            record = dict(record, translation=translated)
+        return json.dumps(record, ensure_ascii=False)
+
+    def translate_stream(self, src, dst, workers=None, chunksize=64, **kwargs):
+        """Translate the expressions read from `src`, writing their
+        translations to `dst`
+
+        Args:
+            src (file): Text stream of the expressions
+            dst (file): Text stream where the translations are written.
+                It is flushed after every translation.
+            workers (int, optional): Number of worker processes. If None,
+                translate in the current process. Defaults to None.
+            chunksize (int, optional): Number of expressions sent at once
+                to a worker process. Defaults to 64.
+            **kwargs: Keyword arguments to `translate(exp, **kwargs)`
+
+        Returns:
+            int: Number of translated expressions
+        """
+        # Lines read but not yet written, as (lineno, record, translated)
+        # tuples, where translated is None for the expressions not yet
+        # translated
+        pending = deque()
+
+        def write(lineno, record, translated):
+            line = self._format(lineno, record, translated)
+            if line is not None:
+                dst.write(line + "\n")
+
+        def exps():
+            for lineno, record, exp in self._read(src):
+                if exp is None:
+                    if pending:
+                        pending.append((lineno, record, record))
+                    else:
+                        write(lineno, record, record)
+                else:
+                    pending.append((lineno, record, None))
+                    yield exp
+
+        translated_exps = 0
+        translations = self.translator.translate_many(
+            exps(),
+            raise_errors=self.on_error == "abort",
+            workers=workers,
+            chunksize=chunksize,
+            **kwargs
+        )
+        for translated in translations:
+            while pending[0][2] is not None:
+                write(*pending.popleft())
+            lineno, record, _ = pending.popleft()
+            write(lineno, record, translated)
+            if not isinstance(translated, Exception):
+                translated_exps = translated_exps + 1
+            while pending and pending[0][2] is not None:
+                write(*pending.popleft())
+            dst.flush()
+        while pending:
+            write(*pending.popleft())
+        dst.flush()
+        return translated_exps
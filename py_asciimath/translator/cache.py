@@ -0,0 +1,144 @@
+import copy
+import pickle
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+from ..utils.ast import Node
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "currsize", "maxsize"]
+)
+
+
+class TranslationCache(object):
+    """Thread-safe LRU cache of translations, bounded by size in bytes
+
+    A cache can be shared by many translators, even of different types:
+    keys identify the translator type, the expression and every option
+    that affects the translation. Mutable translations, such as
+    `lxml.etree` elements, are copied when stored and when returned, so
+    that callers can not corrupt the cached values.
+
+    Args:
+        maxsize (int, optional): Maximum size of the cached translations
+            (expressions included), in bytes. Defaults to 64 MiB.
+    """
+
+    def __init__(self, maxsize=64 * 1024 * 1024):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._currsize = 0
+
+    def __reduce__(self):
+        # Every process gets its own, empty, cache
+        return (self.__class__, (self.maxsize,))
+
+    def __len__(self):
+        return len(self._cache)
+
+    @staticmethod
+    def _is_element(value):
+        # The value can be an element only if lxml has been imported
+        etree = sys.modules.get("lxml.etree")
+        return etree is not None and isinstance(value, etree._Element)
+
+    @classmethod
+    def _copy(cls, value):
+        if isinstance(value, str):
+            return value
+        elif cls._is_element(value):
+            # Copy the whole document, to keep its DOCTYPE
+            return copy.deepcopy(value.getroottree()).getroot()
+        return copy.deepcopy(value)
+
+    @classmethod
+    def _sizeof_value(cls, value):
+        if cls._is_element(value):
+            return len(sys.modules["lxml.etree"].tostring(value))
+        elif isinstance(value, Node):
+            # The size of the whole tree, not of its root only
+            return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        elif isinstance(value, dict):
+            # Translations by target language
+            return sys.getsizeof(value) + sum(
+                sys.getsizeof(k) + cls._sizeof_value(v)
+                for k, v in value.items()
+            )
+        return sys.getsizeof(value)
+
+    @classmethod
+    def _sizeof(cls, key, value):
+        return cls._sizeof_value(value) + sum(
+            sys.getsizeof(k) for k in key if isinstance(k, str)
+        )
+
+    def get(self, key, default=None):
+        """Return the translation cached with `key`
+
+        Args:
+            key (tuple): Key of the translation
+            default (optional): Value returned if `key` is not cached.
+                Defaults to None.
+
+        Returns:
+            The cached translation, or `default`
+        """
+        with self._lock:
+            try:
+                value, _ = self._cache[key]
+            except KeyError:
+                self._misses = self._misses + 1
+                return default
+            self._cache.move_to_end(key)
+            self._hits = self._hits + 1
+        return self._copy(value)
+
+    def put(self, key, value):
+        """Cache `value` with `key`, evicting the least recently used
+        translations if the cache exceeds its maximum size
+
+        Args:
+            key (tuple): Key of the translation
+            value: Translation to cache
+        """
+        size = self._sizeof(key, value)
+        if size > self.maxsize:
+            return
+        value = self._copy(value)
+        with self._lock:
+            if key in self._cache:
+                self._currsize = self._currsize - self._cache.pop(key)[1]
+            self._cache[key] = (value, size)
+            self._currsize = self._currsize + size
+            while self._currsize > self.maxsize:
+                _, (_, evicted_size) = self._cache.popitem(last=False)
+                self._currsize = self._currsize - evicted_size
+                self._evictions = self._evictions + 1
+
+    def clear(self):
+        """Remove every cached translation and reset the statistics"""
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = self._evictions = 0
+            self._currsize = 0
+
+    def cache_info(self):
+        """Return the cache statistics
+
+        Returns:
+            CacheInfo: Named tuple with the number of hits, misses and
+                evictions, the current size and the maximum size in bytes
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._currsize,
+                self.maxsize,
+            )
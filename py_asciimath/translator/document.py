@@ -0,0 +1,494 @@
+import io
+import logging
+import re
+from collections import deque
+
+from .cache import TranslationCache
+from .translator import ASCIIMath2MathML, Tex2ASCIIMath, Translator
+
+# Imported by HTMLTranslator, the only translator using it
+lxml = None
+
+
+class DocumentTranslator(object):
+    """Translate the math embedded in a text document, such as Markdown
+
+    The document is read from a text stream in chunks and written to
+    another stream as soon as possible, so that the memory used does not
+    depend on the size of the document. Math spans are delimited by
+    single backticks (ASCIIMath) or by `$...$`, `$$...$$` and `\\[...\\]`
+    (LaTeX). Only the spans in the input language of `translator` are
+    translated: the rest of the document, escaped delimiters (`\\$`,
+    `\\\\``) and runs of two or more backticks (Markdown code) included,
+    is copied as it is.
+
+    A `$` opens a span only if it is followed by a non-space character,
+    and closes it only if it is preceded by a non-space character and not
+    followed by a digit, so that prices like `$5` are not math. Spans
+    delimited by `$` or by a backtick can not contain a blank line. A span
+    longer than `max_span` characters, or not closed, is copied as it is.
+
+    Args:
+        translator (Translator): Translator of the math spans. A
+            :class:`~py_asciimath.translator.translator.Tex2ASCIIMath`
+            translates the LaTeX spans into ASCIIMath spans, every other
+            translator the ASCIIMath spans.
+        chunk_size (int, optional): Number of characters read at once.
+            Defaults to 65536.
+        max_span (int, optional): Maximum length of a math span, in
+            characters. Defaults to 65536.
+    """
+
+    _open_pattern = re.compile(r"\\[\\$`]|`+|\$\$?|\\\[")
+    _close_patterns = {
+        "`": re.compile(r"`"),
+        "$": re.compile(r"(?<=[^\s\\])\$(?!\d)"),
+        "$$": re.compile(r"\$\$"),
+        "\\[": re.compile(r"\\\]"),
+    }
+    # Delimiters of the spans that can not contain a blank line
+    _inline = ("`", "$")
+
+    def __init__(self, translator, chunk_size=65536, max_span=65536):
+        if not isinstance(translator, Translator):
+            raise TypeError("translator must be a Translator")
+        self.translator = translator
+        self.chunk_size = chunk_size
+        self.max_span = max_span
+        if isinstance(translator, Tex2ASCIIMath):
+            self.ilang = "latex"
+            self._wrap = ("`", "`")
+        else:
+            self.ilang = "asciimath"
+            self._wrap = ("", "")
+
+    def _close_pattern(self, delim):
+        pattern = self._close_patterns.get(delim)
+        if pattern is None:
+            # Markdown code span, closed by the same run of backticks
+            pattern = re.compile(r"(?<!`)" + delim + r"(?!`)")
+            self._close_patterns[delim] = pattern
+        return pattern
+
+    def _scan(self, src):
+        """Split the text read from `src` in pieces
+
+        Args:
+            src (file): Text stream
+
+        Yields:
+            tuple: `(lang, exp, raw)`, where `raw` is the text of the
+                piece and `lang` is None, if the piece is not math, else
+                the language of the math expression `exp`
+        """
+        buf = ""
+        pos = 0
+        eof = False
+        while True:
+            m = self._open_pattern.search(buf, pos)
+            end = None
+            if m is not None and (m.end() < len(buf) or eof):
+                delim = m.group(0)
+                if delim[0] == "\\" and delim != "\\[":
+                    # Escaped delimiter
+                    end = m.end()
+                elif delim == "$" and (
+                    m.end() == len(buf) or buf[m.end()].isspace()
+                ):
+                    end = m.end()
+                else:
+                    endpos = len(buf)
+                    if delim in self._inline:
+                        blank = buf.find("\n\n", m.end())
+                        if blank != -1:
+                            endpos = blank
+                    close = self._close_pattern(delim).search(
+                        buf, m.end(), endpos
+                    )
+                    if close is not None and (close.end() < len(buf) or eof):
+                        if close.end() - m.start() <= self.max_span:
+                            if pos < m.start():
+                                yield None, None, buf[pos : m.start()]
+                            raw = buf[m.start() : close.end()]
+                            if delim == "`":
+                                yield "asciimath", raw[1:-1], raw
+                            elif len(delim) > 1 and delim[0] == "`":
+                                yield None, None, raw
+                            else:
+                                yield "latex", raw, raw
+                            pos = close.end()
+                            continue
+                        end = m.end()
+                    elif close is None and (
+                        eof
+                        or endpos < len(buf)
+                        or len(buf) - m.start() >= self.max_span
+                    ):
+                        end = m.end()
+                if end is not None:
+                    # Not a math span: copied as it is
+                    yield None, None, buf[pos:end]
+                    pos = end
+                    continue
+            # Copy the text that can not be part of a math span, then read
+            # the next chunk
+            start = m.start() if m is not None else len(buf)
+            if m is None and buf.endswith("\\") and not eof:
+                start = start - 1
+            if pos < start:
+                yield None, None, buf[pos:start]
+            if eof:
+                return
+            buf = buf[start:]
+            pos = 0
+            chunk = src.read(self.chunk_size)
+            if chunk:
+                buf = buf + chunk
+            else:
+                eof = True
+
+    def translate_stream(
+        self,
+        src,
+        dst,
+        raise_errors=False,
+        workers=None,
+        chunksize=64,
+        **kwargs
+    ):
+        """Translate the math spans of the document read from `src`,
+        writing the document to `dst`
+
+        The math spans are translated by
+        :meth:`~py_asciimath.translator.translator.Translator.translate_many`.
+        A span that can not be translated is copied as it is and a warning
+        is logged, unless `raise_errors` is True. If `workers` is
+        specified, the text between the spans being translated by the
+        worker processes is kept in memory until their translations are
+        written.
+
+        Args:
+            src (file): Text stream of the document
+            dst (file): Text stream where the document is written
+            raise_errors (bool, optional): If True, raise the first error
+                instead of copying the span. Defaults to False.
+            workers (int, optional): Number of worker processes. If None,
+                translate in the current process. Defaults to None.
+            chunksize (int, optional): Number of math spans sent at once
+                to a worker process. Defaults to 64.
+            **kwargs: Keyword arguments to `translate(exp, **kwargs)`
+
+        Returns:
+            int: Number of translated math spans
+        """
+        # Text read but not yet written, and math spans (as tuples of
+        # their text) not yet translated
+        pending = deque()
+
+        def spans():
+            for lang, exp, raw in self._scan(src):
+                if lang != self.ilang:
+                    if pending:
+                        pending.append(raw)
+                    else:
+                        dst.write(raw)
+                else:
+                    pending.append((raw,))
+                    yield exp
+
+        translated_spans = 0
+        translations = self.translator.translate_many(
+            spans(),
+            raise_errors=raise_errors,
+            workers=workers,
+            chunksize=chunksize,
+            **kwargs
+        )
+        for translated in translations:
+            while not isinstance(pending[0], tuple):
+                dst.write(pending.popleft())
+            raw = pending.popleft()[0]
+            if isinstance(translated, Exception):
+                logging.warning("Span copied as it is: " + repr(raw))
+                dst.write(raw)
+            else:
+                dst.write(self._wrap[0] + translated + self._wrap[1])
+                translated_spans = translated_spans + 1
+            while pending and not isinstance(pending[0], tuple):
+                dst.write(pending.popleft())
+        while pending:
+            dst.write(pending.popleft())
+        return translated_spans
+
+    def translate(self, doc, from_file=False, to_file=None, **kwargs):
+        """Translate the math spans of a document
+
+        Args:
+            doc (str): Document to translate. If from_file is True, then
+                doc must represent the file's path
+            from_file (bool, optional): If True, read the document from the
+                file specified by doc. Defaults to False.
+            to_file (str, optional): If specified, write the translated
+                document to `to_file` and return None. Defaults to None.
+            **kwargs: Keyword arguments to :meth:`translate_stream`
+
+        Returns:
+            str: Translated document, if `to_file` is None
+        """
+        src = open(doc) if from_file else io.StringIO(doc)
+        with src:
+            if to_file is not None:
+                logging.info("Writing translation to '" + to_file + "'...")
+                with open(to_file, "w") as dst:
+                    self.translate_stream(src, dst, **kwargs)
+                return None
+            dst = io.StringIO()
+            self.translate_stream(src, dst, **kwargs)
+            return dst.getvalue()
+
+
+class HTMLTranslator(object):
+    """Translate the math nodes of an HTML document
+
+    Math nodes are the elements with the `math` class, such as
+    `<span class="math">`, and the `<script type="math/asciimath">`
+    elements: their text, without the surrounding backticks if any, is
+    translated by `translator`. The translations of
+    :class:`~py_asciimath.translator.translator.ASCIIMath2MathML` are
+    inserted in the document as MathML elements, every other translation
+    as text. The content of a math element is replaced by its
+    translation, while a math script is replaced by its translation, if it
+    is a MathML element, or by a `<span class="math">` holding it.
+
+    The document is parsed incrementally by :func:`lxml.etree.iterparse`
+    and every element is written and removed from the tree as soon as it
+    is complete, so that only the ancestors of the current node and the
+    math node being translated are kept in memory. Identical formulas are
+    translated once per document.
+
+    Args:
+        translator (Translator): Translator of the math nodes
+        classes (tuple, optional): Classes of the math elements.
+            Defaults to ("math",).
+        types (tuple, optional): Types of the math scripts.
+            Defaults to ("math/asciimath",).
+        cache_size (int, optional): Maximum size, in bytes, of the
+            translations remembered within a document.
+            Defaults to 16 * 1024 * 1024.
+    """
+
+    # Elements whose text is not escaped
+    _raw_text = ("script", "style")
+
+    def __init__(
+        self,
+        translator,
+        classes=("math",),
+        types=("math/asciimath",),
+        cache_size=16 * 1024 * 1024,
+    ):
+        global lxml
+        import lxml.etree
+
+        if not isinstance(translator, Translator):
+            raise TypeError("translator must be a Translator")
+        self.translator = translator
+        self.classes = frozenset(classes)
+        self.types = frozenset(types)
+        self.cache_size = cache_size
+        self._etree = isinstance(translator, ASCIIMath2MathML)
+        self._tags_cache = {}
+
+    def _is_math(self, el):
+        if el.tag == "script":
+            return el.get("type") in self.types
+        return not self.classes.isdisjoint(el.get("class", "").split())
+
+    @staticmethod
+    def _escape(text):
+        return (
+            text.replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace(">", "&gt;")
+        )
+
+    @staticmethod
+    def _serialize(node):
+        return lxml.etree.tostring(
+            node, method="html", encoding="unicode", with_tail=False
+        )
+
+    def _tags(self, el):
+        # Start and end tags of `el`. Void elements, such as <br>, have no
+        # end tag
+        key = (el.tag,) + tuple(el.items())
+        tags = self._tags_cache.get(key)
+        if tags is None:
+            end = "</" + el.tag + ">"
+            s = self._serialize(lxml.etree.Element(el.tag, dict(el.attrib)))
+            tags = (s[: -len(end)], end) if s.endswith(end) else (s, "")
+            if len(self._tags_cache) >= 4096:
+                self._tags_cache.clear()
+            self._tags_cache[key] = tags
+        return tags
+
+    def _flush(self, entry, dst):
+        # Write the text of the open element `entry[0]` or the tail of its
+        # last child, which are complete once a new child starts or the
+        # element ends
+        el, _, pending = entry
+        if pending is el:
+            if el.text:
+                raw = el.tag in self._raw_text
+                dst.write(el.text if raw else self._escape(el.text))
+        elif pending is not None:
+            if pending.tail:
+                dst.write(self._escape(pending.tail))
+            el.remove(pending)
+        entry[2] = None
+
+    def _replace(self, el, translated):
+        # Return the node replacing the math node `el`
+        if el.tag == "script":
+            if not self._etree:
+                span = lxml.etree.Element("span", {"class": "math"})
+                span.text = translated
+                return span
+            return translated
+        for child in list(el):
+            el.remove(child)
+        if self._etree:
+            el.text = None
+            el.append(translated)
+        else:
+            el.text = translated
+        return el
+
+    def translate_stream(
+        self, src, dst, encoding=None, raise_errors=False, **kwargs
+    ):
+        """Translate the math nodes of the HTML document read from `src`,
+        writing the document to `dst`
+
+        A math node that can not be translated is copied as it is and a
+        warning is logged, unless `raise_errors` is True.
+
+        Args:
+            src (file): Binary stream, or path, of the document
+            dst (file): Text stream where the document is written
+            encoding (str, optional): Encoding of the document. If None,
+                it is read from the document. Defaults to None.
+            raise_errors (bool, optional): If True, raise the first error
+                instead of copying the math node. Defaults to False.
+            **kwargs: Keyword arguments to `translate(exp, **kwargs)`
+
+        Returns:
+            int: Number of translated math nodes
+        """
+        if self._etree:
+            kwargs["output"] = "etree"
+            # Every MathML translation is parsed: load the DTD only once
+            kwargs.setdefault("cached_dtd", True)
+        prepared = self.translator._prepare(**kwargs)
+        # Translations of the formulas of the document
+        cache = TranslationCache(maxsize=self.cache_size)
+        failed = set()
+        translated_nodes = 0
+        # Open elements, as [element, end tag, pending], where pending is
+        # the element itself, if its text is not written yet, or its last
+        # child, if the tail of the child is not written yet
+        stack = []
+        math = None
+        events = lxml.etree.iterparse(
+            src,
+            events=("start", "end", "comment", "pi"),
+            encoding=encoding,
+            html=True,
+            huge_tree=True,
+        )
+        for event, el in events:
+            if math is not None:
+                # Inside a math node, translated as a whole once complete
+                if el is not math or event != "end":
+                    continue
+                math = None
+                node = el
+                exp = "".join(el.itertext()).strip()
+                if len(exp) > 1 and exp[0] == exp[-1] == "`":
+                    exp = exp[1:-1]
+                translated = cache.get((exp,))
+                if translated is None and exp not in failed:
+                    try:
+                        translated = self.translator._translate_cached(
+                            exp, kwargs, prepared
+                        )
+                        cache.put((exp,), translated)
+                    except Exception as e:
+                        if raise_errors:
+                            raise e
+                        failed.add(exp)
+                if translated is None:
+                    logging.warning("Node copied as it is: " + repr(exp))
+                else:
+                    node = self._replace(el, translated)
+                    translated_nodes = translated_nodes + 1
+                dst.write(self._serialize(node))
+            elif event == "start":
+                if stack:
+                    self._flush(stack[-1], dst)
+                else:
+                    doctype = el.getroottree().docinfo.doctype
+                    if doctype:
+                        dst.write(doctype + "\n")
+                if self._is_math(el):
+                    math = el
+                else:
+                    start, end = self._tags(el)
+                    dst.write(start)
+                    stack.append([el, end, el])
+                continue
+            elif event == "end":
+                entry = stack.pop()
+                self._flush(entry, dst)
+                dst.write(entry[1])
+            else:
+                # Comment or processing instruction
+                if stack:
+                    self._flush(stack[-1], dst)
+                dst.write(self._serialize(el))
+            if stack:
+                stack[-1][2] = el
+            elif el.tail:
+                dst.write(self._escape(el.tail))
+        return translated_nodes
+
+    def translate(self, doc, from_file=False, to_file=None, **kwargs):
+        """Translate the math nodes of an HTML document
+
+        Args:
+            doc (str): Document to translate. If from_file is True, then
+                doc must represent the file's path
+            from_file (bool, optional): If True, read the document from the
+                file specified by doc. Defaults to False.
+            to_file (str, optional): If specified, write the translated
+                document to `to_file`, encoded in UTF-8, and return None.
+                Defaults to None.
+            **kwargs: Keyword arguments to :meth:`translate_stream`
+
+        Returns:
+            str: Translated document, if `to_file` is None
+        """
+        if from_file:
+            src = open(doc, "rb")
+        else:
+            src = io.BytesIO(doc.encode("utf-8"))
+            kwargs.setdefault("encoding", "utf-8")
+        with src:
+            if to_file is not None:
+                logging.info("Writing translation to '" + to_file + "'...")
+                with open(to_file, "w", encoding="utf-8") as dst:
+                    self.translate_stream(src, dst, **kwargs)
+                return None
+            dst = io.StringIO()
+            self.translate_stream(src, dst, **kwargs)
+            return dst.getvalue()
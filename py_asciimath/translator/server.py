@@ -0,0 +1,523 @@
+import http.client
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from .. import __version__
+from .translator import (
+    Translator,
+    _error_message,
+    _translator_classes,
+    get_translator,
+)
+
+# Types of the option values accepted in a request
+_option_types = (str, bool, int, float, type(None))
+
+
+def parse_address(address):
+    """Parse the address of a translation server
+
+    Args:
+        address (str): `HOST:PORT`, `PORT` (on localhost) or `unix:PATH`,
+            the path of a Unix domain socket
+
+    Raises:
+        ValueError: If `address` is not valid
+
+    Returns:
+        tuple or str: `(host, port)` or the path of the Unix domain socket
+    """
+    if address.startswith("unix:"):
+        return address[len("unix:") :]
+    host, _, port = address.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(
+            "Expected HOST:PORT, PORT or unix:PATH, got '" + address + "'"
+        )
+    return (host or "127.0.0.1", int(port))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "py_asciimath/" + __version__
+
+    def _reply(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._reply(404, {"error": "Not found: " + self.path})
+        else:
+            self._reply(
+                200,
+                {
+                    "status": "ok",
+                    "translations": [
+                        {"from": ilang, "to": olang}
+                        for ilang, olang in _translator_classes
+                    ],
+                },
+            )
+
+    def do_POST(self):
+        server = self.server.translation_server
+        try:
+            length = int(self.headers.get("Content-Length"))
+        except (TypeError, ValueError):
+            self.close_connection = True
+            self._reply(411, {"error": "Content-Length required"})
+            return
+        if length > server.max_request_size:
+            self.close_connection = True
+            self._reply(413, {"error": "Request too large"})
+            return
+        body = self.rfile.read(length)
+        if self.path != "/translate":
+            self._reply(404, {"error": "Not found: " + self.path})
+            return
+        try:
+            payload = json.loads(body.decode("utf-8"))
+        except ValueError as e:
+            self._reply(400, {"error": "Invalid JSON: " + str(e)})
+            return
+        self._reply(*server.handle(payload))
+
+    def address_string(self):
+        # Unix domain sockets have no client address
+        return str(self.client_address[0] if self.client_address else "unix")
+
+    def log_message(self, format, *args):
+        logging.debug(self.address_string() + " - " + format % args)
+
+
+class _TCPHandler(_Handler):
+    # The headers and the body of an answer are sent separately
+    disable_nagle_algorithm = True
+
+
+class _TCPServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class TranslationServer(object):
+    """Translation server, keeping the translators in memory
+
+    The server speaks HTTP/1.1 on a localhost TCP port or on a Unix
+    domain socket, so that short-lived clients pay neither the interpreter
+    start-up nor the grammar compilation. Translations are requested with
+    `POST /translate` and a JSON body, either a single request::
+
+        {"exp": "x^2", "from": "asciimath", "to": "latex",
+         "options": {"displaystyle": true}}
+
+    answered with `{"translation": "..."}` (status 200) or with
+    `{"error": "..."}` (status 400 if the request is not valid, 422 if the
+    expression can not be translated), or a list of requests, answered
+    with the list of their answers (status 200). `options` are the keyword
+    arguments to the `translate` method of the translator, except
+    `from_file`, `to_file`, `pprint` and `output`. `GET /health` lists the
+    supported translations.
+
+    At most `max_concurrency` requests are translated at once: the other
+    ones wait for at most `queue_timeout` seconds, then they are answered
+    with status 503.
+
+    Args:
+        address (tuple or str, optional): `(host, port)` to listen on, or
+            path of the Unix domain socket. Port 0 picks a free port.
+            Defaults to ("127.0.0.1", 8765).
+        max_concurrency (int, optional): Maximum number of requests
+            translated at once. Defaults to 4.
+        queue_timeout (float, optional): Maximum time, in seconds, that a
+            request waits to be translated. Defaults to 10.
+        max_request_size (int, optional): Maximum size of a request, in
+            bytes. Defaults to 16 * 1024 * 1024.
+        max_batch_size (int, optional): Maximum number of requests in a
+            list. Defaults to 10000.
+        warm (bool, optional): If True, build every translator before
+            listening. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        address=("127.0.0.1", 8765),
+        max_concurrency=4,
+        queue_timeout=10,
+        max_request_size=16 * 1024 * 1024,
+        max_batch_size=10000,
+        warm=True,
+    ):
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self.max_request_size = max_request_size
+        self.max_batch_size = max_batch_size
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        if warm:
+            for ilang, olang in _translator_classes:
+                get_translator(ilang, olang)
+        if isinstance(address, str):
+            self._remove_stale_socket(address)
+            self._server = _UnixServer(address, _Handler)
+        else:
+            self._server = _TCPServer(address, _TCPHandler)
+        self._server.translation_server = self
+        self.address = self._server.server_address
+
+    @staticmethod
+    def _remove_stale_socket(path):
+        # Remove the socket left by a server that is not running anymore
+        try:
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                return
+        except OSError:
+            return
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(path)
+        except OSError:
+            os.unlink(path)
+        finally:
+            sock.close()
+
+    # Options of `translate` that a request can not set: files and outputs
+    # other than a string are local to the server
+    _local_options = ("from_file", "to_file", "pprint", "output")
+    # Names of the options accepted in a request, by translator class
+    _options = {}
+
+    @classmethod
+    def _get_options(cls, translator_class):
+        # Names of the options of the `translate` method of
+        # `translator_class`, without the internal ones of `_prepare` and
+        # `_translate`
+        options = cls._options.get(translator_class)
+        if options is None:
+            import inspect
+
+            options = frozenset(
+                param.name
+                for param in inspect.signature(
+                    translator_class.translate
+                ).parameters.values()
+                if param.default is not param.empty
+                and param.name not in cls._local_options
+            )
+            cls._options[translator_class] = options
+        return options
+
+    @staticmethod
+    def _parse(request):
+        # Return the (ilang, olang, options) of a request
+        if not isinstance(request, dict) or not isinstance(
+            request.get("exp"), str
+        ):
+            raise ValueError("Expected an object with an 'exp' string")
+        ilang = request.get("from")
+        olang = request.get("to")
+        translator_class = _translator_classes.get((ilang, olang))
+        if translator_class is None:
+            raise ValueError(
+                "Translation from '{}' to '{}' is not supported".format(
+                    ilang, olang
+                )
+            )
+        options = request.get("options", {})
+        if not isinstance(options, dict):
+            raise ValueError("Expected 'options' to be an object")
+        allowed = TranslationServer._get_options(translator_class)
+        for name, value in options.items():
+            if name not in allowed:
+                raise ValueError("Unsupported option '" + name + "'")
+            if not isinstance(value, _option_types):
+                raise ValueError("Unsupported value of option '" + name + "'")
+        return ilang, olang, tuple(sorted(options.items()))
+
+    def _translate(self, requests):
+        responses = [None] * len(requests)
+        # Requests with the same translation and options are translated
+        # together, so that the translator is prepared once
+        groups = OrderedDict()
+        for i, request in enumerate(requests):
+            try:
+                groups.setdefault(self._parse(request), []).append(i)
+            except ValueError as e:
+                responses[i] = {"error": str(e)}
+        for (ilang, olang, options), indexes in groups.items():
+            try:
+                translations = get_translator(ilang, olang).translate_many(
+                    (requests[i]["exp"] for i in indexes), **dict(options)
+                )
+                for i, translated in zip(indexes, translations):
+                    if isinstance(translated, Exception):
+                        responses[i] = {"error": _error_message(translated)}
+                    else:
+                        responses[i] = {"translation": translated}
+            except Exception as e:
+                # The options are not valid for the translator, e.g. they
+                # can not be prepared: every request of the group fails
+                for i in indexes:
+                    if responses[i] is None:
+                        responses[i] = {"error": _error_message(e)}
+        return responses
+
+    def handle(self, payload):
+        """Answer a request
+
+        Args:
+            payload: Request, decoded from JSON
+
+        Returns:
+            tuple: HTTP status and answer, to be encoded as JSON
+        """
+        if isinstance(payload, list):
+            if len(payload) > self.max_batch_size:
+                return 413, {"error": "Too many requests in the list"}
+        elif isinstance(payload, dict):
+            try:
+                self._parse(payload)
+            except ValueError as e:
+                return 400, {"error": str(e)}
+        else:
+            return 400, {"error": "Expected an object or a list of objects"}
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            return 503, {"error": "Server busy"}
+        try:
+            if isinstance(payload, list):
+                return 200, self._translate(payload)
+            response = self._translate([payload])[0]
+            return (422 if "error" in response else 200), response
+        finally:
+            self._slots.release()
+
+    def serve_forever(self):
+        """Answer the requests until :meth:`shutdown` is called"""
+        logging.info("Listening on " + str(self.address) + "...")
+        self._server.serve_forever()
+
+    def shutdown(self):
+        """Stop :meth:`serve_forever`, waiting for it to return"""
+        self._server.shutdown()
+
+    def close(self):
+        """Close the listening socket, removing the Unix domain socket"""
+        self._server.server_close()
+        if isinstance(self.address, str):
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=None):
+        super(_UnixHTTPConnection, self).__init__("localhost", timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            sock.settimeout(self.timeout)
+        sock.connect(self.path)
+        self.sock = sock
+
+
+class RemoteTranslator(Translator):
+    """Translator forwarding the translations to a
+    :class:`TranslationServer`
+
+    The connection to the server is kept open between translations.
+    :meth:`translate_many` sends the expressions in lists of `chunksize`
+    expressions, unless `workers` is specified.
+
+    Args:
+        address (tuple or str): `(host, port)` of the server, or path of
+            its Unix domain socket. See :func:`parse_address`.
+        ilang (str): Input language: `asciimath`, `latex` or `mathml`
+        olang (str): Output language: `asciimath`, `latex` or `mathml`
+        timeout (float, optional): Timeout of the connection, in seconds.
+            Defaults to None.
+        cache (TranslationCache, optional): Cache of the translations. See
+            :class:`~py_asciimath.translator.cache.TranslationCache`.
+            Defaults to None.
+        tracer (Tracer, optional): Tracer of the translations. See
+            :class:`~py_asciimath.utils.trace.Tracer`. Defaults to None.
+    """
+
+    def __init__(
+        self, address, ilang, olang, timeout=None, cache=None, tracer=None
+    ):
+        super(RemoteTranslator, self).__init__(cache=cache, tracer=tracer)
+        self.address = address
+        self.ilang = ilang.lower()
+        self.olang = olang.lower()
+        self.timeout = timeout
+        self._init_kwargs = dict(
+            address=address,
+            ilang=ilang,
+            olang=olang,
+            timeout=timeout,
+            cache=cache,
+            tracer=tracer,
+        )
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            if isinstance(self.address, str):
+                connection = _UnixHTTPConnection(self.address, self.timeout)
+            else:
+                connection = http.client.HTTPConnection(
+                    *self.address, timeout=self.timeout
+                )
+            self._local.connection = connection
+        return connection
+
+    def close(self):
+        """Close the connection of the current thread to the server"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def request(self, payload):
+        """Send a request to the server
+
+        Args:
+            payload: Request, encoded as JSON. See
+                :class:`TranslationServer`.
+
+        Returns:
+            tuple: HTTP status and decoded answer
+        """
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        for retry in (True, False):
+            connection = self._connection()
+            try:
+                connection.request("POST", "/translate", body, headers)
+                response = connection.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                # The server may have closed an idle connection
+                self.close()
+                if not retry:
+                    raise
+        if response.getheader("Connection", "").lower() == "close":
+            self.close()
+        return response.status, json.loads(data.decode("utf-8"))
+
+    def _get_cache_key(self, exp, kwargs, prepared=None):
+        key = super(RemoteTranslator, self)._get_cache_key(
+            exp, kwargs, prepared
+        )
+        if key is None:
+            return None
+        # Remote translators share the cache per server and translation
+        return key + (self.address, self.ilang, self.olang)
+
+    def _payload(self, exp, kwargs):
+        # The parse tree is never printed by the server: `pprint=False`, as
+        # passed by the command line, is left out
+        if "pprint" in kwargs and not kwargs["pprint"]:
+            kwargs = dict(kwargs)
+            del kwargs["pprint"]
+        return {
+            "exp": exp,
+            "from": self.ilang,
+            "to": self.olang,
+            "options": kwargs,
+        }
+
+    def _translate(self, exp, **kwargs):
+        status, response = self.request(self._payload(exp, kwargs))
+        if "error" in response:
+            raise Exception(response["error"])
+        return response["translation"]
+
+    def translate_many(
+        self,
+        exps,
+        from_file=False,
+        raise_errors=False,
+        workers=None,
+        chunksize=64,
+        ordered=True,
+        **kwargs
+    ):
+        if workers is not None or self.cache is not None:
+            return super(RemoteTranslator, self).translate_many(
+                exps,
+                from_file=from_file,
+                raise_errors=raise_errors,
+                workers=workers,
+                chunksize=chunksize,
+                ordered=ordered,
+                **kwargs
+            )
+        return self._translate_chunks(
+            exps, from_file, raise_errors, chunksize, kwargs
+        )
+
+    translate_many.__doc__ = Translator.translate_many.__doc__
+
+    def _translate_chunks(
+        self, exps, from_file, raise_errors, chunksize, kwargs
+    ):
+        # Payloads of the expressions of a chunk, or the errors raised
+        # while reading them, which are not sent to the server
+        items = []
+        exps = iter(exps)
+        while True:
+            del items[:]
+            for exp in exps:
+                try:
+                    if from_file:
+                        exp = self._from_file(exp)
+                    items.append(self._payload(exp, kwargs))
+                except Exception as e:
+                    items.append(e)
+                if len(items) == chunksize:
+                    break
+            if not items:
+                return
+            chunk = [item for item in items if not isinstance(item, Exception)]
+            responses = []
+            if chunk:
+                status, responses = self.request(chunk)
+                if status != 200:
+                    # The whole chunk failed, e.g. the server is busy: every
+                    # expression of the chunk fails with the same error
+                    responses = [responses] * len(chunk)
+            responses = iter(responses)
+            for item in items:
+                if isinstance(item, Exception):
+                    e = item
+                else:
+                    response = next(responses)
+                    if "error" not in response:
+                        yield response["translation"]
+                        continue
+                    e = Exception(response["error"])
+                if raise_errors:
+                    raise e
+                logging.warning("Translation failed: " + repr(e))
+                yield e
@@ -1,20 +1,31 @@
 import logging
 import os
+import pickle
+import threading
 from abc import ABCMeta, abstractmethod
-
-import lxml.etree
-from lark import Lark
+from collections import deque
+from functools import partial
+from itertools import islice
 
 from .. import PROJECT_ROOT
-from ..grammar.asciimath_grammar import asciimath_grammar
-from ..grammar.latex_grammar import latex_grammar
-from ..parser.parser import MathMLParser
-from ..transformer.transformer import (
-    ASCIIMath2MathMLTransformer,
-    ASCIIMath2TexTransformer,
-    Tex2ASCIIMathTransformer,
-)
-from ..utils.utils import check_connection
+from ..utils.ast import Node
+from ..utils.rope import to_string
+from ..utils.trace import stage, trace
+
+# lark, the grammars and the transformers are imported when a translator is
+# built, lxml only by the MathML translators, and asyncio and
+# concurrent.futures when they are used, so that importing this module is
+# cheap. See benchmarks/importtime.py
+lxml = None
+MathMLParser = None
+
+
+def _import_mathml():
+    # Bind lxml and the MathML parser, used by the MathML translators
+    global lxml, MathMLParser
+    if MathMLParser is None:
+        import lxml.etree
+        from ..parser.parser import MathMLParser
 
 
 class Translator(metaclass=ABCMeta):
@@ -23,8 +34,19 @@ class Translator(metaclass=ABCMeta):
     Abstract class of type Translator. Every subclass must implement
     the `_translate(self, exp, **kwargs)` method in order to
     correctly expose the `translate(exp, **kwargs)` method
+
+    Args:
+        cache (TranslationCache, optional): Cache of the translations. See
+            :class:`~py_asciimath.translator.cache.TranslationCache`.
+            Defaults to None.
+        tracer (Tracer, optional): Tracer of the translations. See
+            :class:`~py_asciimath.utils.trace.Tracer`. Defaults to None.
     """
 
+    def __init__(self, cache=None, tracer=None):
+        self.cache = cache
+        self.tracer = tracer
+
     def _from_file(self, from_file):
         if os.path.exists(from_file):
             logging.info("Loading file '" + from_file + "'...")
@@ -45,6 +67,82 @@ class Translator(metaclass=ABCMeta):
     def _translate(self, exp, **kwargs):
         pass
 
+    def _prepare(self, **kwargs):
+        """Prepare the keyword arguments of `_translate(exp, **kwargs)`
+
+        The returned keyword arguments are shared by every expression
+        translated by a single call to `translate` or `translate_many`:
+        subclasses can use this method to set up resources, such as XML
+        parsers, once per batch instead of once per expression
+        """
+        return kwargs
+
+    @classmethod
+    def _get_default_options(cls):
+        # Default values of the options accepted by `_prepare` and
+        # `_translate`, so that omitted options and options explicitly set
+        # to their defaults give the same cache key
+        defaults = cls.__dict__.get("_default_options")
+        if defaults is None:
+            import inspect
+
+            defaults = {}
+            for method in (cls._prepare, cls._translate):
+                for param in inspect.signature(method).parameters.values():
+                    if param.default is not param.empty:
+                        defaults[param.name] = param.default
+            cls._default_options = defaults
+        return defaults
+
+    # Constructor arguments that change the translations, such as the
+    # output tree of ASCIIMath2MathML, added to the cache key
+    _output_init_kwargs = ()
+    # Keyword arguments returned by `_prepare` that are resources, such as
+    # XML parsers, rather than options: they are left out of the cache key
+    _resources = ()
+
+    def _get_cache_key(self, exp, kwargs, prepared=None):
+        if self.cache is None or kwargs.get("pprint", False):
+            return None
+        # Translators that can not be rebuilt from their constructor
+        # arguments share the cache only with themselves
+        init_kwargs = getattr(self, "_init_kwargs", None)
+        owner = self if init_kwargs is None else self.__class__
+        options = dict(self._get_default_options(), **kwargs)
+        if prepared is not None:
+            # The options as resolved by `_prepare`, e.g. `network` turned
+            # off when no connection is available
+            options.update(prepared)
+        for name in self._resources:
+            options.pop(name, None)
+        key = (
+            owner,
+            exp,
+            tuple(sorted(options.items())),
+            tuple(
+                (name, (init_kwargs or {}).get(name))
+                for name in self._output_init_kwargs
+            ),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _translate_cached(self, exp, kwargs, prepared=None):
+        if prepared is None:
+            prepared = self._prepare(**kwargs)
+        key = self._get_cache_key(exp, kwargs, prepared)
+        if key is not None:
+            translated = self.cache.get(key)
+            if translated is not None:
+                return translated
+        translated = self._translate(exp, **prepared)
+        if key is not None:
+            self.cache.put(key, translated)
+        return translated
+
     def translate(self, exp, from_file=False, to_file=None, **kwargs):
         """Translates an input expression s
 
@@ -59,14 +157,291 @@ class Translator(metaclass=ABCMeta):
         Returns:
             str: Translated expression
         """
-        if from_file:
-            exp = self._from_file(exp)
-        logging.info("Translating...")
-        exp = self._translate(exp, **kwargs)
-        if to_file is not None:
-            self._to_file(exp, to_file)
+        with trace(self.tracer, self.__class__.__name__):
+            if from_file:
+                with stage(self.tracer, "file_io"):
+                    exp = self._from_file(exp)
+            logging.info("Translating...")
+            exp = self._translate_cached(exp, kwargs)
+            if to_file is not None:
+                with stage(self.tracer, "file_io"):
+                    self._to_file(exp, to_file)
         return exp
 
+    def __reduce__(self):
+        # Translators are pickled as the arguments needed to rebuild them,
+        # which is cheap thanks to the cached parser tables
+        init_kwargs = getattr(self, "_init_kwargs", None)
+        if init_kwargs is None:
+            return super(Translator, self).__reduce__()
+        return (partial(self.__class__, **init_kwargs), ())
+
+    def translate_many(
+        self,
+        exps,
+        from_file=False,
+        raise_errors=False,
+        workers=None,
+        chunksize=64,
+        ordered=True,
+        **kwargs
+    ):
+        """Translates every expression in `exps`
+
+        The setup needed by the translation is done once for the whole
+        batch. An error raised while translating an expression does not
+        abort the batch: the exception is yielded in place of the
+        translation, unless `raise_errors` is True.
+
+        If `workers` is specified, the expressions are translated by a pool
+        of `workers` processes, each one building its own translator once.
+        The expressions are sent to the processes in chunks of `chunksize`
+        expressions.
+
+        Args:
+            exps (iterable): Strings to translate. If from_file is True, then
+                every string must represent a file's path
+            from_file (bool, optional): If True, load every string to
+                translate from the file it specifies. Defaults to False.
+            raise_errors (bool, optional): If True, raise the first error
+                instead of yielding it. Defaults to False.
+            workers (int, optional): Number of worker processes. If None,
+                translate in the current process. Defaults to None.
+            chunksize (int, optional): Number of expressions sent at once
+                to a worker process. Defaults to 64.
+            ordered (bool, optional): If False, the translations computed by
+                the worker processes are yielded as soon as they are
+                available, as `(index, translation)` tuples, where `index`
+                is the position of the expression in `exps`.
+                Defaults to True.
+            **kwargs: Keyword arguments to `translate(exp, **kwargs)`
+
+        Yields:
+            str: Translated expression, or the exception raised while
+                translating it
+        """
+        if workers is None:
+            return self._translate_many(exps, from_file, raise_errors, kwargs)
+        if kwargs.get("output", "string") != "string":
+            raise NotImplementedError(
+                "Only string output is supported with worker processes"
+            )
+        return _translate_parallel(
+            self,
+            exps,
+            from_file,
+            raise_errors,
+            workers,
+            chunksize,
+            ordered,
+            kwargs,
+        )
+
+    def _submit(self, exp, from_file, to_file, executor, kwargs):
+        # Submit the translation to `executor`, returning a
+        # concurrent.futures.Future
+        from concurrent.futures import ProcessPoolExecutor
+
+        if executor is None:
+            executor = _get_default_executor()
+        if isinstance(executor, ProcessPoolExecutor):
+            if kwargs.get("output", "string") != "string":
+                raise NotImplementedError(
+                    "Only string output is supported with worker processes"
+                )
+            return executor.submit(
+                _translate_in_process,
+                pickle.dumps(self),
+                exp,
+                from_file,
+                to_file,
+                kwargs,
+            )
+        return executor.submit(
+            partial(
+                self.translate,
+                exp,
+                from_file=from_file,
+                to_file=to_file,
+                **kwargs
+            )
+        )
+
+    async def _atranslate(
+        self, exp, from_file, to_file, executor, timeout, semaphore, kwargs
+    ):
+        # `semaphore`, if any, must be already acquired: it is released when
+        # the translation is over in the executor, and not when it is
+        # cancelled or timed out, so that it bounds the work actually queued
+        # in the executor
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        try:
+            future = self._submit(exp, from_file, to_file, executor, kwargs)
+        except BaseException:
+            if semaphore is not None:
+                semaphore.release()
+            raise
+        if semaphore is not None:
+            future.add_done_callback(partial(_release, loop, semaphore))
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+
+    async def atranslate(
+        self,
+        exp,
+        from_file=False,
+        to_file=None,
+        executor=None,
+        timeout=None,
+        semaphore=None,
+        **kwargs
+    ):
+        """Translates an input expression without blocking the event loop
+
+        The translation, together with the reading of `from_file` and the
+        writing of `to_file`, is run by `executor`. If the awaiting task is
+        cancelled, or `timeout` expires, a translation still waiting in the
+        executor is dropped, while a running one is left to finish and its
+        result discarded.
+
+        Args:
+            exp (str): String to translate. If from_file is True, then exp
+                must represent the file's path
+            from_file (bool, optional): If True, load the string to translate
+                from the file specified by exp. Defaults to False.
+            to_file (str, optional): If specified, save the translation to
+                `to_file`. Defaults to None.
+            executor (Executor, optional): Thread or process pool executor
+                running the translation. A process pool rebuilds the
+                translator once per process and supports string output
+                only. If None, a thread pool shared by every translator is
+                used. Defaults to None.
+            timeout (float, optional): Seconds to wait for the translation,
+                after which `asyncio.TimeoutError` is raised. If None, wait
+                until the translation is over. Defaults to None.
+            semaphore (asyncio.Semaphore, optional): Semaphore acquired
+                while the translation is in the executor, shared by the
+                callers to bound the number of concurrent translations.
+                Defaults to None.
+            **kwargs: Keyword arguments to `translate(exp, **kwargs)`
+
+        Returns:
+            str: Translated expression
+        """
+        if semaphore is not None:
+            await semaphore.acquire()
+        return await self._atranslate(
+            exp, from_file, to_file, executor, timeout, semaphore, kwargs
+        )
+
+    async def atranslate_many(
+        self,
+        exps,
+        from_file=False,
+        raise_errors=False,
+        executor=None,
+        timeout=None,
+        max_concurrency=8,
+        **kwargs
+    ):
+        """Translates every expression in `exps` without blocking the event
+        loop
+
+        At most `max_concurrency` translations are in the executor at any
+        time, and the expressions are read lazily from `exps`, so that a
+        large batch does not flood the executor. An error raised while
+        translating an expression, or its timeout, does not abort the batch:
+        the exception is returned in place of the translation, unless
+        `raise_errors` is True. If the awaiting task is cancelled, every
+        pending translation is cancelled as well.
+
+        Args:
+            exps (iterable): Strings to translate. If from_file is True, then
+                every string must represent a file's path
+            from_file (bool, optional): If True, load every string to
+                translate from the file it specifies. Defaults to False.
+            raise_errors (bool, optional): If True, raise the first error
+                instead of returning it. Defaults to False.
+            executor (Executor, optional): Thread or process pool executor
+                running the translations. See :meth:`atranslate`.
+                Defaults to None.
+            timeout (float, optional): Seconds to wait for every single
+                translation. Defaults to None.
+            max_concurrency (int, optional): Maximum number of translations
+                in the executor at any time. Defaults to 8.
+            **kwargs: Keyword arguments to `translate(exp, **kwargs)`
+
+        Returns:
+            list: Translated expressions, or the exceptions raised while
+                translating them, in the order of `exps`
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        futures = []
+        # Errors of the translations already over, so that the batch is
+        # aborted as soon as possible if `raise_errors` is True
+        errors = []
+
+        def done(future):
+            if not future.cancelled() and future.exception() is not None:
+                errors.append(future.exception())
+
+        try:
+            for exp in exps:
+                await semaphore.acquire()
+                if raise_errors and errors:
+                    semaphore.release()
+                    break
+                future = asyncio.ensure_future(
+                    self._atranslate(
+                        exp,
+                        from_file,
+                        None,
+                        executor,
+                        timeout,
+                        semaphore,
+                        kwargs,
+                    )
+                )
+                future.add_done_callback(done)
+                futures.append(future)
+            if raise_errors and errors:
+                raise errors[0]
+            translated = await asyncio.gather(
+                *futures, return_exceptions=not raise_errors
+            )
+        finally:
+            for future in futures:
+                future.cancel()
+        for e in translated:
+            if isinstance(e, BaseException):
+                logging.warning("Translation failed: " + repr(e))
+        return translated
+
+    def _translate_many(
+        self, exps, from_file, raise_errors, kwargs, prepared=None
+    ):
+        if prepared is None:
+            prepared = self._prepare(**kwargs)
+        logging.info("Translating...")
+        for exp in exps:
+            try:
+                with trace(self.tracer, self.__class__.__name__):
+                    if from_file:
+                        with stage(self.tracer, "file_io"):
+                            exp = self._from_file(exp)
+                    translated = self._translate_cached(exp, kwargs, prepared)
+            except Exception as e:
+                if raise_errors:
+                    raise
+                logging.warning("Translation failed: " + repr(e))
+                translated = e
+            yield translated
+
 
 class LarkTranslator(Translator):
     """Class that handle the translation from a Lark parsed
@@ -81,13 +456,29 @@ class LarkTranslator(Translator):
             parsed input. See :class:`~lark.Transformer`
         inplace (bool, optional): If True, parse the input inplace.
             See :class:`~lark.Lark`. Defaults to True.
-        lexer (str, optional): Lexer used during parsing. See :class:`~lark.Lark`.
-            Defaults to "contextual".
+        lexer (str, optional): Lexer used during parsing: "trie", see
+            :class:`~py_asciimath.grammar.lexer.TrieLexer`, or a lexer of
+            :class:`~lark.Lark`. Defaults to "contextual".
         parser (str, optional): Parser algorithm. See :class:`~lark.Lark`.
             Defaults to "lalr".
+        cache_dir (str, optional): Directory where the LALR parser tables
+            are cached. If None, the directory is read from the
+            `PY_ASCIIMATH_CACHE_DIR` environment variable, defaulting to
+            `~/.cache/py_asciimath`. If False, the tables are always
+            compiled from the grammar. Defaults to None.
+        cache (TranslationCache, optional): Cache of the translations. See
+            :class:`~py_asciimath.translator.cache.TranslationCache`.
+            Defaults to None.
+        tracer (Tracer, optional): Tracer of the translations. If the
+            transformer has a `set_tracer` method, the calls to its
+            callbacks are traced too. See
+            :class:`~py_asciimath.utils.trace.Tracer`. Defaults to None.
         **kwargs: Additional keyword arguments to the :class:`~lark.Lark` class.
     """
 
+    # Parser used in place of `parser`, if not None: see `_set_engine`
+    fast_parser = None
+
     def __init__(
         self,
         grammar,
@@ -95,24 +486,61 @@ class LarkTranslator(Translator):
         inplace=True,
         lexer="contextual",
         parser="lalr",
+        cache_dir=None,
+        cache=None,
+        tracer=None,
         **kwargs
     ):
-        super(LarkTranslator, self).__init__()
+        from ..grammar.cache import get_parser
+
+        super(LarkTranslator, self).__init__(cache=cache, tracer=tracer)
         self.inplace = inplace
         self.grammar = grammar
         self.transformer = transformer
+        if tracer is not None and hasattr(transformer, "set_tracer"):
+            transformer.set_tracer(tracer)
         if inplace:
             kwargs.update({"transformer": transformer})
-        self.parser = Lark(grammar, parser=parser, lexer=lexer, **kwargs)
+        if lexer == "trie":
+            from ..grammar.lexer import TrieLexer
+
+            lexer = TrieLexer
+        self.parser = get_parser(
+            grammar, cache_dir=cache_dir, parser=parser, lexer=lexer, **kwargs
+        )
+
+    def _set_engine(self, engine):
+        # Parse with lark or with the ASCIIMath recursive descent parser
+        if engine not in ("lark", "fast"):
+            raise ValueError("engine must be one of: lark, fast")
+        if engine == "fast":
+            from ..grammar.fast import ASCIIMathParser
+
+            self.fast_parser = ASCIIMathParser(
+                self.parser, self.transformer, inplace=self.inplace
+            )
 
     def _translate(self, exp, pprint=False):
-        if not self.inplace:
-            parsed = self.parser.parse(exp)
+        if isinstance(exp, Node):
+            # An abstract syntax tree, already parsed by ASCIIMath2AST
+            with stage(self.tracer, "transform"):
+                translated = self.transformer.transform(exp)
+        elif self.fast_parser is not None and not pprint:
+            with stage(self.tracer, "parse"):
+                translated = self.fast_parser.parse(exp)
+        elif not self.inplace:
+            with stage(self.tracer, "parse"):
+                parsed = self.parser.parse(exp)
             if pprint:
                 print(parsed.pretty())
-            return self.transformer.transform(parsed)
+            with stage(self.tracer, "transform"):
+                translated = self.transformer.transform(parsed)
         else:
-            return self.parser.parse(exp)
+            with stage(self.tracer, "parse"):
+                translated = self.parser.parse(exp)
+        # Ropes built by the transformer are flattened only once, here
+        with stage(self.tracer, "transform"):
+            return to_string(translated)
 
     def translate(
         self, exp, from_file=False, to_file=None, pprint=False, **kwargs
@@ -144,18 +572,41 @@ class ASCIIMath2Tex(LarkTranslator):
     Args:
         inplace (bool, optional): If True, parse the input inplace.
             See :class:`~lark.Lark`. Defaults to True.
-        lexer (str, optional): Lexer used during parsing. See :class:`~lark.Lark`.
-            Defaults to "contextual".
+        lexer (str, optional): Lexer used during parsing: "trie", see
+            :class:`~py_asciimath.grammar.lexer.TrieLexer`, or a lexer of
+            :class:`~lark.Lark`. Defaults to "contextual".
         log (bool, optional): If True log the parsing process.
             Defaults to False.
+        memoize (bool, optional): If True memoize the transformation of
+            every subexpression, so that identical subexpressions are
+            transformed once, across translations. Defaults to False.
+        engine (str, optional): Parser of the expressions: "lark", or "fast"
+            for a recursive descent parser of the ASCIIMath grammar, whose
+            translations are the same. See
+            :class:`~py_asciimath.grammar.fast.ASCIIMathParser`.
+            Defaults to "lark".
         parser (str, optional): Parser algorithm. See :class:`~lark.Lark`.
             Defaults to "lalr".
+        cache_dir (str, optional): Directory where the LALR parser tables
+            are cached. See :class:`LarkTranslator`. Defaults to None.
+        cache (TranslationCache, optional): Cache of the translations. See
+            :class:`~py_asciimath.translator.cache.TranslationCache`.
+            Defaults to None.
         **kwargs: Additional keyword arguments to the :class:`~lark.Lark` class.
     """
 
-    def __init__(self, log=False, **kwargs):
+    def __init__(self, log=False, memoize=False, engine="lark", **kwargs):
+        from ..grammar.asciimath_grammar import asciimath_grammar
+        from ..transformer.transformer import ASCIIMath2TexTransformer
+
         super(ASCIIMath2Tex, self).__init__(
-            asciimath_grammar, ASCIIMath2TexTransformer(log=log), **kwargs
+            asciimath_grammar,
+            ASCIIMath2TexTransformer(log=log, memoize=memoize),
+            **kwargs
+        )
+        self._set_engine(engine)
+        self._init_kwargs = dict(
+            kwargs, log=log, memoize=memoize, engine=engine
         )
 
     def _translate(self, exp, displaystyle=False, pprint=False):
@@ -183,8 +634,9 @@ class ASCIIMath2Tex(LarkTranslator):
         """Translates an ASCIIMath string to LaTeX
 
         Args:
-            exp (str): String to translate. If from_file is True, then s
-                must represent the file's path
+            exp (str or Node): String to translate, or its abstract syntax
+                tree, see :class:`ASCIIMath2AST`. If from_file is True,
+                then s must represent the file's path
             displaystyle (bool, optional): Add displaystyle attribute.
                 Defaults to False.
             from_file (bool, optional): If True, load the string to translate
@@ -212,18 +664,66 @@ class ASCIIMath2MathML(LarkTranslator):
     Args:
         inplace (bool, optional): If True, parse the input inplace.
             See :class:`~lark.Lark`. Defaults to True.
-        lexer (str, optional): Lexer used during parsing. See :class:`~lark.Lark`.
-            Defaults to "contextual".
+        lexer (str, optional): Lexer used during parsing: "trie", see
+            :class:`~py_asciimath.grammar.lexer.TrieLexer`, or a lexer of
+            :class:`~lark.Lark`. Defaults to "contextual".
         log (bool, optional): If True log the parsing process.
             Defaults to False.
+        memoize (bool, optional): If True memoize the transformation of
+            every subexpression, so that identical subexpressions are
+            transformed once, across translations. Not supported if `tree`
+            is True. Defaults to False.
+        engine (str, optional): Parser of the expressions: "lark", or "fast"
+            for a recursive descent parser of the ASCIIMath grammar, whose
+            translations are the same. See
+            :class:`~py_asciimath.grammar.fast.ASCIIMathParser`.
+            Defaults to "lark".
+        tree (bool, optional): If True build the MathML tree directly
+            with `lxml.etree`, instead of building a string and parsing it.
+            The tree is validated against the cached local MathML DTD and
+            the string output is always serialized by `lxml.etree`.
+            See :class:`~py_asciimath.parser.parser.MathMLParser.get_dtd`.
+            Defaults to False.
         parser (str, optional): Parser algorithm. See :class:`~lark.Lark`.
             Defaults to "lalr".
+        cache_dir (str, optional): Directory where the LALR parser tables
+            are cached. See :class:`LarkTranslator`. Defaults to None.
+        cache (TranslationCache, optional): Cache of the translations. See
+            :class:`~py_asciimath.translator.cache.TranslationCache`.
+            Defaults to None.
         **kwargs: Additional keyword arguments to the :class:`~lark.Lark` class.
     """
 
-    def __init__(self, log=False, **kwargs):
+    _output_init_kwargs = ("tree",)
+    _resources = ("xml_parser",)
+
+    def __init__(
+        self, log=False, memoize=False, engine="lark", tree=False, **kwargs
+    ):
+        from ..grammar.asciimath_grammar import asciimath_grammar
+        from ..transformer.transformer import (
+            ASCIIMath2MathMLTransformer,
+            ASCIIMath2MathMLTreeTransformer,
+        )
+
+        _import_mathml()
+        if tree:
+            if memoize:
+                raise NotImplementedError(
+                    "Memoization is not supported when building the tree"
+                )
+            transformer = ASCIIMath2MathMLTreeTransformer(log=log)
+        else:
+            transformer = ASCIIMath2MathMLTransformer(
+                log=log, memoize=memoize
+            )
         super(ASCIIMath2MathML, self).__init__(
-            asciimath_grammar, ASCIIMath2MathMLTransformer(log=log), **kwargs
+            asciimath_grammar, transformer, **kwargs
+        )
+        self._set_engine(engine)
+        self.tree = tree
+        self._init_kwargs = dict(
+            kwargs, log=log, memoize=memoize, engine=engine, tree=tree
         )
         self.__output = ["string", "etree"]
 
@@ -238,19 +738,29 @@ class ASCIIMath2MathML(LarkTranslator):
         pprint=False,
         xml_declaration=False,
         xml_pprint=True,
-        **kwargs
+        cached_dtd=False,
+        xml_parser=None,
     ):
         if output not in self.__output:
             raise NotImplementedError(
                 "Possible output are: " + ", ".join(self.__output)
             )
+        if self.tree:
+            return self._translate_tree(
+                exp,
+                displaystyle,
+                dtd,
+                dtd_validation,
+                output,
+                network,
+                pprint,
+                xml_declaration,
+                xml_pprint,
+            )
         if displaystyle:
             dstyle = '<mstyle displaystyle="true">{}</mstyle>'
         else:
             dstyle = "{}"
-        if network and not check_connection():
-            network = False
-            logging.warning("No connection available...")
         parsed = (
             (
                 '<math xmlns="http://www.w3.org/1998/Math/MathML">'
@@ -263,20 +773,95 @@ class ASCIIMath2MathML(LarkTranslator):
             + "</math>"
         )
         if dtd_validation or xml_pprint or xml_declaration or output == "etree":
-            parsed = MathMLParser.parse(
-                parsed, dtd=dtd, dtd_validation=True, network=network, **kwargs
-            )
-            if output == "string":
-                parsed = parsed.getroottree()
-                encoding = parsed.docinfo.encoding
-                parsed = lxml.etree.tostring(
+            with stage(self.tracer, "validation"):
+                parsed = MathMLParser.parse(
                     parsed,
-                    pretty_print=xml_pprint,
-                    xml_declaration=xml_declaration,
-                    encoding=encoding,
-                ).decode(encoding)
+                    dtd=dtd,
+                    dtd_validation=True,
+                    network=network,
+                    parser=xml_parser,
+                    cached_dtd=cached_dtd,
+                )
+            if output == "string":
+                with stage(self.tracer, "serialization"):
+                    parsed = parsed.getroottree()
+                    encoding = parsed.docinfo.encoding
+                    parsed = lxml.etree.tostring(
+                        parsed,
+                        pretty_print=xml_pprint,
+                        xml_declaration=xml_declaration,
+                        encoding=encoding,
+                    ).decode(encoding)
+        return parsed
+
+    def _translate_tree(
+        self,
+        exp,
+        displaystyle,
+        dtd,
+        dtd_validation,
+        output,
+        network,
+        pprint,
+        xml_declaration,
+        xml_pprint,
+    ):
+        nodes = super(ASCIIMath2MathML, self)._translate(exp, pprint=pprint)
+        parsed = self.transformer.math(
+            nodes, displaystyle=displaystyle, namespace=(dtd != "mathml1")
+        )
+        if dtd_validation or xml_pprint or xml_declaration or output == "etree":
+            with stage(self.tracer, "validation"):
+                MathMLParser.set_tree_doctype(
+                    parsed.getroottree(), network, dtd=dtd
+                )
+                MathMLParser.validate(parsed, dtd=dtd)
+            if output == "string":
+                with stage(self.tracer, "serialization"):
+                    parsed = lxml.etree.tostring(
+                        parsed.getroottree(),
+                        pretty_print=xml_pprint,
+                        xml_declaration=xml_declaration,
+                        encoding="UTF-8",
+                    ).decode("UTF-8")
+        else:
+            with stage(self.tracer, "serialization"):
+                parsed = lxml.etree.tostring(parsed, encoding="unicode")
         return parsed
 
+    def _prepare(
+        self,
+        displaystyle=False,
+        dtd=None,
+        dtd_validation=False,
+        output="string",
+        network=False,
+        pprint=False,
+        xml_declaration=False,
+        xml_pprint=True,
+        cached_dtd=False,
+        **kwargs
+    ):
+        from ..utils.utils import check_connection
+
+        if network and not check_connection():
+            network = False
+            logging.warning("No connection available...")
+        return dict(
+            displaystyle=displaystyle,
+            dtd=dtd,
+            dtd_validation=dtd_validation,
+            output=output,
+            network=network,
+            pprint=pprint,
+            xml_declaration=xml_declaration,
+            xml_pprint=xml_pprint,
+            cached_dtd=cached_dtd,
+            xml_parser=MathMLParser.get_parser(
+                dtd_validation=not cached_dtd, network=network, **kwargs
+            ),
+        )
+
     def translate(
         self,
         exp,
@@ -290,13 +875,15 @@ class ASCIIMath2MathML(LarkTranslator):
         to_file=None,
         xml_declaration=False,
         xml_pprint=True,
+        cached_dtd=False,
         **kwargs
     ):
         """Translates an ASCIIMath string to MathML
 
         Args:
-            exp (str): String to translate. If from_file is True, then s
-                must represent the file's path
+            exp (str or Node): String to translate, or its abstract syntax
+                tree, see :class:`ASCIIMath2AST`. If from_file is True,
+                then s must represent the file's path
             displaystyle (bool, optional): Add displaystyle attribute.
                 Defaults to False.
             dtd (str, optional): MathML DTD version to validate the output
@@ -328,6 +915,11 @@ class ASCIIMath2MathML(LarkTranslator):
                 declaration at the beginning of the file.
                 Defaults to False.
             xml_pprint (bool, optional): XML pretty print. Defaults to True.
+            cached_dtd (bool, optional): If True, validate the output
+                against the local MathML DTD, loaded once per process,
+                instead of loading the DTD at every translation. Invalid
+                output raises `lxml.etree.DocumentInvalid`.
+                Defaults to False.
             **kwargs: Additional ~lxml.extree.XMLParser options
 
         Returns:
@@ -345,29 +937,197 @@ class ASCIIMath2MathML(LarkTranslator):
             to_file=to_file,
             xml_declaration=xml_declaration,
             xml_pprint=xml_pprint,
+            cached_dtd=cached_dtd,
             **kwargs
         )
 
 
+class ASCIIMath2AST(LarkTranslator):
+    """Class that parses ASCIIMath once for many output languages
+
+    An expression is parsed into its abstract syntax tree, see
+    :class:`~py_asciimath.utils.ast.Node`, which is translated to every
+    target language by walking it with the transformer of the translator of
+    that language, e.g. :class:`ASCIIMath2Tex` for `latex`, without lexing
+    and parsing the expression again. The tree can be pickled or dumped as
+    JSON (see :meth:`~py_asciimath.utils.ast.Node.dump`), to be rendered
+    later.
+
+    Args:
+        inplace (bool, optional): If True, parse the input inplace.
+            See :class:`~lark.Lark`. Defaults to True.
+        lexer (str, optional): Lexer used during parsing: "trie", see
+            :class:`~py_asciimath.grammar.lexer.TrieLexer`, or a lexer of
+            :class:`~lark.Lark`. Defaults to "contextual".
+        log (bool, optional): If True log the parsing process.
+            Defaults to False.
+        engine (str, optional): Parser of the expressions: "lark" or
+            "fast". See :class:`ASCIIMath2Tex`. Defaults to "lark".
+        renderers (dict, optional): Translators rendering the trees, by
+            target language. The translators of the missing targets are
+            the shared ones returned by :func:`get_translator`.
+            Defaults to None.
+        parser (str, optional): Parser algorithm. See :class:`~lark.Lark`.
+            Defaults to "lalr".
+        cache_dir (str, optional): Directory where the LALR parser tables
+            are cached. See :class:`LarkTranslator`. Defaults to None.
+        cache (TranslationCache, optional): Cache of the trees, or of the
+            translations if `targets` is given. See
+            :class:`~py_asciimath.translator.cache.TranslationCache`.
+            Defaults to None.
+        **kwargs: Additional keyword arguments to the :class:`~lark.Lark` class.
+    """
+
+    # Target languages
+    targets = ("latex", "mathml")
+    _output_init_kwargs = ("renderers",)
+
+    def __init__(self, log=False, engine="lark", renderers=None, **kwargs):
+        from ..grammar.asciimath_grammar import asciimath_grammar
+        from ..transformer.transformer import ASCIIMath2ASTTransformer
+
+        super(ASCIIMath2AST, self).__init__(
+            asciimath_grammar, ASCIIMath2ASTTransformer(log=log), **kwargs
+        )
+        self._set_engine(engine)
+        self.renderers = dict(renderers or {})
+        self._init_kwargs = dict(
+            kwargs, log=log, engine=engine, renderers=renderers
+        )
+
+    def get_renderer(self, target):
+        """Return the translator rendering the trees to `target`
+
+        Args:
+            target (str): Target language: `latex` or `mathml`
+
+        Raises:
+            NotImplementedError: If `target` is not supported
+
+        Returns:
+            Translator: The translator
+        """
+        renderer = self.renderers.get(target)
+        if renderer is None:
+            if target not in self.targets:
+                raise NotImplementedError(
+                    "Possible targets are: " + ", ".join(self.targets)
+                )
+            renderer = get_translator("asciimath", target)
+            self.renderers[target] = renderer
+        return renderer
+
+    def render(self, ast, target, **kwargs):
+        """Translate an abstract syntax tree to `target`
+
+        Args:
+            ast (Node): The tree, see :meth:`translate`
+            target (str): Target language: `latex` or `mathml`
+            **kwargs: Keyword arguments to the `translate` method of the
+                translator of `target`, e.g. `displaystyle`
+
+        Returns:
+            str: Translated expression
+        """
+        return self.get_renderer(target).translate(ast, **kwargs)
+
+    def _prepare(self, targets=None, options=None, **kwargs):
+        # Targets and options as tuples, that can be part of a cache key
+        if targets is not None:
+            targets = tuple(targets)
+        if options is not None:
+            options = tuple(
+                sorted(
+                    (target, tuple(sorted(target_options.items())))
+                    for target, target_options in options.items()
+                )
+            )
+        return dict(kwargs, targets=targets, options=options)
+
+    def _translate(self, exp, targets=None, options=None, pprint=False):
+        ast = self.transformer.sequence(
+            super(ASCIIMath2AST, self)._translate(exp, pprint=pprint)
+        )
+        if targets is None:
+            return ast
+        options = {
+            target: dict(target_options)
+            for target, target_options in options or ()
+        }
+        return {
+            target: self.render(ast, target, **options.get(target, {}))
+            for target in targets
+        }
+
+    def translate(
+        self, exp, targets=None, options=None, from_file=False, pprint=False
+    ):
+        """Parses an ASCIIMath string once, translating it to every target
+
+        Args:
+            exp (str): String to translate. If from_file is True, then s
+                must represent the file's path
+            targets (list, optional): Target languages, `latex` and
+                `mathml`. If None, the abstract syntax tree is returned.
+                Defaults to None.
+            options (dict, optional): Keyword arguments to the `translate`
+                method of the translator of every target, by target, e.g.
+                `{"mathml": {"xml_pprint": False}}`. Defaults to None.
+            from_file (bool, optional): If True, load the string to translate
+                from the file specified by s. Defaults to False.
+            pprint (bool, optional): Abstract Syntax Tree pretty print.
+                Defaults to False.
+
+        Returns:
+            dict: Translated expression, by target, or the abstract syntax
+                tree if `targets` is None
+        """
+        return super(ASCIIMath2AST, self).translate(
+            exp,
+            targets=targets,
+            options=options,
+            from_file=from_file,
+            pprint=pprint,
+        )
+
+
 class Tex2ASCIIMath(LarkTranslator):
     """Class that handle the translation from LaTeX to ASCIIMath
 
     Args:
         inplace (bool, optional): If True, parse the input inplace.
             See :class:`~lark.Lark`. Defaults to True.
-        lexer (str, optional): Lexer used during parsing. See :class:`~lark.Lark`.
-            Defaults to "contextual".
+        lexer (str, optional): Lexer used during parsing: "trie", see
+            :class:`~py_asciimath.grammar.lexer.LatexLexer`, or a lexer of
+            :class:`~lark.Lark`. Defaults to "trie".
         log (bool, optional): If True log the parsing process.
             Defaults to False.
         parser (str, optional): Parser algorithm. See :class:`~lark.Lark`.
             Defaults to "lalr".
+        cache_dir (str, optional): Directory where the LALR parser tables
+            are cached. See :class:`LarkTranslator`. Defaults to None.
+        cache (TranslationCache, optional): Cache of the translations. See
+            :class:`~py_asciimath.translator.cache.TranslationCache`.
+            Defaults to None.
         **kwargs: Additional keyword arguments to the :class:`~lark.Lark` class.
     """
 
-    def __init__(self, log=False, **kwargs):
+    def __init__(self, log=False, lexer="trie", **kwargs):
+        from ..grammar.latex_grammar import latex_grammar
+        from ..transformer.transformer import Tex2ASCIIMathTransformer
+
+        lexer_class = lexer
+        if lexer == "trie":
+            from ..grammar.lexer import LatexLexer
+
+            lexer_class = LatexLexer
         super(Tex2ASCIIMath, self).__init__(
-            latex_grammar, Tex2ASCIIMathTransformer(log=log), **kwargs
+            latex_grammar,
+            Tex2ASCIIMathTransformer(log=log),
+            lexer=lexer_class,
+            **kwargs
         )
+        self._init_kwargs = dict(kwargs, log=log, lexer=lexer)
 
     def _translate(self, exp, pprint=False):
         return super(Tex2ASCIIMath, self)._translate(exp, pprint=pprint)
@@ -400,32 +1160,60 @@ class MathML2Tex(Translator):  # pragma: no cover
 
     The translation from MathML to LaTeX is done via the XSLT provided by
     https://sourceforge.net/projects/xsltml/
+
+    Args:
+        cache (TranslationCache, optional): Cache of the translations. See
+            :class:`~py_asciimath.translator.cache.TranslationCache`.
+            Defaults to None.
+        tracer (Tracer, optional): Tracer of the translations. See
+            :class:`~py_asciimath.utils.trace.Tracer`. Defaults to None.
     """
 
-    def __init__(self):
-        super(MathML2Tex, self).__init__()
+    _resources = ("xml_parser",)
+
+    def __init__(self, cache=None, tracer=None):
+        _import_mathml()
+        super(MathML2Tex, self).__init__(cache=cache, tracer=tracer)
         transformer = lxml.etree.parse(
             open(PROJECT_ROOT + "/translation/mathml2tex/mmltex.xsl", "rb")
         )
         self.transformer = lxml.etree.XSLT(transformer)
+        self._init_kwargs = dict(cache=cache, tracer=tracer)
 
-    def _translate(self, exp, network=False, **kwargs):
-        if network and not check_connection():
-            network = False
-            logging.warning("No connection available...")
+    def _translate(self, exp, network=False, xml_parser=None):
         mml_version = MathMLParser.get_doctype_version(exp)
         if mml_version == "1":
             raise NotImplementedError(
                 "Translation from MathML1 is not supported"
             )
-        parsed = MathMLParser.parse(
-            exp,
-            dtd_validation=True,
+        with stage(self.tracer, "validation"):
+            parsed = MathMLParser.parse(
+                exp,
+                dtd_validation=True,
+                network=network,
+                resolve_entities=True,
+                parser=xml_parser,
+            )
+        with stage(self.tracer, "transform"):
+            parsed = self.transformer(parsed)
+        with stage(self.tracer, "serialization"):
+            return str(parsed)
+
+    def _prepare(self, network=False, **kwargs):
+        from ..utils.utils import check_connection
+
+        if network and not check_connection():
+            network = False
+            logging.warning("No connection available...")
+        return dict(
             network=network,
-            resolve_entities=True,
-            **kwargs
+            xml_parser=MathMLParser.get_parser(
+                dtd_validation=True,
+                network=network,
+                resolve_entities=True,
+                **kwargs
+            ),
         )
-        return str(self.transformer(parsed))
 
     def translate(
         self, exp, from_file=False, network=False, to_file=None, **kwargs
@@ -450,3 +1238,194 @@ class MathML2Tex(Translator):  # pragma: no cover
         return super(MathML2Tex, self).translate(
             exp, from_file=from_file, network=network, to_file=to_file, **kwargs
         )
+
+
+# Translator and `_prepare` keyword arguments of a worker process
+_worker = None
+
+
+def _init_worker(translator, from_file, kwargs):
+    global _worker
+    _worker = (translator, from_file, kwargs, translator._prepare(**kwargs))
+
+
+def _picklable(e):
+    try:
+        pickle.loads(pickle.dumps(e))
+        return e
+    except Exception:
+        return Exception(e.__class__.__name__ + ": " + str(e))
+
+
+def _error_message(e):
+    # First line of the message of the error raised while translating,
+    # prefixed by the name of the error unless it was already wrapped by
+    # `_picklable`
+    message = str(e).strip().split("\n", 1)[0]
+    if type(e) is Exception:
+        return message
+    return e.__class__.__name__ + ": " + message
+
+
+# Thread pool running the asynchronous translations, if no executor is
+# given
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_default_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                _executor = ThreadPoolExecutor()
+    return _executor
+
+
+def _release(loop, semaphore, future):
+    # Release `semaphore` from the thread that completed `future`
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:
+        # The event loop is closed
+        pass
+
+
+# Translators of a process running asynchronous translations, by their
+# pickled representation
+_process_translators = {}
+
+
+def _translate_in_process(pickled, exp, from_file, to_file, kwargs):
+    translator = _process_translators.get(pickled)
+    if translator is None:
+        if len(_process_translators) >= 16:
+            _process_translators.clear()
+        translator = pickle.loads(pickled)
+        _process_translators[pickled] = translator
+    try:
+        return translator.translate(
+            exp, from_file=from_file, to_file=to_file, **kwargs
+        )
+    except Exception as e:
+        raise _picklable(e)
+
+
+def _translate_chunk(chunk):
+    translator, from_file, kwargs, prepared = _worker
+    return [
+        _picklable(t) if isinstance(t, Exception) else t
+        for t in translator._translate_many(
+            chunk, from_file, False, kwargs, prepared
+        )
+    ]
+
+
+def _translate_parallel(
+    translator,
+    exps,
+    from_file,
+    raise_errors,
+    workers,
+    chunksize,
+    ordered,
+    kwargs,
+):
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    exps = iter(exps)
+    # At most two chunks per worker are pending at any time, so that the
+    # expressions are read lazily from `exps`
+    max_pending = 2 * workers
+    pending = deque()
+    starts = {}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(translator, from_file, kwargs),
+    ) as executor:
+        try:
+            start = 0
+            chunk = list(islice(exps, chunksize))
+            while chunk or pending:
+                while chunk and len(pending) < max_pending:
+                    future = executor.submit(_translate_chunk, chunk)
+                    pending.append(future)
+                    starts[future] = start
+                    start = start + len(chunk)
+                    chunk = list(islice(exps, chunksize))
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                for future in done:
+                    index = starts.pop(future)
+                    for translated in future.result():
+                        if raise_errors and isinstance(translated, Exception):
+                            raise translated
+                        yield translated if ordered else (index, translated)
+                        index = index + 1
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+_translator_classes = {
+    ("asciimath", "latex"): ASCIIMath2Tex,
+    ("asciimath", "mathml"): ASCIIMath2MathML,
+    ("latex", "asciimath"): Tex2ASCIIMath,
+    ("mathml", "latex"): MathML2Tex,
+}
+_translators = {}
+_translators_lock = threading.Lock()
+
+
+def get_translator(ilang, olang, **kwargs):
+    """Get a shared translator from `ilang` to `olang`
+
+    Translators are memoized per input language, output language and
+    constructor options, so that the grammar is compiled at most once per
+    process for every set of options. The returned translator holds no
+    per-translation state and can be used concurrently by multiple threads.
+
+    Args:
+        ilang (str): Input language: `asciimath`, `latex` or `mathml`
+        olang (str): Output language: `asciimath`, `latex` or `mathml`
+        **kwargs: Hashable keyword arguments to the translator class
+
+    Raises:
+        NotImplementedError: If the translation from `ilang` to `olang` is
+            not supported
+
+    Returns:
+        Translator: The shared translator
+    """
+    ilang = ilang.lower()
+    olang = olang.lower()
+    try:
+        translator_class = _translator_classes[(ilang, olang)]
+    except KeyError:
+        raise NotImplementedError(
+            "Translation from '{}' to '{}' is not supported".format(
+                ilang, olang
+            )
+        )
+    key = (ilang, olang, tuple(sorted(kwargs.items())))
+    translator = _translators.get(key)
+    if translator is None:
+        with _translators_lock:
+            translator = _translators.get(key)
+            if translator is None:
+                translator = translator_class(**kwargs)
+                _translators[key] = translator
+    return translator
+
+
+def clear_translators():
+    """Remove every shared translator returned by :func:`get_translator`"""
+    with _translators_lock:
+        _translators.clear()
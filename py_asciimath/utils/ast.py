@@ -0,0 +1,100 @@
+class Node(object):
+    """Node of the abstract syntax tree of an ASCIIMath expression
+
+    The tree built by
+    :class:`~py_asciimath.transformer.transformer.ASCIIMath2ASTTransformer`:
+    `data` is the name of the grammar rule, i.e. of the transformer callback
+    that translates the node, and `children` are its nodes and the strings
+    of its tokens. The tree is the parse tree of lark, with the tokens as
+    plain strings and the sequences flattened, and it is transformed by the
+    ASCIIMath transformers as a `lark.Tree` is.
+
+    A tree is serialized by :meth:`dump` as a flat list of strings and
+    lists, that can be stored as JSON, and is pickled the same way: the
+    depth of the tree is not bounded by the recursion limit.
+
+    Args:
+        data (str): Name of the rule
+        children (list): Nodes and strings
+    """
+
+    __slots__ = ("data", "children")
+
+    def __init__(self, data, children):
+        self.data = data
+        self.children = children
+
+    def dump(self):
+        """Return the tree as a flat list, in post-order: a token is its
+        string, a node is the list `[data, n]` following its `n` children
+
+        Returns:
+            list: The serialized tree
+        """
+        out = []
+        stack = [(self, False)]
+        while stack:
+            node, visited = stack.pop()
+            if not isinstance(node, Node):
+                out.append(node)
+            elif visited:
+                out.append([node.data, len(node.children)])
+            else:
+                stack.append((node, True))
+                stack.extend(
+                    (child, False) for child in reversed(node.children)
+                )
+        return out
+
+    @classmethod
+    def load(cls, data):
+        """Build the tree serialized by :meth:`dump`
+
+        Args:
+            data (list): The serialized tree
+
+        Raises:
+            ValueError: If `data` is not a serialized tree
+
+        Returns:
+            Node: The tree
+        """
+        stack = []
+        for item in data:
+            if isinstance(item, str):
+                stack.append(item)
+                continue
+            try:
+                name, n = item
+            except (TypeError, ValueError):
+                raise ValueError("Invalid item: " + repr(item))
+            if (
+                not isinstance(name, str)
+                or not isinstance(n, int)
+                or not 0 <= n <= len(stack)
+            ):
+                raise ValueError("Invalid item: " + repr(item))
+            children = stack[len(stack) - n :]
+            del stack[len(stack) - n :]
+            stack.append(cls(name, children))
+        if len(stack) != 1 or not isinstance(stack[0], cls):
+            raise ValueError("Not a serialized tree")
+        return stack[0]
+
+    def __eq__(self, other):
+        if not isinstance(other, Node):
+            return NotImplemented
+        return self.dump() == other.dump()
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    # Nodes are mutable while the tree is built
+    __hash__ = None
+
+    def __reduce__(self):
+        return (self.__class__.load, (self.dump(),))
+
+    def __repr__(self):
+        return self.__class__.__name__ + ".load(" + repr(self.dump()) + ")"
@@ -41,7 +41,7 @@ class Log(object):  # pragma: no cover
             ) = args
         else:
             (args_names, varargs_names, varkws_names, _) = args
-        if not self.print_self:
+        if not self.print_self and "self" in args_names:
             args_names.remove("self")
         return chain(
             flatten(args_names),
@@ -0,0 +1,104 @@
+class Rope(object):
+    """Concatenation of strings and other ropes, flattened only once
+
+    A transformer that builds its translation with ropes copies every
+    translated subexpression only once, when the whole translation is
+    converted to a string, instead of once for every enclosing
+    subexpression. Ropes are immutable and can be shared by many ropes.
+
+    The length and the first characters (the `head`) of a rope are known
+    without flattening it.
+
+    Args:
+        *parts: Strings and ropes to concatenate
+
+    Attributes:
+        inner: Translation without the outer parenthesis, if the rope is
+            the translation of a parenthesized expression whose
+            parenthesis can be removed; None otherwise. See
+            :meth:`~py_asciimath.transformer.transformer.MathTransformer.group`
+    """
+
+    __slots__ = ("parts", "length", "head", "inner")
+    # Number of the first characters kept in `head`
+    head_size = 32
+
+    def __init__(self, *parts):
+        self.parts = parts
+        length = 0
+        head = ""
+        for part in parts:
+            if isinstance(part, Rope):
+                length = length + part.length
+                if len(head) < self.head_size:
+                    head = head + part.head
+            else:
+                length = length + len(part)
+                if len(head) < self.head_size:
+                    head = head + part
+        self.length = length
+        self.head = head[: self.head_size]
+        self.inner = None
+
+    @classmethod
+    def join(cls, sep, items):
+        """Return the rope of `items` separated by `sep`, like `str.join`
+
+        Args:
+            sep (str): Separator
+            items (list): Strings and ropes to join
+
+        Returns:
+            Rope: The rope
+        """
+        parts = []
+        for i, item in enumerate(items):
+            if i > 0 and sep:
+                parts.append(sep)
+            parts.append(item)
+        return cls(*parts)
+
+    def __len__(self):
+        return self.length
+
+    def __str__(self):
+        out = []
+        stack = [self]
+        while stack:
+            part = stack.pop()
+            if isinstance(part, Rope):
+                stack.extend(reversed(part.parts))
+            else:
+                out.append(part)
+        return "".join(out)
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def startswith(self, prefix):
+        """Return True if the rope starts with `prefix`, like
+        `str.startswith`
+
+        Args:
+            prefix (str): The prefix
+
+        Returns:
+            bool: True if the rope starts with `prefix`
+        """
+        if len(prefix) <= self.head_size:
+            return self.head.startswith(prefix)
+        return str(self).startswith(prefix)
+
+
+def to_string(s):
+    """Convert `s` to a string, if it is a :class:`Rope`
+
+    Args:
+        s: A rope or any other translation
+
+    Returns:
+        The string of `s` if it is a rope, else `s`
+    """
+    if isinstance(s, Rope):
+        return str(s)
+    return s
@@ -0,0 +1,236 @@
+import logging
+import random
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+
+
+class Trace(object):
+    """Record of a single traced translation
+
+    Stage timings are exclusive: the time spent in a stage does not include
+    the time spent in the stages nested into it. When the parser transforms
+    the input inplace, the time spent in the transformer callbacks is
+    accounted to the `transform` stage instead of the `parse` stage.
+
+    Attributes:
+        translator (str): Name of the translator class
+        stages (OrderedDict): Seconds spent in every stage, in order of
+            first appearance
+        rules (Counter): Number of calls to every transformer callback
+        duration (float): Duration of the whole translation, in seconds
+        error (str): Representation of the error raised by the
+            translation; None if the translation succeeded
+    """
+
+    def __init__(self, translator):
+        self.translator = translator
+        self.stages = OrderedDict()
+        self.rules = Counter()
+        self.duration = None
+        self.error = None
+        self._stack = []
+
+    def _add(self, name, elapsed):
+        self.stages[name] = self.stages.get(name, 0.0) + elapsed
+        if self._stack:
+            self._stack[-1][1] += elapsed
+
+    @contextmanager
+    def stage(self, name):
+        """Context manager that times the stage `name`
+
+        Args:
+            name (str): Name of the stage
+        """
+        frame = [name, 0.0]
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            self._add(name, elapsed - frame[1])
+            if self._stack:
+                # Only the exclusive time has been added to the parent
+                self._stack[-1][1] += frame[1]
+
+    def rule(self, name, elapsed):
+        """Record a call to the transformer callback `name`
+
+        Args:
+            name (str): Name of the callback
+            elapsed (float): Duration of the call, in seconds
+        """
+        self.rules[name] += 1
+        if not self._stack or self._stack[-1][0] != "transform":
+            self._add("transform", elapsed)
+
+    def as_dict(self):
+        """Return the trace as a dictionary of plain types
+
+        Returns:
+            dict: The trace
+        """
+        return {
+            "translator": self.translator,
+            "duration": self.duration,
+            "stages": dict(self.stages),
+            "rules": dict(self.rules),
+            "error": self.error,
+        }
+
+
+class _NullStage(object):
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *args):
+        return False
+
+
+_null_stage = _NullStage()
+
+
+def _log_sink(trace):
+    logging.debug("Trace: " + repr(trace.as_dict()))
+
+
+class Tracer(object):
+    """Sampled tracer of translations
+
+    A tracer records, for a sample of the translations, the time spent in
+    every stage of the translation (`file_io`, `parse`, `transform`,
+    `validation`, `serialization`) and the number of calls to every
+    transformer callback. Every completed :class:`Trace` is passed to
+    `sink`, from the thread that did the translation. Errors raised by
+    `sink` are logged and ignored.
+
+    Tracing is per process: a tracer sent to another process, e.g. by
+    `translate_many` with worker processes, is disabled.
+
+    Args:
+        sink (callable, optional): Function called with every completed
+            trace. If None, traces are logged at the DEBUG level.
+            Defaults to None.
+        sample_rate (float, optional): Fraction of the translations to
+            trace, between 0 and 1. Defaults to 1.0.
+    """
+
+    def __init__(self, sink=None, sample_rate=1.0):
+        self.sink = sink if sink is not None else _log_sink
+        self.sample_rate = sample_rate
+        self._local = threading.local()
+
+    def __reduce__(self):
+        return (self.__class__, (None, 0.0))
+
+    @property
+    def current(self):
+        """Trace of the translation running in the current thread; None if
+        the translation is not sampled"""
+        return getattr(self._local, "trace", None)
+
+    @contextmanager
+    def trace(self, translator):
+        """Context manager that traces a translation, if sampled
+
+        Nested calls in the same thread belong to the outermost trace.
+
+        Args:
+            translator (str): Name of the translator
+
+        Yields:
+            Trace: The trace; None if the translation is not sampled
+        """
+        local = self._local
+        if getattr(local, "active", False):
+            yield self.current
+            return
+        local.active = True
+        try:
+            if random.random() >= self.sample_rate:
+                yield None
+                return
+            trace = Trace(translator)
+            local.trace = trace
+            start = time.perf_counter()
+            try:
+                yield trace
+            except Exception as e:
+                trace.error = repr(e)
+                raise
+            finally:
+                trace.duration = time.perf_counter() - start
+                local.trace = None
+                try:
+                    self.sink(trace)
+                except Exception as e:
+                    logging.warning("Trace sink failed: " + repr(e))
+        finally:
+            local.active = False
+
+    def stage(self, name):
+        """Context manager that times the stage `name` of the current
+        trace, if any
+
+        Args:
+            name (str): Name of the stage
+        """
+        trace = self.current
+        if trace is None:
+            return _null_stage
+        return trace.stage(name)
+
+    def wrap(self, name, f):
+        """Wrap the transformer callback `f`, counting and timing its calls
+        within the traced translations
+
+        Args:
+            name (str): Name of the callback
+            f (callable): The callback
+
+        Returns:
+            callable: The wrapped callback
+        """
+        local = self._local
+
+        @wraps(f)
+        def traced(items):
+            trace = getattr(local, "trace", None)
+            if trace is None:
+                return f(items)
+            start = time.perf_counter()
+            try:
+                return f(items)
+            finally:
+                trace.rule(name, time.perf_counter() - start)
+
+        return traced
+
+
+def stage(tracer, name):
+    """Time the stage `name` with `tracer`, if not None
+
+    Args:
+        tracer (Tracer): The tracer, or None
+        name (str): Name of the stage
+    """
+    if tracer is None:
+        return _null_stage
+    return tracer.stage(name)
+
+
+def trace(tracer, translator):
+    """Trace a translation with `tracer`, if not None
+
+    Args:
+        tracer (Tracer): The tracer, or None
+        translator (str): Name of the translator
+    """
+    if tracer is None:
+        return _null_stage
+    return tracer.trace(translator)
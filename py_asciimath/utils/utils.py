@@ -1,11 +1,5 @@
 import logging
 import re
-import socket
-
-try:
-    import http.client as httplib
-except ImportError:
-    import httplib
 
 try:
     import collections.abc as collections
@@ -66,6 +60,9 @@ def check_connection(url="www.google.com", timeout=10.0):  # pragma: no cover
     Returns:
         bool: True, if there is a connection, False otherwise
     """
+    import http.client as httplib
+    import socket
+
     conn = httplib.HTTPSConnection(url, timeout=timeout)
     try:
         conn.request("HEAD", "/")
@@ -34,5 +34,5 @@ setuptools.setup(
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
     ],
-    install_requires=["lark-parser", "docopt", "lxml"],
+    install_requires=["lark-parser>=0.12,<1.0", "docopt", "lxml"],
 )
@@ -0,0 +1,153 @@
+import json
+import pickle
+import unittest
+
+from lark.exceptions import UnexpectedInput
+
+from py_asciimath.translator.cache import TranslationCache
+from py_asciimath.translator.translator import (
+    ASCIIMath2AST,
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+)
+from py_asciimath.utils.ast import Node
+
+FORMULAS = [
+    "x^2",
+    "sum_(i=1)^n i^3=((n(n+1))/2)^2",
+    "sqrt(a^2+b^2) + root(3)(x)",
+    "int_0^1 f(x) dx",
+    "[[a,b],[c,d]] + ((1,2),(3,4))",
+    'f(x) = {(x, "if" x >= 0), (-x, "otherwise"):}',
+    "a_b^c a/b/c color(red)(x) text(a b) ()",
+]
+
+
+class TestASCIIMath2AST(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.translator = ASCIIMath2AST()
+
+    def test_asciimath2ast_1(self):
+        ast = self.translator.translate("a (b c) d")
+        self.assertIsInstance(ast, Node)
+        self.assertEqual(
+            ast.dump(),
+            [
+                "a",
+                ["const", 1],
+                ["exp_interm", 1],
+                "(",
+                "b",
+                ["const", 1],
+                ["exp_interm", 1],
+                "c",
+                ["const", 1],
+                ["exp_interm", 1],
+                ["exp", 2],
+                ")",
+                ["exp_par", 3],
+                ["exp_interm", 1],
+                "d",
+                ["const", 1],
+                ["exp_interm", 1],
+                ["exp", 3],
+            ],
+        )
+
+    def test_asciimath2ast_engines_1(self):
+        translators = [
+            ASCIIMath2AST(engine="fast"),
+            ASCIIMath2AST(inplace=False),
+        ]
+        for exp in FORMULAS:
+            ast = self.translator.translate(exp)
+            for translator in translators:
+                self.assertEqual(translator.translate(exp), ast, exp)
+
+    def test_asciimath2ast_targets_1(self):
+        tex = ASCIIMath2Tex()
+        mathml = ASCIIMath2MathML()
+        for exp in FORMULAS:
+            self.assertEqual(
+                self.translator.translate(
+                    exp,
+                    targets=["latex", "mathml"],
+                    options={"latex": {"displaystyle": True}},
+                ),
+                {
+                    "latex": tex.translate(exp, displaystyle=True),
+                    "mathml": mathml.translate(exp),
+                },
+            )
+
+    def test_asciimath2ast_targets_2(self):
+        mathml = ASCIIMath2MathML(tree=True)
+        translator = ASCIIMath2AST(renderers={"mathml": mathml})
+        self.assertIs(translator.get_renderer("mathml"), mathml)
+        for exp in FORMULAS:
+            ast = translator.translate(exp)
+            self.assertEqual(
+                translator.render(ast, "mathml", xml_pprint=False),
+                mathml.translate(exp, xml_pprint=False),
+            )
+        with self.assertRaises(NotImplementedError):
+            translator.render(ast, "asciimath")
+
+    def test_asciimath2ast_cache_1(self):
+        cache = TranslationCache()
+        translator = ASCIIMath2AST(cache=cache)
+        options = {"latex": {"displaystyle": True}, "mathml": {}}
+        translations = [
+            translator.translate(
+                exp, targets=["latex", "mathml"], options=options
+            )
+            for exp in FORMULAS * 2
+        ]
+        self.assertEqual(
+            translations[: len(FORMULAS)], translations[len(FORMULAS) :]
+        )
+        self.assertEqual(
+            cache.cache_info()[:2], (len(FORMULAS), len(FORMULAS))
+        )
+        self.assertEqual(
+            translator.translate(FORMULAS[0], targets=["latex"]),
+            {"latex": ASCIIMath2Tex().translate(FORMULAS[0])},
+        )
+        self.assertEqual(
+            translator.translate(FORMULAS[0]),
+            self.translator.translate(FORMULAS[0]),
+        )
+        self.assertEqual(
+            cache.cache_info()[:2], (len(FORMULAS), len(FORMULAS) + 2)
+        )
+
+    def test_asciimath2ast_serialization_1(self):
+        for exp in FORMULAS:
+            ast = self.translator.translate(exp)
+            data = json.loads(json.dumps(ast.dump()))
+            self.assertEqual(Node.load(data), ast)
+            self.assertEqual(pickle.loads(pickle.dumps(ast)), ast)
+            self.assertEqual(eval(repr(ast)), ast)
+        self.assertNotEqual(
+            self.translator.translate("a b"), self.translator.translate("a")
+        )
+        for data in [[], ["a"], [["const", 2]], [1], ["a", ["const", "1"]]]:
+            with self.assertRaises(ValueError):
+                Node.load(data)
+
+    def test_asciimath2ast_serialization_2(self):
+        exp = "sqrt " * 10000 + "a"
+        ast = pickle.loads(pickle.dumps(self.translator.translate(exp)))
+        self.assertEqual(
+            self.translator.render(ast, "latex"),
+            "$" + "\\sqrt{" * 10000 + "a" + "}" * 10000 + "$",
+        )
+
+    def test_asciimath2ast_errors_1(self):
+        with self.assertRaises(UnexpectedInput):
+            self.translator.translate("(a+b", targets=["latex"])
+
+
+if __name__ == "__main__":
+    unittest.main()
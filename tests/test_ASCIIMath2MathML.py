@@ -234,6 +234,111 @@ class TestASCIIMath2MathML(unittest.TestCase):
             ).translate("a + b"),
         )
 
+    def test_asciimath2mathml_memoize_1(self):
+        exp = "[(x+1)^2, (x+1)/(y+2)], [(x+1)^2, sum_(i=1)^n (x+1)/(y+2)]"
+        parser = ASCIIMath2MathML(memoize=True)
+        s = parser.translate(exp)
+        self.assertEqual(s, ASCIIMath2MathML().translate(exp))
+        self.assertEqual(s, parser.translate(exp))
+        self.assertGreater(parser.transformer.exp_frac.cache_info().hits, 0)
+
+    def test_asciimath2mathml_cached_dtd_1(self):
+        exp = "sum_(i=1)^n [[x_i, y \\ z], [hat(x), text(a)]]"
+        for dtd in ["mathml1", "mathml2", "mathml3"]:
+            for xml_declaration in [True, False]:
+                self.assertEqual(
+                    ASCIIMath2MathML().translate(
+                        exp,
+                        dtd=dtd,
+                        dtd_validation=True,
+                        xml_declaration=xml_declaration,
+                    ),
+                    ASCIIMath2MathML().translate(
+                        exp,
+                        dtd=dtd,
+                        dtd_validation=True,
+                        xml_declaration=xml_declaration,
+                        cached_dtd=True,
+                    ),
+                )
+
+
+    def test_asciimath2mathml_tree_1(self):
+        exp = (
+            "sum_(i=1)^n [[x_i, y \\ z], [hat(x), text(a)]] + "
+            'root(3)(x/y) "a b" + ((1, 2), (3, 4))'
+        )
+        for dtd in ["mathml1", "mathml2", "mathml3"]:
+            for xml_declaration in [True, False]:
+                for xml_pprint in [True, False]:
+                    self.assertEqual(
+                        ASCIIMath2MathML().translate(
+                            exp,
+                            dtd=dtd,
+                            dtd_validation=True,
+                            xml_declaration=xml_declaration,
+                            xml_pprint=xml_pprint,
+                            displaystyle=True,
+                        ),
+                        ASCIIMath2MathML(tree=True).translate(
+                            exp,
+                            dtd=dtd,
+                            dtd_validation=True,
+                            xml_declaration=xml_declaration,
+                            xml_pprint=xml_pprint,
+                            displaystyle=True,
+                        ),
+                    )
+
+    def test_asciimath2mathml_tree_2(self):
+        exp = "x^2 + alpha != (a, b]"
+        self.assertEqual(
+            ASCIIMath2MathML().translate(exp, xml_pprint=False),
+            ASCIIMath2MathML(tree=True).translate(exp, xml_pprint=False),
+        )
+        exp = exp + " color(red)(x)"
+        el = ASCIIMath2MathML(tree=True).translate(exp, output="etree")
+        self.assertIsInstance(el, lxml.etree._Element)
+        self.assertEqual(
+            lxml.etree.tostring(el),
+            lxml.etree.tostring(
+                ASCIIMath2MathML().translate(exp, output="etree")
+            ),
+        )
+
+    def test_asciimath2mathml_tree_3(self):
+        self.assertRaises(
+            NotImplementedError, ASCIIMath2MathML, tree=True, memoize=True
+        )
+
+    def test_asciimath2mathml_matrix_1(self):
+        for tree in [False, True]:
+            parser = ASCIIMath2MathML(log=False, tree=tree)
+            self.assertEqual(
+                parser.translate("[[[1,2],[3,4]],[5]]", xml_pprint=False),
+                '<math xmlns="http://www.w3.org/1998/Math/MathML">'
+                "<mrow><mo>[</mo><mtable><mtr><mtd><mtable>"
+                "<mtr><mtd><mn>1</mn></mtd><mtd><mn>2</mn></mtd></mtr>"
+                "<mtr><mtd><mn>3</mn></mtd><mtd><mn>4</mn></mtd></mtr>"
+                "</mtable></mtd></mtr><mtr><mtd><mn>5</mn></mtd></mtr>"
+                "</mtable><mo>]</mo></mrow></math>",
+            )
+            self.assertEqual(
+                parser.translate('[(a,"(,b"),(c,d)]', xml_pprint=False),
+                '<math xmlns="http://www.w3.org/1998/Math/MathML">'
+                "<mrow><mo>[</mo><mtable>"
+                "<mtr><mtd><mi>a</mi></mtd><mtd><mtext>(,b</mtext></mtd></mtr>"
+                "<mtr><mtd><mi>c</mi></mtd><mtd><mi>d</mi></mtd></mtr>"
+                "</mtable><mo>]</mo></mrow></math>",
+            )
+            self.assertNotIn(
+                "mtable",
+                parser.translate("[[a,(b,c)],[d,e,f]]", xml_pprint=False),
+            )
+            self.assertNotIn(
+                "mtable",
+                parser.translate("[[a,b],[c,d] x]", xml_pprint=False),
+            )
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+from py_asciimath.transformer.transformer import ASCIIMath2TexTransformer
 from py_asciimath.translator.translator import ASCIIMath2Tex
 
 
@@ -113,6 +114,63 @@ class TestASCIIMath2Tex(unittest.TestCase):
         s = parser.translate('A \\ B "setminus"')
         self.assertEqual(s, r"$A \setminus B \text{setminus}$")
 
+    def test_asciimath2tex_memoize_1(self):
+        exp = "[(x+1)^2, (x+1)/(y+2)], [(x+1)^2, sum_(i=1)^n (x+1)/(y+2)]"
+        parser = ASCIIMath2Tex(memoize=True)
+        s = parser.translate(exp)
+        self.assertEqual(s, ASCIIMath2Tex().translate(exp))
+        self.assertEqual(s, parser.translate(exp))
+        self.assertGreater(
+            parser.transformer.exp_super.cache_info().hits, 0
+        )
+        parser.transformer.clear_memo()
+        self.assertEqual(parser.transformer.exp_super.cache_info().hits, 0)
+
+    def test_asciimath2tex_log_1(self):
+        transformer = ASCIIMath2TexTransformer(log=False)
+        self.assertIs(
+            transformer.exp_frac.__func__, ASCIIMath2TexTransformer.exp_frac
+        )
+        self.assertNotIn("exp_frac", vars(transformer))
+        transformer = ASCIIMath2TexTransformer(log=True)
+        self.assertIn("exp_frac", vars(transformer))
+        with self.assertLogs(level="INFO") as cm:
+            ASCIIMath2Tex(log=True).translate("x/y")
+        self.assertIn("INFO:root:Calling exp_frac with args:", cm.output)
+
+
+    def test_asciimath2tex_parenthesis_1(self):
+        parser = ASCIIMath2Tex(log=False)
+        self.assertEqual(
+            parser.translate("x_((a)+(b)) frac(((a+b)))([c])"),
+            r"${x}_{\left(a\right) + \left(b\right)} "
+            r"\frac{\left(\left(a + b\right)\right)}{\left[c\right]}$",
+        )
+        self.assertEqual(
+            parser.translate("x^{:a:} sqrt((x))"),
+            r"${x}^{\left.a\right.} \sqrt{\left(x\right)}$",
+        )
+
+    def test_asciimath2tex_matrix_1(self):
+        parser = ASCIIMath2Tex(log=False)
+        self.assertEqual(
+            parser.translate("[[a,[b,c]],[d,]] + ((1),(2),)"),
+            r"$\left[\begin{matrix}a  &  \left[b , c\right]  \\  "
+            r"d  & \null\end{matrix}\right] + "
+            r"\left(\begin{matrix}1  \\  2  \\ \end{matrix}\right)$",
+        )
+        self.assertEqual(
+            parser.translate('[[[1,2],[3,4]],[5]] [(x_(i,j),"t,"),(y,z)]'),
+            r"$\left[\begin{matrix}\begin{matrix}1  &  2  \\  "
+            r"3  &  4\end{matrix}  \\  5\end{matrix}\right] "
+            r"\left[\begin{matrix}{x}_{i , j}  &  \text{t,}  \\  "
+            r"y  &  z\end{matrix}\right]$",
+        )
+        self.assertEqual(
+            parser.translate("[[a,(b,c)],[d,e,f]]"),
+            r"$\left[\left[a , \left(b , c\right)\right] , "
+            r"\left[d , e , f\right]\right]$",
+        )
 
 if __name__ == "__main__":
     unittest.main()
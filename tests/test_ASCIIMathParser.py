@@ -0,0 +1,109 @@
+import random
+import unittest
+
+from lark.exceptions import UnexpectedCharacters, UnexpectedInput
+
+from py_asciimath.translation import tables
+from py_asciimath.translator.translator import ASCIIMath2MathML, ASCIIMath2Tex
+
+FORMULAS = [
+    "x^2",
+    "sum_(i=1)^n i^3=((n(n+1))/2)^2",
+    "sqrt(a^2+b^2) + root(3)(x)",
+    "int_0^1 f(x) dx",
+    "[[a,b],[c,d]] + ((1,2),(3,4))",
+    "e^(i pi)+1=0",
+    "lim_(x->oo) (1+1/x)^x",
+    'f(x) = {(x, "if" x >= 0), (-x, "otherwise"):}',
+    "a_b^c a^b_c a/b/c a_b_c a / _ b",
+    "frac a b c sqrt sqrt x color(red)(x) ()",
+    "|:x:| ||:v:|| langle a,b rangle <<a>> (:a:) {:b:}",
+    "dx/dy del t sinx rr >-> |->> -= ~~",
+]
+
+
+def _translate(translator, exp, **kwargs):
+    try:
+        return translator.translate(exp, **kwargs)
+    except Exception as e:
+        return type(e)
+
+
+class TestASCIIMathParser(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def assertSameTranslations(self, translators, exps, **kwargs):
+        lark, fast = translators
+        for exp in exps:
+            self.assertEqual(
+                _translate(fast, exp, **kwargs),
+                _translate(lark, exp, **kwargs),
+                exp,
+            )
+
+    def _fuzz(self, n, seed):
+        rnd = random.Random(seed)
+        symbols = [k for t in tables.asciimath2latex.values() for k in t]
+        symbols = symbols + ["a", "x", "12", "3.5", "dx", '"a b"', "(", ")"]
+        return [
+            rnd.choice(["", " "]).join(
+                rnd.choice(symbols) for _ in range(rnd.randint(1, 12))
+            )
+            for _ in range(n)
+        ]
+
+    def test_asciimath_parser_tex_1(self):
+        translators = [ASCIIMath2Tex(), ASCIIMath2Tex(engine="fast")]
+        self.assertSameTranslations(translators, FORMULAS)
+        self.assertSameTranslations(translators, self._fuzz(500, 0))
+        self.assertSameTranslations(translators, FORMULAS, displaystyle=True)
+
+    def test_asciimath_parser_tex_2(self):
+        translators = [
+            ASCIIMath2Tex(inplace=False, memoize=True),
+            ASCIIMath2Tex(engine="fast", inplace=False, memoize=True),
+        ]
+        self.assertSameTranslations(translators, FORMULAS)
+        self.assertSameTranslations(translators, self._fuzz(200, 1))
+
+    def test_asciimath_parser_mathml_1(self):
+        translators = [
+            ASCIIMath2MathML(),
+            ASCIIMath2MathML(engine="fast"),
+        ]
+        self.assertSameTranslations(translators, FORMULAS, xml_pprint=False)
+        self.assertSameTranslations(
+            translators, self._fuzz(200, 2), xml_pprint=False
+        )
+
+    def test_asciimath_parser_mathml_2(self):
+        translators = [
+            ASCIIMath2MathML(tree=True),
+            ASCIIMath2MathML(engine="fast", tree=True),
+        ]
+        self.assertSameTranslations(translators, FORMULAS, xml_pprint=False)
+
+    def test_asciimath_parser_errors_1(self):
+        translator = ASCIIMath2Tex(engine="fast")
+        with self.assertRaises(UnexpectedCharacters):
+            translator.translate("a & b")
+        for exp in ["", "(a+b", "a )", "a ^", "sqrt"]:
+            with self.assertRaises(UnexpectedInput):
+                translator.translate(exp)
+
+    def test_asciimath_parser_nesting_1(self):
+        translators = [ASCIIMath2Tex(), ASCIIMath2Tex(engine="fast")]
+        self.assertSameTranslations(
+            translators,
+            ["(" * 2000 + "a" + ")" * 2000, " ".join(["a^2"] * 5000)],
+        )
+
+    def test_asciimath_parser_engine_1(self):
+        with self.assertRaises(ValueError):
+            ASCIIMath2Tex(engine="earley")
+        self.assertIsNone(ASCIIMath2Tex().fast_parser)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import io
+import json
+import unittest
+
+from py_asciimath.translator.batch import BatchTranslator
+from py_asciimath.translator.translator import ASCIIMath2Tex, Tex2ASCIIMath
+
+lines = "x^2\n\nsum_(i=1)^n i\n(((\nalpha\n"
+records = (
+    '"x^2"\n'
+    '{"id": 7, "exp": "frac a b"}\n'
+    "\n"
+    '{"id": 8, "exp": "((("}\n'
+    "not json\n"
+    '{"id": 9}\n'
+)
+
+
+class TestBatchTranslator(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def translate(self, batch, src, **kwargs):
+        dst = io.StringIO()
+        translated = batch.translate_stream(io.StringIO(src), dst, **kwargs)
+        return translated, dst.getvalue()
+
+    def test_batch_lines_1(self):
+        batch = BatchTranslator(ASCIIMath2Tex())
+        self.assertEqual(
+            self.translate(batch, lines),
+            (
+                3,
+                "${x}^{2}$\n\n${\\sum}_{i = 1}^{n} i$\n\n$\\alpha$\n",
+            ),
+        )
+        batch = BatchTranslator(ASCIIMath2Tex(), on_error="skip")
+        self.assertEqual(
+            self.translate(batch, lines),
+            (3, "${x}^{2}$\n\n${\\sum}_{i = 1}^{n} i$\n$\\alpha$\n"),
+        )
+        batch = BatchTranslator(Tex2ASCIIMath())
+        self.assertEqual(
+            self.translate(batch, "$x^{2}$\r\n\\frac{a}{\r\n"),
+            (1, "(x)^(2)\n\n"),
+        )
+
+    def test_batch_jsonl_1(self):
+        batch = BatchTranslator(ASCIIMath2Tex(), format="jsonl")
+        translated, dst = self.translate(batch, records)
+        self.assertEqual(translated, 2)
+        dst = [json.loads(line) for line in dst.splitlines()]
+        self.assertEqual(
+            dst[:2],
+            [
+                {"exp": "x^2", "translation": "${x}^{2}$"},
+                {
+                    "id": 7,
+                    "exp": "frac a b",
+                    "translation": "$\\frac{a}{b}$",
+                },
+            ],
+        )
+        self.assertEqual(
+            [(r.get("id"), r["line"]) for r in dst[2:]],
+            [(8, 4), (None, 5), (None, 6)],
+        )
+        self.assertTrue(dst[2]["error"].startswith("UnexpectedToken: "))
+        batch = BatchTranslator(
+            ASCIIMath2Tex(), format="jsonl", on_error="skip"
+        )
+        self.assertEqual(
+            len(self.translate(batch, records)[1].splitlines()), 2
+        )
+
+    def test_batch_abort_1(self):
+        for format, src in [("lines", lines), ("jsonl", records)]:
+            batch = BatchTranslator(
+                ASCIIMath2Tex(), format=format, on_error="abort"
+            )
+            self.assertRaises(Exception, self.translate, batch, src)
+        batch = BatchTranslator(
+            ASCIIMath2Tex(), format="jsonl", on_error="abort"
+        )
+        self.assertRaises(ValueError, self.translate, batch, "[1]\n")
+
+    def test_batch_workers_1(self):
+        for format, src in [("lines", lines), ("jsonl", records)]:
+            batch = BatchTranslator(ASCIIMath2Tex(), format=format)
+            self.assertEqual(
+                self.translate(batch, src * 20, workers=2, chunksize=3),
+                self.translate(batch, src * 20),
+            )
+
+    def test_batch_translator_1(self):
+        self.assertRaises(TypeError, BatchTranslator, "asciimath")
+        self.assertRaises(
+            ValueError, BatchTranslator, ASCIIMath2Tex(), format="csv"
+        )
+        self.assertRaises(
+            ValueError, BatchTranslator, ASCIIMath2Tex(), on_error="ignore"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
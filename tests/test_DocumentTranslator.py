@@ -0,0 +1,105 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from py_asciimath.translator.document import DocumentTranslator
+from py_asciimath.translator.translator import ASCIIMath2Tex, Tex2ASCIIMath
+
+doc = (
+    "# Title\n\n"
+    "Inline `x^2` and `sum_(i=1)^n i`, costs $5 or $ 6,\n"
+    "\\$x\\$ and \\`y\\` are escaped, unclosed `x and $y\n\n"
+    "Code ``a `b` c`` and\n"
+    "```\n`z`\n```\n"
+    "LaTeX $\\frac{1}{2}$, $$x^{2}$$ and \\[\\sqrt{x}\\], `bad ((` end\n\n"
+)
+
+
+class TestDocumentTranslator(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_document_asciimath_1(self):
+        document = DocumentTranslator(ASCIIMath2Tex())
+        self.assertEqual(
+            document.translate(doc),
+            "# Title\n\n"
+            "Inline ${x}^{2}$ and ${\\sum}_{i = 1}^{n} i$, "
+            "costs $5 or $ 6,\n"
+            "\\$x\\$ and \\`y\\` are escaped, unclosed `x and $y\n\n"
+            "Code ``a `b` c`` and\n"
+            "```\n`z`\n```\n"
+            "LaTeX $\\frac{1}{2}$, $$x^{2}$$ and \\[\\sqrt{x}\\], "
+            "`bad ((` end\n\n",
+        )
+
+    def test_document_latex_1(self):
+        document = DocumentTranslator(Tex2ASCIIMath())
+        self.assertEqual(
+            document.translate(doc),
+            "# Title\n\n"
+            "Inline `x^2` and `sum_(i=1)^n i`, costs $5 or $ 6,\n"
+            "\\$x\\$ and \\`y\\` are escaped, unclosed `x and $y\n\n"
+            "Code ``a `b` c`` and\n"
+            "```\n`z`\n```\n"
+            "LaTeX `frac(1)(2)`, `(x)^(2)` and `sqrt(x)`, "
+            "`bad ((` end\n\n",
+        )
+
+    def test_document_chunks_1(self):
+        for translator in [ASCIIMath2Tex(), Tex2ASCIIMath()]:
+            translated = DocumentTranslator(translator).translate(doc)
+            for chunk_size in range(1, 8):
+                document = DocumentTranslator(
+                    translator, chunk_size=chunk_size
+                )
+                self.assertEqual(document.translate(doc), translated)
+            document = DocumentTranslator(translator, max_span=4)
+            for exp in ["`x^2`", "$x^{2}$", "`x\n\ny`", "$x\n\ny$"]:
+                self.assertEqual(document.translate(exp), exp)
+
+    def test_document_stream_1(self):
+        document = DocumentTranslator(ASCIIMath2Tex(), chunk_size=16)
+        dst = io.StringIO()
+        self.assertEqual(
+            document.translate_stream(io.StringIO(doc * 10), dst), 20
+        )
+        self.assertEqual(dst.getvalue(), document.translate(doc * 10))
+        self.assertRaises(
+            Exception,
+            document.translate_stream,
+            io.StringIO(doc),
+            io.StringIO(),
+            raise_errors=True,
+        )
+
+    def test_document_workers_1(self):
+        document = DocumentTranslator(Tex2ASCIIMath(), chunk_size=64)
+        self.assertEqual(
+            document.translate(doc * 20, workers=2, chunksize=3),
+            document.translate(doc * 20),
+        )
+
+    def test_document_file_1(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "doc.md")
+            with open(path, "w") as f:
+                f.write(doc)
+            document = DocumentTranslator(ASCIIMath2Tex())
+            self.assertIsNone(
+                document.translate(path, from_file=True, to_file=path + ".out")
+            )
+            with open(path + ".out") as f:
+                self.assertEqual(f.read(), document.translate(doc))
+        finally:
+            shutil.rmtree(tmp)
+
+    def test_document_translator_1(self):
+        self.assertRaises(TypeError, DocumentTranslator, "asciimath")
+
+
+if __name__ == "__main__":
+    unittest.main()
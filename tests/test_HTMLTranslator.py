@@ -0,0 +1,127 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import lxml.etree
+
+from py_asciimath.translator.document import HTMLTranslator
+from py_asciimath.translator.translator import ASCIIMath2MathML, ASCIIMath2Tex
+
+doc = (
+    "<!DOCTYPE html>\n"
+    "<html><head><title>T &amp; U</title><style>p > b {}</style></head>\n"
+    '<body class="b">\n<!-- c -->\n'
+    '<div><p>Sum <span class="math inline">`x^2`</span> and\n'
+    '<script type="math/asciimath">x^2</script>, '
+    'again <span class="math">x^2</span>.<br>\n'
+    'Bad <span class="math">((<b>x</b></span> &lt;ok&gt; café</p>\n'
+    "<script>if (a < b) {}</script></div>\n"
+    'tail <img src="a.png"> end\n'
+    "</body></html>"
+)
+
+
+class TestHTMLTranslator(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_html_latex_1(self):
+        html = HTMLTranslator(ASCIIMath2Tex())
+        self.assertEqual(
+            html.translate(doc),
+            "<!DOCTYPE html>\n"
+            "<html><head><title>T &amp; U</title>"
+            "<style>p > b {}</style></head>\n"
+            '<body class="b">\n<!-- c -->\n'
+            '<div><p>Sum <span class="math inline">${x}^{2}$</span> and\n'
+            '<span class="math">${x}^{2}$</span>, '
+            'again <span class="math">${x}^{2}$</span>.<br>\n'
+            'Bad <span class="math">((<b>x</b></span> &lt;ok&gt; '
+            "café</p>\n"
+            "<script>if (a < b) {}</script></div>\n"
+            'tail <img src="a.png"> end\n'
+            "</body></html>",
+        )
+
+    def test_html_mathml_1(self):
+        html = HTMLTranslator(ASCIIMath2MathML())
+        translated = html.translate(doc, xml_pprint=False)
+        root = lxml.etree.fromstring(translated, lxml.etree.HTMLParser())
+        spans = root.findall(".//span")
+        self.assertEqual(len(spans), 3)
+        # The script is replaced by the MathML element
+        self.assertIsNone(root.find(".//script[@type]"))
+        for span in spans[:2]:
+            self.assertEqual(len(span), 1)
+            self.assertEqual(span[0].tag, "math")
+        self.assertEqual(len(root.findall(".//math")), 3)
+        self.assertIn("<mi>x</mi>", translated)
+        self.assertNotIn("&lt;mi&gt;", translated)
+
+    def test_html_stream_1(self):
+        translator = ASCIIMath2Tex()
+        calls = []
+        translate = translator._translate
+
+        def counting(exp, **kwargs):
+            calls.append(exp)
+            return translate(exp, **kwargs)
+
+        translator._translate = counting
+        html = HTMLTranslator(translator)
+        body = "".join(
+            '<div id="d{}"><p>{} <span class="math">x^{}</span></p></div>'
+            "\n".format(i, "&lt;" * i, i % 3)
+            for i in range(200)
+        )
+        src = "<html><body>" + body + "</body></html>"
+        dst = io.StringIO()
+        self.assertEqual(
+            html.translate_stream(
+                io.BytesIO(src.encode("utf-8")), dst, encoding="utf-8"
+            ),
+            200,
+        )
+        # Identical formulas are translated once
+        self.assertEqual(sorted(calls), ["x^0", "x^1", "x^2"])
+        self.assertEqual(
+            dst.getvalue(),
+            src.replace('"math">x^0', '"math">${x}^{0}$')
+            .replace('"math">x^1', '"math">${x}^{1}$')
+            .replace('"math">x^2', '"math">${x}^{2}$'),
+        )
+        self.assertRaises(
+            Exception,
+            html.translate,
+            doc,
+            raise_errors=True,
+        )
+
+    def test_html_file_1(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "doc.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(doc)
+            html = HTMLTranslator(ASCIIMath2Tex())
+            self.assertIsNone(
+                html.translate(
+                    path,
+                    from_file=True,
+                    to_file=path + ".out",
+                    encoding="utf-8",
+                )
+            )
+            with open(path + ".out", encoding="utf-8") as f:
+                self.assertEqual(f.read(), html.translate(doc))
+        finally:
+            shutil.rmtree(tmp)
+
+    def test_html_translator_1(self):
+        self.assertRaises(TypeError, HTMLTranslator, "asciimath")
+
+
+if __name__ == "__main__":
+    unittest.main()
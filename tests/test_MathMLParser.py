@@ -1,5 +1,7 @@
 import unittest
 
+import lxml.etree
+
 from py_asciimath import PROJECT_ROOT
 from py_asciimath.parser.parser import MathMLParser
 
@@ -130,6 +132,52 @@ class TestMathMLParser(unittest.TestCase):
             False
         )
 
+    def test_mathmlparser_get_dtd(self):
+        cached = MathMLParser.get_dtd("mathml3")
+        self.assertIs(cached, MathMLParser.get_dtd())
+        self.assertIsInstance(cached.dtd, lxml.etree.DTD)
+        self.assertEqual(
+            cached.nsmap, {"xlink": "http://www.w3.org/1999/xlink"}
+        )
+        self.assertIn("setminus", cached.entities)
+        self.assertRaises(NotImplementedError, MathMLParser.get_dtd, "html")
+
+    def test_mathmlparser_parse_cached_dtd(self):
+        for mml in ["mathml1", "mathml2", "mathml3"]:
+            xml = (
+                '<math xmlns="http://www.w3.org/1998/Math/MathML">'
+                "<mo>&sum;</mo><mi>x</mi></math>"
+            )
+            if mml == "mathml1":
+                xml = xml.replace(
+                    ' xmlns="http://www.w3.org/1998/Math/MathML"', ""
+                )
+            self.assertEqual(
+                lxml.etree.tostring(
+                    MathMLParser.parse(xml, dtd=mml).getroottree()
+                ),
+                lxml.etree.tostring(
+                    MathMLParser.parse(
+                        xml, dtd=mml, cached_dtd=True
+                    ).getroottree()
+                ),
+            )
+
+    def test_mathmlparser_parse_cached_dtd_invalid(self):
+        self.assertRaises(
+            lxml.etree.DocumentInvalid,
+            MathMLParser.parse,
+            '<math xmlns="http://www.w3.org/1998/Math/MathML"><foo/></math>',
+            cached_dtd=True,
+        )
+        self.assertRaises(
+            lxml.etree.DocumentInvalid,
+            MathMLParser.parse,
+            '<math xmlns="http://www.w3.org/1998/Math/MathML">'
+            "<mo>&foo;</mo></math>",
+            cached_dtd=True,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+
+from lark import Tree
+
+from py_asciimath.transformer.transformer import (
+    ASCIIMath2MathMLTreeTransformer,
+    ASCIIMath2TexTransformer,
+)
+from py_asciimath.translator.translator import (
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+    Tex2ASCIIMath,
+)
+
+# Nesting depth and number of tokens of the stress tests
+DEPTH = 10000
+TOKENS = 100000
+
+
+class TestMathTransformer(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_transform_flatten_1(self):
+        # exp(a, exp(b, exp(c))): `exp` is called once with all the items
+        calls = []
+
+        class Transformer(ASCIIMath2TexTransformer):
+            def exp(self, items):
+                calls.append(len(items))
+                return super(Transformer, self).exp(items)
+
+        transformer = Transformer(log=False)
+        tree = Tree("exp", [])
+        for c in "cba":
+            child = Tree("exp_interm", [Tree("const", [c])])
+            tree = Tree("exp", [child] + ([tree] if tree.children else []))
+        self.assertEqual(str(transformer.transform(tree)), "a b c")
+        self.assertEqual(calls, [3])
+
+    def test_transform_flatten_2(self):
+        transformer = ASCIIMath2MathMLTreeTransformer(log=False)
+        items = [
+            [transformer._element("mi", [c])] for c in ("a", "b", "c", "d")
+        ]
+        nodes = transformer.exp([items[2], items[3]])
+        nodes = transformer.exp([items[0], items[1], nodes])
+        self.assertEqual([node.text for node in nodes], ["a", "b", "c", "d"])
+
+    def test_transform_nesting_tex_1(self):
+        exps = [
+            (
+                "(" * DEPTH + "a" + ")" * DEPTH,
+                "$" + "\\left(" * DEPTH + "a" + "\\right)" * DEPTH + "$",
+            ),
+            (
+                "sqrt " * DEPTH + "a",
+                "$" + "\\sqrt{" * DEPTH + "a" + "}" * DEPTH + "$",
+            ),
+        ]
+        for translator in [
+            ASCIIMath2Tex(inplace=False),
+            ASCIIMath2Tex(engine="fast", inplace=False),
+        ]:
+            for exp, translation in exps:
+                self.assertEqual(translator.translate(exp), translation)
+
+    def test_transform_nesting_mathml_1(self):
+        translator = ASCIIMath2MathML(inplace=False)
+        self.assertEqual(
+            translator.translate("sqrt " * DEPTH + "a", xml_pprint=False),
+            '<math xmlns="http://www.w3.org/1998/Math/MathML">'
+            + "<mrow><msqrt><mrow>" * DEPTH
+            + "<mi>a</mi>"
+            + "</mrow></msqrt></mrow>" * DEPTH
+            + "</math>",
+        )
+
+    def test_transform_nesting_tex2asciimath_1(self):
+        translator = Tex2ASCIIMath(inplace=False)
+        self.assertEqual(
+            translator.translate("\\sqrt{" * DEPTH + "a" + "}" * DEPTH),
+            "sqrt(" * DEPTH + "a" + ")" * DEPTH,
+        )
+
+    def test_transform_long_1(self):
+        exp = " + ".join(["a"] * (TOKENS // 2))
+        translator = ASCIIMath2Tex(engine="fast", inplace=False)
+        self.assertEqual(translator.translate(exp), "$" + exp + "$")
+        translator = ASCIIMath2MathML(engine="fast", tree=True)
+        self.assertEqual(
+            translator.translate(exp, xml_pprint=False).count("<mi>a</mi>"),
+            TOKENS // 2,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from py_asciimath.grammar.asciimath_grammar import asciimath_grammar
+from py_asciimath.grammar.cache import (
+    BUNDLED_TABLES_DIR,
+    get_cache_key,
+    get_parser,
+)
+from py_asciimath.grammar.latex_grammar import latex_grammar
+from py_asciimath.transformer.transformer import ASCIIMath2TexTransformer
+from py_asciimath.translator.translator import ASCIIMath2Tex
+
+
+class TestParserCache(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_parser_cache_key_1(self):
+        self.assertEqual(
+            get_cache_key(
+                asciimath_grammar, parser="lalr", lexer="contextual"
+            ),
+            get_cache_key(
+                asciimath_grammar, lexer="contextual", parser="lalr"
+            ),
+        )
+        self.assertNotEqual(
+            get_cache_key(
+                asciimath_grammar, parser="lalr", lexer="contextual"
+            ),
+            get_cache_key(asciimath_grammar, parser="lalr", lexer="standard"),
+        )
+        self.assertNotEqual(
+            get_cache_key(
+                asciimath_grammar, parser="lalr", lexer="contextual"
+            ),
+            get_cache_key(latex_grammar, parser="lalr", lexer="contextual"),
+        )
+
+    def test_parser_cache_key_2(self):
+        self.assertIsNone(
+            get_cache_key(asciimath_grammar, parser="earley", lexer="dynamic")
+        )
+        self.assertIsNone(
+            get_cache_key(
+                asciimath_grammar,
+                parser="lalr",
+                lexer="contextual",
+                postlex=object(),
+            )
+        )
+
+    def test_parser_cache_bundled_tables(self):
+        for grammar in [asciimath_grammar, latex_grammar]:
+            key = get_cache_key(grammar, parser="lalr", lexer="contextual")
+            self.assertTrue(
+                os.path.exists(os.path.join(BUNDLED_TABLES_DIR, key + ".lark"))
+            )
+
+    def test_parser_cache_save_load(self):
+        key = get_cache_key(asciimath_grammar, parser="lalr", lexer="standard")
+        path = os.path.join(self.cache_dir, key + ".lark")
+        transformer = ASCIIMath2TexTransformer(log=False)
+        compiled = get_parser(
+            asciimath_grammar,
+            cache_dir=self.cache_dir,
+            parser="lalr",
+            lexer="standard",
+            transformer=transformer,
+        )
+        self.assertTrue(os.path.exists(path))
+        loaded = get_parser(
+            asciimath_grammar,
+            cache_dir=self.cache_dir,
+            parser="lalr",
+            lexer="standard",
+            transformer=transformer,
+        )
+        exp = "sum_(i=1)^n i^3=((n(n+1))/2)^2"
+        self.assertEqual(str(compiled.parse(exp)), str(loaded.parse(exp)))
+
+    def test_parser_cache_corrupted(self):
+        key = get_cache_key(asciimath_grammar, parser="lalr", lexer="standard")
+        path = os.path.join(self.cache_dir, key + ".lark")
+        with open(path, "wb") as f:
+            f.write(b"not a table")
+        s = ASCIIMath2Tex(
+            cache_dir=self.cache_dir, lexer="standard"
+        ).translate("x^2")
+        self.assertEqual(s, "${x}^{2}$")
+        self.assertNotEqual(open(path, "rb").read(), b"not a table")
+
+    def test_parser_cache_disabled(self):
+        s = ASCIIMath2Tex(cache_dir=False).translate("x^2")
+        self.assertEqual(s, "${x}^{2}$")
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
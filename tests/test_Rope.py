@@ -0,0 +1,30 @@
+import unittest
+
+from py_asciimath.utils.rope import Rope, to_string
+
+
+class TestRope(unittest.TestCase):
+    def test_rope_str(self):
+        a = Rope("<mi>", "x", "</mi>")
+        rope = Rope("<mrow>", a, Rope.join(", ", [a, "y", a]), "</mrow>")
+        s = "<mrow><mi>x</mi><mi>x</mi>, y, <mi>x</mi></mrow>"
+        self.assertEqual(str(rope), s)
+        self.assertEqual(len(rope), len(s))
+        self.assertEqual(rope.head, s[: Rope.head_size])
+        self.assertTrue(rope.startswith("<mrow><mi>x"))
+        self.assertTrue(rope.startswith(s))
+        self.assertFalse(rope.startswith("<mi>"))
+        self.assertEqual(str(Rope.join(" ", [])), "")
+        self.assertEqual(to_string(rope), s)
+        self.assertEqual(to_string("x"), "x")
+
+    def test_rope_deep(self):
+        rope = Rope("x")
+        for _ in range(100000):
+            rope = Rope("(", rope, ")")
+        self.assertEqual(str(rope), "(" * 100000 + "x" + ")" * 100000)
+        self.assertEqual(rope.head, "(" * Rope.head_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from py_asciimath import asciimath, latex
+from py_asciimath.grammar.asciimath_grammar import asciimath_grammar
+from py_asciimath.grammar.latex_grammar import latex_grammar
+from py_asciimath.translation import (
+    asciimath2latex,
+    asciimath2mathml,
+    latex2asciimath,
+    tables,
+)
+from py_asciimath.translation.build import (
+    TABLES_PATH,
+    format_tables,
+    get_tables,
+)
+
+
+class TestSymbolTables(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_tables_up_to_date(self):
+        with open(TABLES_PATH) as f:
+            self.assertEqual(
+                f.read(),
+                format_tables(get_tables()),
+                "Run `python -m py_asciimath.translation.build`",
+            )
+
+    def test_tables_1(self):
+        computed = get_tables()
+        for name, value in computed.items():
+            self.assertEqual(getattr(tables, name), value)
+            if isinstance(value, dict):
+                for table, symbols in value.items():
+                    self.assertEqual(
+                        list(getattr(tables, name)[table]), list(symbols)
+                    )
+        self.assertEqual(asciimath_grammar, computed["asciimath_grammar"])
+        self.assertEqual(latex_grammar, computed["latex_grammar"])
+
+    def test_tables_2(self):
+        for module, translation, lang_to in [
+            (asciimath, asciimath2latex, "latex"),
+            (asciimath, asciimath2mathml, "mathml"),
+            (latex, latex2asciimath, "asciimath"),
+        ]:
+            for group in [
+                "unary_functions",
+                "binary_functions",
+                "left_parenthesis",
+                "right_parenthesis",
+            ]:
+                self.assertEqual(
+                    getattr(translation, group),
+                    module.get_symbols_for(group, lang_to),
+                )
+            smb = list(translation.smb)
+            self.assertEqual(
+                smb, sorted(smb, key=lambda s: (-len(s), s)), translation
+            )
+            for group in ["misc_symbols", "greek_letters", "arrows"]:
+                self.assertTrue(
+                    set(getattr(module, group)).issubset(translation.smb)
+                )
+        self.assertEqual(asciimath2latex.smb["alpha"], "\\alpha")
+        self.assertEqual(latex2asciimath.smb["\\alpha"], "alpha")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,6 +29,18 @@ class TestTex2ASCIIMath(unittest.TestCase):
             "((1 , 2)) int sin frac((x)^(2))(4) pi text(d x) root(5)((x)_(1)^(2) + (x)_(2)^(2))",
         )
 
+
+    def test_tex2asciimath_parenthesis_1(self):
+        parser = Tex2ASCIIMath(log=False)
+        self.assertEqual(
+            parser.translate(r"{\left(a\right) , \left(b\right)}_{x}"),
+            "((a) , (b))_(x)",
+        )
+        self.assertEqual(
+            parser.translate(r"{\left(a\right)}_{\left[x\right]}"),
+            "(a)_(x)",
+        )
+
     # def test_tex2asciimath_ok_3(self):
     #     s = Tex2ASCIIMath(
     #         inplace=True, parser="lalr", lexer="contextual",
@@ -0,0 +1,84 @@
+import pickle
+import time
+import unittest
+
+from py_asciimath.translator.translator import (
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+    Tex2ASCIIMath,
+)
+from py_asciimath.utils.trace import Trace, Tracer
+
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.traces = []
+        self.tracer = Tracer(sink=self.traces.append)
+
+    def test_trace_exclusive_stages(self):
+        trace = Trace("T")
+        with trace.stage("parse"):
+            time.sleep(0.02)
+            with trace.stage("validation"):
+                time.sleep(0.02)
+            trace.rule("exp", 0.01)
+        self.assertEqual(
+            list(trace.stages), ["validation", "transform", "parse"]
+        )
+        self.assertGreaterEqual(trace.stages["validation"], 0.02)
+        self.assertAlmostEqual(trace.stages["transform"], 0.01)
+        self.assertLess(trace.stages["parse"], 0.04)
+        self.assertEqual(trace.rules["exp"], 1)
+
+    def test_tracer_asciimath2tex(self):
+        for inplace in (True, False):
+            ASCIIMath2Tex(tracer=self.tracer, inplace=inplace).translate(
+                "x/y + x/z"
+            )
+        self.assertEqual(len(self.traces), 2)
+        for trace in self.traces:
+            self.assertEqual(trace.translator, "ASCIIMath2Tex")
+            self.assertEqual(set(trace.stages), {"parse", "transform"})
+            self.assertEqual(trace.rules["exp_frac"], 2)
+            self.assertIsNone(trace.error)
+            self.assertGreaterEqual(trace.duration, sum(trace.stages.values()))
+
+    def test_tracer_asciimath2mathml(self):
+        ASCIIMath2MathML(tracer=self.tracer).translate("x/y")
+        self.assertEqual(
+            list(self.traces[0].stages),
+            ["transform", "parse", "validation", "serialization"],
+        )
+
+    def test_tracer_error(self):
+        translator = Tex2ASCIIMath(tracer=self.tracer)
+        self.assertRaises(Exception, translator.translate, r"\frac{x}")
+        self.assertIsNotNone(self.traces[0].error)
+
+    def test_tracer_translate_many(self):
+        translator = Tex2ASCIIMath(tracer=self.tracer)
+        list(translator.translate_many([r"\frac{x}{y}", r"\frac{x}"]))
+        self.assertEqual(len(self.traces), 2)
+        self.assertIsNone(self.traces[0].error)
+        self.assertIsNotNone(self.traces[1].error)
+
+    def test_tracer_sampling(self):
+        tracer = Tracer(sink=self.traces.append, sample_rate=0.0)
+        translator = ASCIIMath2Tex(tracer=tracer)
+        self.assertEqual(translator.translate("x/y"), r"$\frac{x}{y}$")
+        self.assertEqual(self.traces, [])
+
+    def test_tracer_sink_error(self):
+        def sink(trace):
+            raise ValueError()
+
+        translator = ASCIIMath2Tex(tracer=Tracer(sink=sink))
+        self.assertEqual(translator.translate("x/y"), r"$\frac{x}{y}$")
+
+    def test_tracer_pickle(self):
+        tracer = pickle.loads(pickle.dumps(self.tracer))
+        self.assertEqual(tracer.sample_rate, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import pickle
+import unittest
+
+import lxml.etree
+
+from py_asciimath.translator.cache import TranslationCache
+from py_asciimath.translator.translator import (
+    ASCIIMath2AST,
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+    Tex2ASCIIMath,
+)
+
+
+class TestTranslationCache(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_translation_cache_lru(self):
+        cache = TranslationCache()
+        cache.put(("k", "a"), "1")
+        cache.put(("k", "b"), "2")
+        self.assertEqual(cache.get(("k", "a")), "1")
+        self.assertIsNone(cache.get(("k", "c")))
+        cache.maxsize = cache.cache_info().currsize
+        cache.put(("k", "c"), "3")
+        self.assertIsNone(cache.get(("k", "b")))
+        self.assertEqual(cache.get(("k", "a")), "1")
+        self.assertEqual(cache.get(("k", "c")), "3")
+        info = cache.cache_info()
+        self.assertEqual(info.hits, 3)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.evictions, 1)
+        self.assertLessEqual(info.currsize, info.maxsize)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.cache_info(), (0, 0, 0, 0, cache.maxsize))
+
+    def test_translation_cache_too_big(self):
+        cache = TranslationCache(maxsize=100)
+        cache.put(("k", "a"), "x" * 100)
+        self.assertEqual(len(cache), 0)
+
+    def test_translation_cache_sizeof(self):
+        exp = " + ".join(["a"] * 300)
+        ast = ASCIIMath2AST().translate(exp)
+        translation = ASCIIMath2Tex().translate(exp)
+        for value, size in [
+            (ast, len(pickle.dumps(ast))),
+            ({"ast": ast, "latex": translation}, len(translation)),
+        ]:
+            cache = TranslationCache()
+            cache.put(("k", "a"), value)
+            self.assertGreater(cache.cache_info().currsize, size)
+        cache = TranslationCache(maxsize=len(pickle.dumps(ast)))
+        cache.put(("k", "a"), ast)
+        self.assertEqual(len(cache), 0)
+
+    def test_translation_cache_translator_1(self):
+        cache = TranslationCache()
+        translator = ASCIIMath2Tex(cache=cache)
+        self.assertEqual(translator.translate("x^2"), "${x}^{2}$")
+        self.assertEqual(translator.translate("x^2"), "${x}^{2}$")
+        self.assertEqual(
+            translator.translate("x^2", displaystyle=True), "\\[{x}^{2}\\]"
+        )
+        self.assertEqual(cache.cache_info()[:2], (1, 2))
+        # The cache is shared with other translators
+        self.assertEqual(
+            ASCIIMath2Tex(cache=cache).translate("x^2"), "${x}^{2}$"
+        )
+        self.assertEqual(
+            Tex2ASCIIMath(cache=cache).translate("x^2"), "(x)^(2)"
+        )
+        self.assertEqual(cache.cache_info()[:2], (2, 3))
+
+    def test_translation_cache_translator_2(self):
+        cache = TranslationCache()
+        translator = ASCIIMath2MathML(cache=cache)
+        exps = ["a/b", "x^2", "a/b"]
+        self.assertEqual(
+            list(translator.translate_many(exps, xml_pprint=False)),
+            [translator.translate(exp, xml_pprint=False) for exp in exps],
+        )
+        self.assertEqual(cache.cache_info()[:2], (4, 2))
+
+    def test_translation_cache_translator_3(self):
+        # Translators with different constructor arguments share the cache
+        # only where their translations are the same
+        cache = TranslationCache()
+        exp = '"a<b" + x'
+        translators = [
+            ASCIIMath2MathML(tree=True, cache=cache),
+            ASCIIMath2MathML(cache=cache),
+        ]
+        translations = [
+            ASCIIMath2MathML(tree=True).translate(exp, xml_pprint=False),
+            ASCIIMath2MathML().translate(exp, xml_pprint=False),
+        ]
+        self.assertNotEqual(translations[0], translations[1])
+        self.assertIn("<mtext>a&lt;b</mtext>", translations[0])
+        for _ in range(2):
+            for translator, translation in zip(translators, translations):
+                self.assertEqual(
+                    translator.translate(exp, xml_pprint=False), translation
+                )
+        self.assertEqual(cache.cache_info()[:2], (2, 2))
+
+    def test_translation_cache_etree(self):
+        cache = TranslationCache()
+        translator = ASCIIMath2MathML(cache=cache)
+        s = translator.translate("x", dtd="mathml2", output="etree")
+        s.append(lxml.etree.Element("mi"))
+        s = translator.translate("x", dtd="mathml2", output="etree")
+        self.assertEqual(len(s), 1)
+        self.assertEqual(cache.cache_info()[:2], (1, 1))
+        self.assertEqual(
+            lxml.etree.tostring(s.getroottree()).decode(),
+            translator.translate(
+                "x", dtd="mathml2", dtd_validation=True, xml_pprint=False
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
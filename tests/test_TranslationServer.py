@@ -0,0 +1,241 @@
+import http.client
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+
+from py_asciimath.translator.server import (
+    RemoteTranslator,
+    TranslationServer,
+    parse_address,
+)
+from py_asciimath.translator.translator import (
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+    MathML2Tex,
+    Tex2ASCIIMath,
+)
+
+
+class TestTranslationServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = TranslationServer(
+            ("127.0.0.1", 0), max_concurrency=1, queue_timeout=0.1
+        )
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.close()
+        cls.thread.join()
+
+    def test_server_translate_1(self):
+        for translator, exp, kwargs in [
+            (ASCIIMath2Tex(), "sum_(i=1)^n i", {"displaystyle": True}),
+            (ASCIIMath2MathML(), "[[a,b],[c,d]]", {"dtd": "mathml2"}),
+            (Tex2ASCIIMath(), "\\frac{1}{2}", {}),
+            (MathML2Tex(), "<math><mi>x</mi></math>", {}),
+        ]:
+            ilang, olang = {
+                ASCIIMath2Tex: ("asciimath", "latex"),
+                ASCIIMath2MathML: ("asciimath", "mathml"),
+                Tex2ASCIIMath: ("latex", "asciimath"),
+                MathML2Tex: ("mathml", "latex"),
+            }[translator.__class__]
+            remote = RemoteTranslator(self.server.address, ilang, olang)
+            self.assertEqual(
+                remote.translate(exp, **kwargs),
+                translator.translate(exp, **kwargs),
+            )
+            remote.close()
+
+    def test_server_translate_many_1(self):
+        remote = RemoteTranslator(self.server.address, "asciimath", "latex")
+        translations = list(
+            remote.translate_many(["x^2", "(((", "alpha"] * 3, chunksize=2)
+        )
+        self.assertEqual(translations[::3], ["${x}^{2}$"] * 3)
+        self.assertEqual(translations[2::3], ["$\\alpha$"] * 3)
+        for e in translations[1::3]:
+            self.assertIsInstance(e, Exception)
+            self.assertTrue(str(e).startswith("UnexpectedToken: "))
+        self.assertRaises(
+            Exception, list, remote.translate_many(["((("], raise_errors=True)
+        )
+        self.assertRaisesRegex(
+            Exception,
+            "Unsupported option",
+            remote.translate,
+            "x",
+            output="etree",
+        )
+        remote = RemoteTranslator(self.server.address, "latex", "mathml")
+        self.assertRaisesRegex(
+            Exception, "not supported", remote.translate, "x"
+        )
+
+    def test_server_translate_many_2(self):
+        remote = RemoteTranslator(self.server.address, "asciimath", "latex")
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "exp.txt")
+            with open(path, "w") as f:
+                f.write("x^2")
+            missing = os.path.join(tmp, "missing.txt")
+            exps = [path, missing, path]
+            translations = list(
+                remote.translate_many(exps, from_file=True, chunksize=2)
+            )
+            self.assertEqual(translations[::2], ["${x}^{2}$"] * 2)
+            self.assertIsInstance(translations[1], FileNotFoundError)
+            translations = remote.translate_many(
+                exps, from_file=True, raise_errors=True
+            )
+            self.assertEqual(next(translations), "${x}^{2}$")
+            self.assertRaises(FileNotFoundError, next, translations)
+            self.assertIsInstance(
+                next(remote.translate_many([missing], from_file=True)),
+                FileNotFoundError,
+            )
+        finally:
+            shutil.rmtree(tmp)
+        remote.close()
+
+    def test_server_options_1(self):
+        remote = RemoteTranslator(self.server.address, "asciimath", "mathml")
+        # Options of `_prepare` and `_translate` that are not options of
+        # `translate` are rejected
+        for options in [{"xml_parser": "x"}, {"pprint": True}]:
+            self.assertEqual(
+                remote.request(
+                    {
+                        "exp": "x",
+                        "from": "asciimath",
+                        "to": "mathml",
+                        "options": options,
+                    }
+                )[0],
+                400,
+            )
+        self.assertEqual(
+            remote.translate("x", pprint=False, xml_pprint=False),
+            ASCIIMath2MathML().translate("x", xml_pprint=False),
+        )
+        remote.close()
+
+    def test_server_options_2(self):
+        remote = RemoteTranslator(self.server.address, "asciimath", "latex")
+        request = {"exp": "x", "from": "asciimath", "to": "latex"}
+
+        def prepare(self, **kwargs):
+            raise TypeError("Unexpected option")
+
+        # Options that can not be prepared fail their own requests only,
+        # with an answer
+        _prepare = ASCIIMath2Tex._prepare
+        ASCIIMath2Tex._prepare = prepare
+        try:
+            self.assertEqual(
+                remote.request(request),
+                (422, {"error": "TypeError: Unexpected option"}),
+            )
+            status, responses = remote.request(
+                [request, dict(request, to="mathml")]
+            )
+        finally:
+            ASCIIMath2Tex._prepare = _prepare
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            responses[0], {"error": "TypeError: Unexpected option"}
+        )
+        self.assertIn("translation", responses[1])
+        remote.close()
+
+    def test_server_http_1(self):
+        host, port = self.server.address
+        connection = http.client.HTTPConnection(host, port)
+        for body, status in [
+            (b"{", 400),
+            (b'{"exp": "x", "from": "asciimath", "to": "latex"}', 200),
+            (b'{"exp": "(((", "from": "asciimath", "to": "latex"}', 422),
+            (b'[{"exp": "x", "from": "asciimath", "to": "latex"}, 1]', 200),
+            (b'"x"', 400),
+        ]:
+            connection.request("POST", "/translate", body)
+            response = connection.getresponse()
+            response.read()
+            self.assertEqual(response.status, status)
+        connection.request("GET", "/health")
+        self.assertEqual(connection.getresponse().status, 200)
+        connection.close()
+
+    def test_server_limits_1(self):
+        remote = RemoteTranslator(self.server.address, "asciimath", "latex")
+        # Every translation slot is taken
+        self.server._slots.acquire()
+        try:
+            self.assertEqual(
+                remote.request(
+                    {"exp": "x", "from": "asciimath", "to": "latex"}
+                ),
+                (503, {"error": "Server busy"}),
+            )
+            # A busy server fails every expression of the chunk, without
+            # aborting the batch
+            translations = list(
+                remote.translate_many(["x", "y", "z"], chunksize=2)
+            )
+            self.assertEqual(len(translations), 3)
+            for e in translations:
+                self.assertIsInstance(e, Exception)
+                self.assertEqual(str(e), "Server busy")
+            self.assertRaisesRegex(
+                Exception,
+                "Server busy",
+                list,
+                remote.translate_many(["x"], raise_errors=True),
+            )
+        finally:
+            self.server._slots.release()
+        max_request_size = self.server.max_request_size
+        self.server.max_request_size = 16
+        try:
+            self.assertEqual(remote.request(["x" * 16])[0], 413)
+        finally:
+            self.server.max_request_size = max_request_size
+        self.assertEqual(remote.translate("x"), "$x$")
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets only")
+    def test_server_unix_1(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "server.sock")
+            server = TranslationServer(path, warm=False)
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            remote = RemoteTranslator(
+                parse_address("unix:" + path), "asciimath", "latex"
+            )
+            self.assertEqual(remote.translate("x^2"), "${x}^{2}$")
+            remote.close()
+            server.shutdown()
+            server.close()
+            thread.join()
+            self.assertFalse(os.path.exists(path))
+        finally:
+            shutil.rmtree(tmp)
+
+    def test_parse_address_1(self):
+        self.assertEqual(parse_address("8765"), ("127.0.0.1", 8765))
+        self.assertEqual(parse_address("localhost:80"), ("localhost", 80))
+        self.assertEqual(parse_address("unix:/tmp/s"), "/tmp/s")
+        self.assertRaises(ValueError, parse_address, "localhost")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,297 @@
+import asyncio
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from lark.exceptions import UnexpectedInput
+
+from py_asciimath.translator.translator import (
+    ASCIIMath2MathML,
+    ASCIIMath2Tex,
+    MathML2Tex,
+    Tex2ASCIIMath,
+    clear_translators,
+    get_translator,
+)
+
+
+class TestTranslator(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        clear_translators()
+
+    def run_async(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def test_get_translator_1(self):
+        self.assertIsInstance(
+            get_translator("asciimath", "latex"), ASCIIMath2Tex
+        )
+        self.assertIsInstance(
+            get_translator("asciimath", "mathml"), ASCIIMath2MathML
+        )
+        self.assertIsInstance(
+            get_translator("latex", "asciimath"), Tex2ASCIIMath
+        )
+        self.assertIsInstance(get_translator("mathml", "latex"), MathML2Tex)
+
+    def test_get_translator_2(self):
+        self.assertIs(
+            get_translator("asciimath", "latex", log=False, inplace=True),
+            get_translator("ASCIIMath", "LaTeX", inplace=True, log=False),
+        )
+        self.assertIsNot(
+            get_translator("asciimath", "latex", inplace=True),
+            get_translator("asciimath", "latex", inplace=False),
+        )
+
+    def test_get_translator_3(self):
+        self.assertRaises(
+            NotImplementedError, get_translator, "latex", "mathml"
+        )
+
+    def test_get_translator_concurrent(self):
+        exps = ["x^{}".format(i) for i in range(100)]
+        for inplace in [True, False]:
+            translator = get_translator("asciimath", "latex", inplace=inplace)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                translated = list(executor.map(translator.translate, exps))
+            self.assertEqual(
+                translated,
+                ["${x}^{" + str(i) + "}$" for i in range(100)],
+            )
+
+    def test_translate_many_1(self):
+        translator = get_translator("asciimath", "latex")
+        exps = ["x^2", "sum_(i=1)^n i", "(a+b"]
+        translated = list(translator.translate_many(exps, displaystyle=True))
+        self.assertEqual(
+            translated[:2],
+            [r"\[{x}^{2}\]", r"\[{\sum}_{i = 1}^{n} i\]"],
+        )
+        self.assertIsInstance(translated[2], UnexpectedInput)
+
+    def test_translate_many_2(self):
+        translator = get_translator("asciimath", "latex")
+        self.assertRaises(
+            UnexpectedInput,
+            list,
+            translator.translate_many(["x^2", "(a+b", "y"], raise_errors=True),
+        )
+
+    def test_translate_many_3(self):
+        translator = get_translator("asciimath", "mathml")
+        exps = ["x^2", "a/b", "1"]
+        self.assertEqual(
+            list(
+                translator.translate_many(
+                    exps, dtd="mathml2", dtd_validation=True, xml_pprint=False
+                )
+            ),
+            [
+                translator.translate(
+                    exp, dtd="mathml2", dtd_validation=True, xml_pprint=False
+                )
+                for exp in exps
+            ],
+        )
+
+    def test_translate_many_from_file(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            paths = []
+            for i, exp in enumerate(["\\frac{a}{b}", "x^{2}"]):
+                paths.append(os.path.join(tmp_dir, str(i) + ".tex"))
+                with open(paths[-1], "w") as f:
+                    f.write(exp)
+            paths.append(os.path.join(tmp_dir, "missing.tex"))
+            translated = list(
+                get_translator("latex", "asciimath").translate_many(
+                    paths, from_file=True
+                )
+            )
+            self.assertEqual(translated[:2], ["frac(a)(b)", "(x)^(2)"])
+            self.assertIsInstance(translated[2], FileNotFoundError)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_translator_pickle(self):
+        translator = ASCIIMath2Tex(log=False, inplace=False)
+        unpickled = pickle.loads(pickle.dumps(translator))
+        self.assertIsInstance(unpickled, ASCIIMath2Tex)
+        self.assertFalse(unpickled.inplace)
+        self.assertEqual(unpickled.translate("x^2"), "${x}^{2}$")
+
+    def test_translate_many_workers_1(self):
+        translator = get_translator("asciimath", "latex")
+        exps = ["x^{}".format(i) for i in range(50)] + ["(a+b"]
+        translated = list(
+            translator.translate_many(exps, workers=2, chunksize=8)
+        )
+        self.assertEqual(
+            translated[:-1],
+            ["${x}^{" + str(i) + "}$" for i in range(50)],
+        )
+        self.assertIsInstance(translated[-1], Exception)
+
+    def test_translate_many_workers_2(self):
+        translator = get_translator("asciimath", "mathml")
+        exps = ["x^{}".format(i) for i in range(20)]
+        translated = translator.translate_many(
+            exps, workers=2, chunksize=3, ordered=False, xml_pprint=False
+        )
+        self.assertEqual(
+            sorted(translated),
+            [
+                (i, translator.translate(exp, xml_pprint=False))
+                for i, exp in enumerate(exps)
+            ],
+        )
+
+    def test_translate_many_workers_3(self):
+        translator = get_translator("asciimath", "latex")
+        self.assertRaises(
+            Exception,
+            list,
+            translator.translate_many(
+                ["x", "(a+b", "y"], workers=2, raise_errors=True
+            ),
+        )
+        self.assertRaises(
+            NotImplementedError,
+            get_translator("asciimath", "mathml").translate_many,
+            ["x"],
+            workers=2,
+            output="etree",
+        )
+
+    def test_atranslate_1(self):
+        translator = get_translator("asciimath", "latex")
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, "exp.txt")
+            with open(path, "w") as f:
+                f.write("x^2")
+            self.assertEqual(
+                self.run_async(
+                    translator.atranslate(
+                        path, from_file=True, to_file=path + ".out"
+                    )
+                ),
+                "${x}^{2}$",
+            )
+            with open(path + ".out") as f:
+                self.assertEqual(f.read(), "${x}^{2}$")
+        finally:
+            shutil.rmtree(tmp_dir)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(
+                self.run_async(
+                    translator.atranslate(
+                        "x^2", executor=executor, displaystyle=True
+                    )
+                ),
+                translator.translate("x^2", displaystyle=True),
+            )
+
+    def test_atranslate_2(self):
+        translator = get_translator("asciimath", "mathml")
+        semaphore = []
+
+        async def cancel():
+            semaphore.append(asyncio.Semaphore(1))
+            task = asyncio.ensure_future(
+                translator.atranslate(
+                    "x", semaphore=semaphore[0], dtd_validation=True
+                )
+            )
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # The slot is released once the running translation is over
+            async with semaphore[0]:
+                pass
+
+        self.run_async(cancel())
+        self.assertFalse(semaphore[0].locked())
+        self.assertRaises(
+            asyncio.TimeoutError,
+            self.run_async,
+            translator.atranslate("x", timeout=1e-6, dtd_validation=True),
+        )
+
+    def test_atranslate_many_1(self):
+        translator = get_translator("asciimath", "latex")
+        exps = ["x^{}".format(i) for i in range(20)] + ["(a+b"]
+        translated = self.run_async(
+            translator.atranslate_many(exps, max_concurrency=3)
+        )
+        self.assertEqual(
+            translated[:-1], ["${x}^{" + str(i) + "}$" for i in range(20)]
+        )
+        self.assertIsInstance(translated[-1], UnexpectedInput)
+        self.assertRaises(
+            UnexpectedInput,
+            self.run_async,
+            translator.atranslate_many(
+                ["x", "(a+b", "y"] * 10, raise_errors=True, max_concurrency=2
+            ),
+        )
+        self.assertRaises(
+            ValueError,
+            self.run_async,
+            translator.atranslate_many(["x"], max_concurrency=0),
+        )
+
+    def test_atranslate_many_workers_1(self):
+        translator = get_translator("asciimath", "latex")
+        exps = ["x^{}".format(i) for i in range(10)] + ["(a+b"]
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            translated = self.run_async(
+                translator.atranslate_many(exps, executor=executor)
+            )
+            self.assertRaises(
+                NotImplementedError,
+                self.run_async,
+                get_translator("asciimath", "mathml").atranslate(
+                    "x", executor=executor, output="etree"
+                ),
+            )
+        self.assertEqual(
+            translated[:-1], ["${x}^{" + str(i) + "}$" for i in range(10)]
+        )
+        self.assertIsInstance(translated[-1], Exception)
+
+    def test_lazy_imports(self):
+        code = (
+            "import sys\n"
+            "import py_asciimath.py_asciimath\n"
+            "from py_asciimath.translator.translator import ASCIIMath2Tex\n"
+            "loaded = lambda: [m for m in ('lark', 'lxml.etree', 'asyncio') "
+            "if m in sys.modules]\n"
+            "print(loaded())\n"
+            "ASCIIMath2Tex()\n"
+            "print(loaded())\n"
+        )
+        out = subprocess.check_output(
+            [sys.executable, "-c", code],
+            cwd=os.path.join(os.path.dirname(__file__), ".."),
+            universal_newlines=True,
+        )
+        self.assertEqual(out.split("\n")[:2], ["[]", "['lark']"])
+
+
+if __name__ == "__main__":
+    unittest.main()
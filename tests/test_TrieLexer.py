@@ -0,0 +1,129 @@
+import shutil
+import tempfile
+import unittest
+
+from lark.exceptions import UnexpectedCharacters, UnexpectedToken
+
+from py_asciimath.grammar.asciimath_grammar import asciimath_grammar
+from py_asciimath.grammar.cache import get_parser
+from py_asciimath.grammar.latex_grammar import latex_grammar
+from py_asciimath.grammar.lexer import LatexLexer, TrieLexer
+from py_asciimath.translator.translator import ASCIIMath2Tex, Tex2ASCIIMath
+
+
+class TestTrieLexer(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def assertSameTrees(self, grammar, exps, lexer=TrieLexer):
+        contextual = get_parser(grammar, lexer="contextual", parser="lalr")
+        trie = get_parser(grammar, lexer=lexer, parser="lalr")
+        for exp in exps:
+            self.assertEqual(trie.parse(exp), contextual.parse(exp), exp)
+
+    def test_trie_lexer_asciimath_1(self):
+        self.assertSameTrees(
+            asciimath_grammar,
+            [
+                "sum_(i=1)^n i^3=((n(n+1))/2)^2",
+                'dx/dy + d/dx sin x "text" d x',
+                "[[1,2],[3,4]] !in NN uu RR -> oo",
+                "lim_(x->+oo) (1+1/x)^x = e",
+                "sqrt 2 * root(3)(x) color(red)(ab) cancel(y)",
+                "a >-> b |->> c ~~ d -= e",
+            ],
+        )
+
+    def test_trie_lexer_latex_1(self):
+        self.assertSameTrees(
+            latex_grammar,
+            [
+                "\\frac{1}{2} + \\sqrt[3]{x} \\leq \\alpha",
+                "\\left(\\sum_{i=1}^{n} i\\right) \\neq \\infty",
+                "\\mathbb{R} \\cup \\emptyset \\rightarrow x^{2}",
+            ],
+        )
+
+    def test_latex_lexer_1(self):
+        self.assertSameTrees(
+            latex_grammar,
+            [
+                "\\frac{1}{2} + \\sqrt[3]{x} \\leq \\alpha",
+                "\\left(\\sum_{i=1}^{n} i\\right) \\neq \\infty",
+                "\\mathbb{R} \\cup \\emptyset \\rightarrow x^{2}",
+                "\\left. x \\right\\vert \\{ y \\}",
+                "\\begin{matrix} a & b \\\\ c & d \\end{matrix}",
+                "\\alphax + \\inta \\sinx",
+                "$$\\int_{0}^{1} f(x) dx$$",
+            ],
+            lexer=LatexLexer,
+        )
+
+    def test_latex_lexer_errors_1(self):
+        contextual = get_parser(
+            latex_grammar, lexer="contextual", parser="lalr"
+        )
+        latex = get_parser(latex_grammar, lexer=LatexLexer, parser="lalr")
+        for exp in ["\\foo", "\\alpha \\,", "\\left( x", "x^", "\\mathbb"]:
+            with self.assertRaises(Exception) as expected:
+                contextual.parse(exp)
+            with self.assertRaises(type(expected.exception)) as raised:
+                latex.parse(exp)
+            self.assertEqual(
+                str(raised.exception).splitlines()[0],
+                str(expected.exception).splitlines()[0],
+            )
+
+    def test_trie_lexer_errors_1(self):
+        contextual = get_parser(
+            asciimath_grammar, lexer="contextual", parser="lalr"
+        )
+        trie = get_parser(asciimath_grammar, lexer=TrieLexer, parser="lalr")
+        for exp in ["a >> ]", "a & b", "(a+b", "a )"]:
+            with self.assertRaises(Exception) as expected:
+                contextual.parse(exp)
+            with self.assertRaises(type(expected.exception)) as raised:
+                trie.parse(exp)
+            self.assertEqual(
+                str(raised.exception).splitlines()[0],
+                str(expected.exception).splitlines()[0],
+            )
+        with self.assertRaises(UnexpectedCharacters):
+            trie.parse("a & b")
+        with self.assertRaises(UnexpectedToken):
+            trie.parse("a )")
+
+    def test_trie_lexer_translator_1(self):
+        exp = "int_0^1 f(x) dx + [[a,b],[c,d]]"
+        self.assertEqual(
+            ASCIIMath2Tex(lexer="trie").translate(exp),
+            ASCIIMath2Tex().translate(exp),
+        )
+        exp = "\\int_{0}^{1} f(x) dx"
+        self.assertEqual(
+            Tex2ASCIIMath(lexer="trie").translate(exp),
+            Tex2ASCIIMath().translate(exp),
+        )
+
+    def test_trie_lexer_no_cache_1(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            for cache in (False, cache_dir, cache_dir):
+                parser = get_parser(
+                    asciimath_grammar,
+                    lexer=TrieLexer,
+                    parser="lalr",
+                    cache_dir=cache,
+                )
+                self.assertEqual(
+                    parser.parse("a+b").children,
+                    get_parser(asciimath_grammar, parser="lalr")
+                    .parse("a+b")
+                    .children,
+                )
+        finally:
+            shutil.rmtree(cache_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()